@@ -90,19 +90,26 @@ def build_profiles(
         Dict mapping (age, position_group, role) tuples to stat dicts.
     """
     grouped = df.groupby(["age", "position_group", "rebucketed_role"])
+    sizes = grouped.size()
+    keep = sizes.index[sizes >= min_sample]
 
-    profiles = {}
-    for (age, pos, role), group in grouped:
-        if len(group) < min_sample:
-            continue
-
-        entry = {"sample_size": len(group)}
+    # One cythonized groupby reduction per aggregate (rather than three
+    # Series reductions per stat per bucket), then kept buckets only
+    columns = grouped[STAT_COLUMNS]
+    means = columns.mean().loc[keep].to_numpy()
+    stddevs = columns.std(ddof=1).loc[keep].to_numpy()
+    variances = columns.var(ddof=1).loc[keep].to_numpy()
 
-        for stat in STAT_COLUMNS:
-            col = group[stat]
-            entry[f"avg_{stat}"] = round(float(col.mean()), 4)
-            entry[f"stddev_{stat}"] = round(float(col.std(ddof=1)), 4)
-            entry[f"variance_{stat}"] = round(float(col.var(ddof=1)), 4)
+    profiles = {}
+    for (age, pos, role), size, mean_row, stddev_row, variance_row in zip(
+        keep, sizes.loc[keep], means, stddevs, variances
+    ):
+        entry = {"sample_size": int(size)}
+
+        for stat, mean, stddev, variance in zip(STAT_COLUMNS, mean_row, stddev_row, variance_row):
+            entry[f"avg_{stat}"] = round(float(mean), 4)
+            entry[f"stddev_{stat}"] = round(float(stddev), 4)
+            entry[f"variance_{stat}"] = round(float(variance), 4)
 
         profiles[(int(age), pos, role)] = entry
 
@@ -4,14 +4,19 @@ Shared utilities for DBB2 data collection and generation scripts.
 Provides:
 - load_all_seasons(): Read all 30 CSVs into a single DataFrame
 - load_seasons_range(): Read CSVs for a specific year range
+- load_seasons_range_cached(): Same, backed by a Parquet cache
 - rebucket_role(): Re-classify role from raw minutes_played (spec thresholds)
 - POSITION_GROUPS: Mapping from CSV positions to simplified groups
 - TEAM_CITIES: Team abbreviation to city characteristics
 """
 
 import glob
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 import pandas as pd
@@ -23,6 +28,12 @@ import pandas as pd
 PROJECT_ROOT = Path(__file__).parent.parent
 RAW_DATA_DIR = PROJECT_ROOT / "raw_data"
 STATIC_DATA_DIR = PROJECT_ROOT / "static_data"
+CACHE_DIR = PROJECT_ROOT / "output" / ".cache"
+
+# Process umask, read once at import (os.umask can only be read by setting
+# it); atomic_write gives its files the mode open() would have
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
 # --------------------------------------------------------------------------
 # Position Mapping
@@ -42,6 +53,7 @@ POSITION_GROUPS = {
 }
 
 
+@lru_cache(maxsize=None)
 def normalize_position(position: str) -> Optional[str]:
     """Map CSV position to standardized group (G, F, C) or None."""
     if pd.isna(position):
@@ -273,6 +285,75 @@ def load_seasons_range(
     if data_dir is None:
         data_dir = str(RAW_DATA_DIR)
 
+    filtered = season_csv_files(start_year, end_year, data_dir)
+    frames = [load_season(f) for f in filtered]
+    combined = pd.concat(frames, ignore_index=True)
+    combined["position_group"] = combined["position"].apply(normalize_position)
+
+    return combined
+
+
+def load_seasons_range_cached(
+    start_year: int,
+    end_year: int,
+    data_dir: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Same as load_seasons_range(), backed by a Parquet cache.
+
+    The first call parses the CSVs and writes the combined DataFrame to
+    cache_dir (default: output/.cache/). Later calls read that single
+    Parquet file instead. The cache filename encodes the source CSV
+    names and mtimes, so editing or adding a season CSV invalidates it.
+
+    Falls back to plain CSV parsing if pyarrow is not installed.
+    """
+    if data_dir is None:
+        data_dir = str(RAW_DATA_DIR)
+    if cache_dir is None:
+        cache_dir = str(CACHE_DIR)
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return load_seasons_range(start_year, end_year, data_dir)
+
+    filtered = season_csv_files(start_year, end_year, data_dir)
+    filename = f"seasons_{start_year}_{end_year}_{files_digest(filtered)}.parquet"
+    cache_path = Path(cache_dir) / filename
+    if cache_path.exists():
+        return pd.read_parquet(cache_path, engine="pyarrow")
+
+    combined = load_seasons_range(start_year, end_year, data_dir)
+
+    # Best effort — a read-only checkout still gets the parsed DataFrame.
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in cache_path.parent.glob(f"seasons_{start_year}_{end_year}_*.parquet"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+        atomic_write(
+            cache_path,
+            lambda tmp_path: combined.to_parquet(
+                tmp_path, engine="pyarrow", compression="zstd", index=False
+            ),
+        )
+    except OSError:
+        pass
+
+    return combined
+
+
+def season_csv_files(
+    start_year: int,
+    end_year: int,
+    data_dir: Optional[str] = None,
+) -> list:
+    """Sorted season CSV paths with start year in [start_year, end_year]."""
+    if data_dir is None:
+        data_dir = str(RAW_DATA_DIR)
+
     csv_files = sorted(glob.glob(f"{data_dir}/games_*.csv"))
     filtered = [
         f for f in csv_files
@@ -283,18 +364,47 @@ def load_seasons_range(
         raise FileNotFoundError(
             f"No CSV files found for years {start_year}-{end_year} in {data_dir}"
         )
+    return filtered
 
-    frames = [load_season(f) for f in filtered]
-    combined = pd.concat(frames, ignore_index=True)
-    combined["position_group"] = combined["position"].apply(normalize_position)
 
-    return combined
+def atomic_write(path: Path, write: Callable[[str], None]) -> None:
+    """
+    Create path by calling write() on a temp file next to it, then
+    os.replace() it into place.
+
+    Each call gets its own temp file, so concurrent writers (e.g. several
+    server workers cold-starting at once) never write into the same one;
+    readers see either the old file or a complete new one.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        # mkstemp creates 0600 files; published files keep the usual mode
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def files_digest(paths: list) -> str:
+    """Short hash of file names, mtimes and sizes — changes when any file does."""
+    digest = hashlib.sha1()
+    for f in paths:
+        st = os.stat(f)
+        digest.update(f"{Path(f).name}:{st.st_mtime_ns}:{st.st_size};".encode())
+    return digest.hexdigest()[:12]
 
 
 # --------------------------------------------------------------------------
 # Age Bucketing (for schedule effects)
 # --------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
 def age_bucket(age: float) -> Optional[str]:
     """Classify age into buckets for schedule effect analysis."""
     if pd.isna(age):
@@ -6,34 +6,36 @@
 #   export_betting_contract()  -> filepath
 
 from engine.baseline import PlayerContext, build_player_contexts_from_csv
-from engine.projections import SeasonProjection, project_season
-from engine.game_day import GameDayProjection, project_game_day
+from engine.projections import SeasonProjection, project_season, project_season_batch
+from engine.game_day import GameDayProjection, project_game_day, project_game_day_batch
 from engine.pricing import AuctionValue, price_auction
 from engine.export import export_all
 from engine.export_betting import export_betting_contract as _export_betting
 from engine.live_data import load_live_context
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 def project_all_season(
     seasons_to_load: int = 3,
+    max_workers: Optional[int] = 1,
 ) -> tuple:
     """
     Full season-long projection pipeline for all players.
 
     Loads recent CSV data, builds player contexts, projects each player,
-    and computes auction values.
+    and computes auction values. max_workers sets the context-building
+    process count (see build_player_contexts_from_csv; default serial).
 
     Returns:
         (contexts, projections, auction_values)
     """
     print("Building player contexts from CSV data...")
-    contexts = build_player_contexts_from_csv(seasons_to_load)
+    contexts = build_player_contexts_from_csv(seasons_to_load, max_workers)
     print(f"  Built {len(contexts)} player contexts")
 
     print("Projecting seasons...")
-    projections = [project_season(ctx) for ctx in contexts]
+    projections = project_season_batch(contexts)
     print(f"  Projected {len(projections)} players")
 
     print("Computing auction values...")
@@ -51,10 +53,7 @@ def project_all_game_day(
     Apply game-day adjustments to all players.
     PlayerContext objects must have game-day fields populated.
     """
-    return [
-        project_game_day(ctx, proj)
-        for ctx, proj in zip(contexts, projections)
-    ]
+    return project_game_day_batch(contexts, projections)
 
 
 def export_json(
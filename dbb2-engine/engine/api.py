@@ -10,20 +10,45 @@ Primary endpoints:
 - POST /tools/trade/analyze
 """
 
+import hashlib
 import math
 import os
-from functools import lru_cache
-from typing import Dict, List
+import pickle
+from contextlib import asynccontextmanager
+from functools import cache
+from pathlib import Path
+from typing import Dict, List, NamedTuple
 
 from fastapi import FastAPI, Header, HTTPException, Query
 from pydantic import BaseModel
 
+from data_collection.utils import (
+    CACHE_DIR,
+    PROJECT_ROOT,
+    STATIC_DATA_DIR,
+    atomic_write,
+    files_digest,
+    season_csv_files,
+)
 from engine import project_all_season
-from engine.baseline import PlayerContext
+from engine.baseline import PlayerContext, index_contexts
 from engine.projections import SeasonProjection
 from engine.pricing import AuctionValue
+from engine.props import STAT_MAP, get_confidence, get_std_dev
+from engine.season import get_current_nba_season_start_year
 
-app = FastAPI(title="DBB2 Projection API", version="1.0.0")
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Warm the pipeline cache before serving so no request pays for it."""
+    try:
+        _load_pipeline()
+    except Exception as e:  # Endpoints retry the load on first use
+        print(f"WARNING: pipeline warmup failed: {e}")
+    yield
+
+
+app = FastAPI(title="DBB2 Projection API", version="1.0.0", lifespan=_lifespan)
 
 
 class LineupOptimizeRequest(BaseModel):
@@ -35,32 +60,142 @@ class TradeAnalyzeRequest(BaseModel):
     give_player_ids: List[str]
     receive_player_ids: List[str]
 
-# Map engine stat names to betting engine short names
-STAT_MAP = {
-    "points": "pts",
-    "rebounds": "reb",
-    "assists": "ast",
-    "three_pm": "fg3m",
-    "steals": "stl",
-    "blocks": "blk",
-}
 
-# Variance key format in PlayerContext.stat_variance
-VARIANCE_KEY_MAP = {
-    "points": "points_variance",
-    "rebounds": "rebounds_variance",
-    "assists": "assists_variance",
-    "three_pm": "three_pm_variance",
-    "steals": "steals_variance",
-    "blocks": "blocks_variance",
+# Seasons of game logs the API pipeline loads
+PIPELINE_SEASONS = 3
+
+# Bump whenever PlayerContext / SeasonProjection / AuctionValue change shape
+PIPELINE_CACHE_VERSION = 2
+
+# Packages whose code produces the cached pipeline output
+PIPELINE_SOURCE_DIRS = (PROJECT_ROOT / "engine", PROJECT_ROOT / "data_collection")
+
+# Internal-API row field → (SeasonProjection attribute, decimals)
+INTERNAL_ROUNDED_STATS = {
+    "points": ("points", 1),
+    "rebounds": ("rebounds", 1),
+    "assists": ("assists", 1),
+    "steals": ("steals", 1),
+    "blocks": ("blocks", 1),
+    "turnovers": ("turnovers", 1),
+    "three_pointers": ("three_pm", 1),
+    "fg_pct": ("fg_pct", 3),
+    "ft_pct": ("ft_pct", 3),
+    "minutes": ("minutes", 1),
 }
 
 
-@lru_cache(maxsize=1)
-def _load_pipeline():
-    """Run the full pipeline once and cache results."""
-    contexts, projections, auction_values = project_all_season()
-    return contexts, projections, auction_values
+class _Pipeline(NamedTuple):
+    """Pipeline results plus player_id lookups and pre-rounded stats."""
+    contexts: List[PlayerContext]
+    projections: List[SeasonProjection]
+    auction_values: List[AuctionValue]
+    ctx_map: Dict[str, PlayerContext]
+    proj_map: Dict[str, SeasonProjection]
+    auction_map: Dict[str, AuctionValue]
+    rounded_stats: Dict[str, Dict[str, float]]
+
+
+def _index_pipeline(
+    contexts: List[PlayerContext],
+    projections: List[SeasonProjection],
+    auction_values: List[AuctionValue],
+) -> _Pipeline:
+    """Attach player_id → object maps to raw pipeline output."""
+    return _Pipeline(
+        contexts=contexts,
+        projections=projections,
+        auction_values=auction_values,
+        ctx_map=index_contexts(contexts),
+        proj_map={p.player_id: p for p in projections},
+        auction_map={a.player_id: a for a in auction_values},
+        rounded_stats=_round_projection_columns(projections),
+    )
+
+
+def _round_projection_columns(
+    projections: List[SeasonProjection],
+) -> Dict[str, Dict[str, float]]:
+    """
+    INTERNAL_ROUNDED_STATS rows, rounded once at load; keyed by player_id.
+
+    Uses built-in round() like the public endpoints: np.round can round
+    half-step values the other way (0.45 -> 0.4).
+    """
+    return {
+        p.player_id: {
+            field: round(getattr(p, attr), decimals)
+            for field, (attr, decimals) in INTERNAL_ROUNDED_STATS.items()
+        }
+        for p in projections
+    }
+
+
+@cache
+def _load_pipeline() -> _Pipeline:
+    """Run the full pipeline once and cache results (with lookup maps)."""
+    return _index_pipeline(*_load_pipeline_artifacts())
+
+
+def _pipeline_cache_path() -> Path:
+    """
+    On-disk cache location for project_all_season() output.
+
+    Keyed by PIPELINE_CACHE_VERSION, the pipeline's own source code, and
+    the season CSVs and static_data modules it reads, so a deploy, new game
+    logs or regenerated profiles invalidate it.
+    """
+    end_year = get_current_nba_season_start_year()
+    start_year = end_year - PIPELINE_SEASONS + 1
+    csv_files = season_csv_files(start_year, end_year)
+    static_files = sorted(STATIC_DATA_DIR.rglob("*.py"))
+    digest = files_digest(csv_files + static_files)
+    return CACHE_DIR / f"pipeline-v{PIPELINE_CACHE_VERSION}-{_source_digest()}-{digest}.pkl"
+
+
+def _source_digest() -> str:
+    """
+    Short hash of the .py files in PIPELINE_SOURCE_DIRS.
+
+    Hashes content rather than mtimes: deploys may not preserve (or may
+    reset) mtimes, and a stale pickle would keep serving old projections.
+    """
+    digest = hashlib.sha1()
+    for source_dir in PIPELINE_SOURCE_DIRS:
+        for path in sorted(source_dir.glob("*.py")):
+            digest.update(f"{source_dir.name}/{path.name}:".encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def _load_pipeline_artifacts() -> tuple:
+    """(contexts, projections, auction_values), via the disk cache when valid."""
+    cache_path = _pipeline_cache_path()
+    if cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # Unreadable or outdated layout (any unpickling error) — rebuild below
+
+    artifacts = project_all_season(PIPELINE_SEASONS)
+
+    # Best effort — a read-only filesystem just skips the cache.
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in cache_path.parent.glob("pipeline-v*.pkl"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+        atomic_write(cache_path, lambda tmp_path: _dump_pickle(artifacts, tmp_path))
+    except OSError:
+        pass
+
+    return artifacts
+
+
+def _dump_pickle(obj, path: str) -> None:
+    with open(path, "wb") as f:
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def _to_fantasy_points(proj: SeasonProjection) -> float:
@@ -75,35 +210,6 @@ def _to_fantasy_points(proj: SeasonProjection) -> float:
     )
 
 
-def _get_std_dev(ctx: PlayerContext, stat: str) -> float:
-    """Get std_dev for a stat from PlayerContext.stat_variance."""
-    var_key = VARIANCE_KEY_MAP.get(stat)
-    if var_key is None:
-        return 0.0
-    variance = ctx.stat_variance.get(var_key, 0.0)
-    return math.sqrt(max(variance, 0.0))
-
-
-def _get_confidence(
-    projection_value: float,
-    std_dev: float,
-    base_confidence: float,
-) -> float:
-    """
-    Derive per-stat confidence from consistency and coefficient of variation.
-
-    base_confidence = consistency / 100 (global player consistency)
-    Adjusted down by CV: higher variance relative to mean = lower confidence.
-    Clamped to [0.40, 0.95].
-    """
-    if projection_value <= 0 or std_dev <= 0:
-        return round(max(0.40, base_confidence * 0.8), 2)
-
-    cv = std_dev / projection_value
-    conf = base_confidence * (1 - min(cv, 0.5))
-    return round(max(0.40, min(0.95, conf)), 2)
-
-
 def _build_player_response(
     ctx: PlayerContext,
     proj: SeasonProjection,
@@ -121,8 +227,8 @@ def _build_player_response(
 
     for engine_stat, short_name in STAT_MAP.items():
         proj_val = getattr(proj, engine_stat, 0.0)
-        std_dev = _get_std_dev(ctx, engine_stat)
-        confidence = _get_confidence(proj_val, std_dev, base_conf)
+        std_dev = get_std_dev(ctx, engine_stat)
+        confidence = get_confidence(proj_val, std_dev, base_conf)
 
         result[short_name] = round(proj_val, 1)
         result[f"{short_name}_std"] = round(std_dev, 2)
@@ -167,9 +273,8 @@ def _build_similarity_vector(ctx: PlayerContext, proj: SeasonProjection) -> List
 @app.get("/projections/today")
 def get_today_projections():
     """Return all player projections in the betting engine contract shape."""
-    contexts, projections, _ = _load_pipeline()
-
-    ctx_map = {c.player_id: c for c in contexts}
+    pipeline = _load_pipeline()
+    projections, ctx_map = pipeline.projections, pipeline.ctx_map
     players = []
 
     for proj in projections:
@@ -185,7 +290,9 @@ def _build_internal_player_row(
     ctx: PlayerContext,
     proj: SeasonProjection,
     auction_map: Dict[str, AuctionValue],
+    rounded: Dict[str, float],
 ) -> Dict:
+    """rounded: this player's entry from _Pipeline.rounded_stats."""
     auction = auction_map.get(ctx.player_id)
     return {
         "player_id": ctx.player_id,
@@ -194,16 +301,7 @@ def _build_internal_player_row(
         "position": ctx.raw_position,
         "age": ctx.age,
         "fantasy_points": _to_fantasy_points(proj),
-        "points": round(proj.points, 1),
-        "rebounds": round(proj.rebounds, 1),
-        "assists": round(proj.assists, 1),
-        "steals": round(proj.steals, 1),
-        "blocks": round(proj.blocks, 1),
-        "turnovers": round(proj.turnovers, 1),
-        "three_pointers": round(proj.three_pm, 1),
-        "fg_pct": round(proj.fg_pct, 3),
-        "ft_pct": round(proj.ft_pct, 3),
-        "minutes": round(proj.minutes, 1),
+        **rounded,
         "games_played_3yr": [],
         "injury_history": {
             "total_games_missed_3yr": 0,
@@ -229,15 +327,16 @@ def get_internal_baseline_projections(
     if x_api_key != internal_api_key:
         raise HTTPException(status_code=401, detail="Invalid API key")
 
-    contexts, projections, auction_values = _load_pipeline()
-    proj_map = {p.player_id: p for p in projections}
-    auction_map = {a.player_id: a for a in auction_values}
+    pipeline = _load_pipeline()
+    contexts, proj_map, auction_map = pipeline.contexts, pipeline.proj_map, pipeline.auction_map
     rows = []
     for ctx in contexts:
         proj = proj_map.get(ctx.player_id)
         if proj is None:
             continue
-        rows.append(_build_internal_player_row(ctx, proj, auction_map))
+        rows.append(
+            _build_internal_player_row(ctx, proj, auction_map, pipeline.rounded_stats[ctx.player_id])
+        )
 
     return {"players": rows, "count": len(rows)}
 
@@ -249,9 +348,8 @@ def optimize_lineup(request: LineupOptimizeRequest):
     roster_size = request.roster_size
     if roster_size <= 0:
         raise HTTPException(status_code=400, detail="roster_size must be > 0")
-    contexts, projections, _ = _load_pipeline()
-    ctx_map = {c.player_id: c for c in contexts}
-    proj_map = {p.player_id: p for p in projections}
+    pipeline = _load_pipeline()
+    ctx_map, proj_map = pipeline.ctx_map, pipeline.proj_map
 
     selected = []
     for player_id in player_ids:
@@ -297,10 +395,9 @@ def get_similar_players(
             detail="Provide exactly one of player_id or player_name",
         )
 
-    contexts, projections, auction_values = _load_pipeline()
-    ctx_map = {c.player_id: c for c in contexts}
-    proj_map = {p.player_id: p for p in projections}
-    auction_map = {a.player_id: a for a in auction_values}
+    pipeline = _load_pipeline()
+    contexts, ctx_map = pipeline.contexts, pipeline.ctx_map
+    proj_map, auction_map = pipeline.proj_map, pipeline.auction_map
 
     if target_id:
         if target_id not in ctx_map or target_id not in proj_map:
@@ -368,9 +465,8 @@ def get_similar_players(
 @app.get("/tools/streaming-candidates")
 def get_streaming_candidates(limit: int = Query(default=10, ge=1, le=50)):
     """Return short-term streaming candidates emphasizing low auction cost and usable projection."""
-    contexts, projections, auction_values = _load_pipeline()
-    proj_map = {p.player_id: p for p in projections}
-    auction_map = {a.player_id: a for a in auction_values}
+    pipeline = _load_pipeline()
+    contexts, proj_map, auction_map = pipeline.contexts, pipeline.proj_map, pipeline.auction_map
     rows = []
     for ctx in contexts:
         proj = proj_map.get(ctx.player_id)
@@ -400,10 +496,8 @@ def analyze_trade(request: TradeAnalyzeRequest):
     """Analyze trade value using fantasy points + auction value."""
     give_player_ids = request.give_player_ids
     receive_player_ids = request.receive_player_ids
-    contexts, projections, auction_values = _load_pipeline()
-    ctx_map = {c.player_id: c for c in contexts}
-    proj_map = {p.player_id: p for p in projections}
-    auction_map = {a.player_id: a for a in auction_values}
+    pipeline = _load_pipeline()
+    ctx_map, proj_map, auction_map = pipeline.ctx_map, pipeline.proj_map, pipeline.auction_map
 
     def pack(player_id: str) -> Dict:
         ctx = ctx_map.get(player_id)
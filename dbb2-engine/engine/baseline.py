@@ -9,7 +9,11 @@ Season weights: most_recent=0.50, prior=0.30, two_prior=0.20
 (normalized if fewer seasons available)
 """
 
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from itertools import repeat
 from typing import Dict, List, Optional
 
 import numpy as np
@@ -17,7 +21,7 @@ import pandas as pd
 
 from data_collection.utils import (
     STAT_COLUMNS,
-    load_seasons_range,
+    load_seasons_range_cached,
     rebucket_role,
     age_bucket,
     normalize_position,
@@ -34,6 +38,19 @@ SEASON_WEIGHTS_1 = [1.00]
 # Minimum games in a season to count it
 MIN_GAMES_PER_SEASON = 10
 
+# Player groups handed to each worker process per task
+CONTEXT_CHUNKSIZE = 64
+
+# The only CSV columns the context builder reads
+CONTEXT_COLUMNS = list(STAT_COLUMNS) + [
+    "player_id", "player_name", "team", "position", "age",
+    "game_date", "season_start_year", "position_group",
+]
+
+# PlayerContext fields that key the lookup tables; re-interned on unpickle
+# so probes hit the identity fast path against the tables' literal keys
+_LOOKUP_KEY_FIELDS = ("position", "role", "age_bracket")
+
 
 @dataclass
 class PlayerContext:
@@ -71,30 +88,50 @@ class PlayerContext:
     def status(self) -> str:
         return "active"
 
+    def __setstate__(self, state: dict) -> None:
+        # Contexts come back pickled from worker processes and the pipeline
+        # disk cache, with fresh (non-interned) copies of every string
+        for name in _LOOKUP_KEY_FIELDS:
+            value = state.get(name)
+            if type(value) is str:
+                state[name] = sys.intern(value)
+        self.__dict__.update(state)
+
 
 def build_player_contexts_from_csv(
     seasons_to_load: int = 3,
+    max_workers: Optional[int] = 1,
 ) -> List[PlayerContext]:
     """
     Build PlayerContext objects for all players in the most recent N seasons.
 
     Steps:
     1. Determine the most recent season year from available CSVs
-    2. Load that range of seasons
+    2. Load that range of seasons (Parquet-cached after the first run)
     3. Group by player_id
     4. For each player: compute weighted baseline, determine metadata
+       (serial by default; max_workers > 1 fans out across that many
+       processes, None = one per CPU)
     5. Return sorted by player_name
     """
     # Resolve active NBA season dynamically (no hardcoded year).
     desired_end_year = get_current_nba_season_start_year()
     start_year = desired_end_year - seasons_to_load + 1
 
-    df = load_seasons_range(start_year, desired_end_year)
+    df = load_seasons_range_cached(start_year, desired_end_year)
 
     # Use the actual most recent season found in loaded data, in case
     # the current season CSV hasn't been collected yet.
     end_year = int(df["season_start_year"].max())
 
+    # Drop unused columns and narrow dtypes before any filtering/grouping
+    df = df[CONTEXT_COLUMNS]
+    df = df.astype({
+        **{stat: "float32" for stat in STAT_COLUMNS},
+        "season_start_year": "int16",
+        "age": "Int8",
+    })
+
     # Standard cleanup
     df = df.dropna(subset=["position_group"])
     df = df[df["minutes_played"] > 0]
@@ -102,29 +139,76 @@ def build_player_contexts_from_csv(
     # Add fantasy points
     df["fantasy_points"] = df.apply(calculate_fantasy_points, axis=1)
 
-    contexts = []
-    for player_id, player_df in df.groupby("player_id"):
-        ctx = _build_single_context(player_id, player_df, end_year)
-        if ctx is not None:
-            contexts.append(ctx)
+    # Categorical ids group on integer codes instead of hashing strings
+    df["player_id"] = df["player_id"].astype("category")
+
+    contexts = [
+        ctx for ctx in _build_contexts(df, end_year, max_workers)
+        if ctx is not None
+    ]
 
     contexts.sort(key=lambda c: c.player_name)
     return contexts
 
 
+def index_contexts(contexts: List[PlayerContext]) -> Dict[str, PlayerContext]:
+    """
+    player_id → PlayerContext map.
+
+    Build it once per pipeline run and hand it to every consumer that joins
+    on player_id (export_betting_contract, the API pipeline).
+    """
+    return {c.player_id: c for c in contexts}
+
+
+def _build_contexts(
+    df: pd.DataFrame,
+    most_recent_year: int,
+    max_workers: Optional[int] = 1,
+) -> List[Optional[PlayerContext]]:
+    """Run _build_single_context for every player group, in parallel if allowed."""
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    # Group frames without the player_id column: the id travels separately,
+    # and a categorical column would pickle its full category list (every
+    # player_id in the league) into each worker task
+    value_columns = [column for column in df.columns if column != "player_id"]
+    groups = list(df.groupby("player_id", sort=False, observed=True)[value_columns])
+    if max_workers <= 1 or len(groups) <= CONTEXT_CHUNKSIZE:
+        return [
+            _build_single_context(player_id, player_df, most_recent_year)
+            for player_id, player_df in groups
+        ]
+
+    player_ids = [player_id for player_id, _ in groups]
+    player_dfs = [player_df for _, player_df in groups]
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(
+            _build_single_context,
+            player_ids,
+            player_dfs,
+            repeat(most_recent_year),
+            chunksize=CONTEXT_CHUNKSIZE,
+        ))
+
+
 def _build_single_context(
     player_id: str,
     player_df: pd.DataFrame,
     most_recent_year: int,
 ) -> Optional[PlayerContext]:
     """Build a PlayerContext for one player from their game logs."""
+    # Split into per-season frames once; reused by every step below
+    by_season = dict(tuple(player_df.groupby("season_start_year", sort=False)))
+
     # Must have at least MIN_GAMES_PER_SEASON in the most recent season
-    recent = player_df[player_df["season_start_year"] == most_recent_year]
-    if len(recent) < MIN_GAMES_PER_SEASON:
+    recent = by_season.get(most_recent_year)
+    if recent is None or len(recent) < MIN_GAMES_PER_SEASON:
         return None
 
     # Extract metadata from most recent game
-    latest_game = recent.sort_values("game_date").iloc[-1]
+    latest_game = recent.loc[recent["game_date"].idxmax()]
     player_name = str(latest_game.get("player_name", "Unknown"))
     team = str(latest_game.get("team", "UNK"))
     raw_position = str(latest_game.get("position", "Unknown"))
@@ -147,11 +231,11 @@ def _build_single_context(
 
     # Games played per season
     games_by_season = {}
-    for season_year, season_df in player_df.groupby("season_start_year"):
+    for season_year, season_df in by_season.items():
         games_by_season[int(season_year)] = len(season_df)
 
     # Compute weighted baseline
-    baseline_stats = _compute_weighted_baseline(player_df, most_recent_year)
+    baseline_stats = _compute_weighted_baseline(player_df, most_recent_year, by_season)
 
     # Compute stat variance from most recent season
     stat_variance = _compute_stat_variance(recent)
@@ -174,30 +258,34 @@ def _build_single_context(
 def _compute_weighted_baseline(
     player_df: pd.DataFrame,
     most_recent_year: int,
+    by_season: Optional[Dict[int, pd.DataFrame]] = None,
 ) -> Dict[str, float]:
     """
     Compute weighted per-game averages across up to 3 seasons.
 
     Most recent season gets highest weight. Seasons with fewer than
-    MIN_GAMES_PER_SEASON are excluded.
+    MIN_GAMES_PER_SEASON are excluded. by_season (season_start_year →
+    that season's rows) is derived from player_df when not supplied.
     """
     all_stats = list(STAT_COLUMNS) + ["fantasy_points"]
+    if by_season is None:
+        by_season = dict(tuple(player_df.groupby("season_start_year", sort=False)))
 
     # Get per-season averages, ordered most recent first
     season_avgs = []
     for year in range(most_recent_year, most_recent_year - 3, -1):
-        season_df = player_df[player_df["season_start_year"] == year]
-        if len(season_df) >= MIN_GAMES_PER_SEASON:
+        season_df = by_season.get(year)
+        if season_df is not None and len(season_df) >= MIN_GAMES_PER_SEASON:
             avgs = {}
             for stat in all_stats:
-                avgs[stat] = season_df[stat].mean()
+                avgs[stat] = float(season_df[stat].mean())
             season_avgs.append(avgs)
 
     if not season_avgs:
         # Shouldn't happen if caller filters, but fallback to overall avg
         result = {}
         for stat in all_stats:
-            result[stat] = player_df[stat].mean()
+            result[stat] = float(player_df[stat].mean())
         return result
 
     # Select weights based on number of available seasons
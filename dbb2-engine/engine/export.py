@@ -9,9 +9,20 @@ Output contract:
 """
 
 import json
+import os
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional speedup — stdlib json is the fallback
+    orjson = None
+
+from data_collection.utils import atomic_write
 from engine.baseline import PlayerContext
 from engine.projections import SeasonProjection
 from engine.pricing import AuctionValue
@@ -19,6 +30,80 @@ from engine.position_map import map_position_to_cd
 from engine import lookup
 from engine.live_data import compute_remaining_games_fields, normalize_name
 
+# minutes_risk base from usage profile minutes_volatility label
+MINUTES_VOLATILITY_RISK = {"low": 20, "medium": 50, "high": 80}
+
+# minutes_risk modifier: Bench/Scrub inherently riskier
+ROLE_MINUTES_RISK = {"Bench": 15, "Scrub": 20}
+
+# Injury status codes for role risk, first substring match wins
+# (0 = no recognized status)
+INJURY_STATUS_CODES = (
+    ("out", 1),
+    ("doubtful", 2),
+    ("questionable", 3),
+    ("probable", 4),
+    ("day-to-day", 4),
+)
+
+# role_risk bump per injury status code
+INJURY_CODE_BUMP = {1: 0.25, 2: 0.20, 3: 0.12, 4: 0.05}
+
+# role_risk base by projected minutes tier: <15, 15-22, 22-28, 28-32, 32+
+ROLE_MINUTES_TIER_EDGES = [15, 22, 28, 32]
+ROLE_MINUTES_TIER_RISK = [0.35, 0.28, 0.20, 0.12, 0.05]
+
+# insights.json note tiers; each tier is inclusive of its lower edge
+NOTE_VALUE_EDGES = [40, 70, 90]
+NOTE_VALUE_TIERS = ["Low", "Moderate", "Strong", "Elite"]
+NOTE_RISK_EDGES = [30, 60]
+NOTE_RISK_TIERS = ["low risk", "moderate risk", "high risk"]
+NOTE_CONSISTENCY_EDGES = [50, 70]
+NOTE_CONSISTENCY_TIERS = ["inconsistent", "solid consistency", "elite consistency"]
+
+# Fantasy weights for (points, rebounds, assists, steals, blocks, three_pm)
+# in composition risk
+COMPOSITION_FP_WEIGHTS = np.array([1.0, 1.2, 1.5, 3.0, 3.0, 1.0])
+
+# projections.json stat fields in output order: (json key, SeasonProjection
+# attribute, decimals)
+PROJECTION_STAT_FIELDS = [
+    ("minutes", "minutes", 1),
+    ("usage_rate", "usage_rate", 1),
+    ("points", "points", 1),
+    ("rebounds", "rebounds", 1),
+    ("assists", "assists", 1),
+    ("steals", "steals", 1),
+    ("blocks", "blocks", 1),
+    ("turnovers", "turnovers", 1),
+    ("fg_pct", "fg_pct", 3),
+    ("three_pt_pct", "three_pt_pct", 3),
+    ("ft_pct", "ft_pct", 3),
+    ("fgm", "fgm", 1),
+    ("fga", "fga", 1),
+    ("tpm", "three_pm", 1),
+    ("tpa", "three_pa", 1),
+    ("ftm", "ftm", 1),
+    ("fta", "fta", 1),
+    ("fantasy_points", "fantasy_points", 1),
+    ("ceiling", "ceiling", 1),
+    ("floor", "floor", 1),
+]
+_PROJECTION_KEYS = (
+    ("player_id", "name", "team", "position")
+    + tuple(key for key, _, _ in PROJECTION_STAT_FIELDS)
+    + ("consistency",)
+)
+_PROJECTION_DECIMALS = tuple(decimals for _, _, decimals in PROJECTION_STAT_FIELDS)
+
+# risk.json entry keys in output order
+_RISK_KEYS = (
+    "player_id", "name", "team",
+    "injury_risk", "volatility", "minutes_risk",
+    "availability_risk", "role_risk", "composition_risk", "total_risk",
+    "risk_level",
+)
+
 
 def export_all(
     contexts: List[PlayerContext],
@@ -36,133 +121,211 @@ def export_all(
     # Build a lookup from player_id to auction value
     auction_map = {v.player_id: v for v in auction_values}
 
-    # Build context map
-    context_map = {c.player_id: c for c in contexts}
+    # Build the per-player lookups once; every builder below shares them
+    proj_map = {p.player_id: p for p in projections}
+    # Only a handful of distinct raw positions: map each once, then per player
+    cd_by_raw = {raw: map_position_to_cd(raw) for raw in {c.raw_position for c in contexts}}
+    cd_positions = {c.player_id: cd_by_raw[c.raw_position] for c in contexts}
 
     # Sort projections by fantasy_points descending
     sorted_projections = sorted(projections, key=lambda p: p.fantasy_points, reverse=True)
 
-    # Build risk data for each player
-    risk_data = _build_risk_data(contexts, projections, live_context)
-    risk_map = {r["player_id"]: r for r in risk_data}
-
-    files = {}
-
-    # 1. players.json
-    players = _build_players_json(contexts)
-    players_path = out_path / "players.json"
-    _write_json(players_path, players)
-    files["players.json"] = str(players_path)
-
-    # 2. projections.json
-    proj_json = _build_projections_json(sorted_projections, context_map, live_context)
-    proj_path = out_path / "projections.json"
-    _write_json(proj_path, proj_json)
-    files["projections.json"] = str(proj_path)
-
-    # 3. risk.json
-    risk_path = out_path / "risk.json"
-    _write_json(risk_path, risk_data)
-    files["risk.json"] = str(risk_path)
-
-    # 4. insights.json
-    insights = _build_insights_json(contexts, projections, auction_map, risk_map)
-    insights_path = out_path / "insights.json"
-    _write_json(insights_path, insights)
-    files["insights.json"] = str(insights_path)
-
-    return files
-
-
-def _write_json(path: Path, data: list) -> None:
-    """Write JSON array to file."""
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
-
-
-def _build_players_json(contexts: List[PlayerContext]) -> List[dict]:
-    """Build players.json entries. Positions mapped to CD 5-position enum."""
-    return [
-        {
-            "player_id": ctx.player_id,
-            "name": ctx.player_name,
-            "team": ctx.team,
-            "position": map_position_to_cd(ctx.raw_position),
-            "status": ctx.status,
+    # Rest-of-season fields, shared by projections.json and availability risk
+    ros_by_id = None
+    if live_context is not None:
+        ros_by_id = {
+            p.player_id: compute_remaining_games_fields(
+                player_id=p.player_id,
+                player_name=p.player_name,
+                team=p.team,
+                projected_games=p.projected_games,
+                tpm_per_game=p.three_pm,
+                live_ctx=live_context,
+            )
+            for p in projections
         }
-        for ctx in contexts
-    ]
 
+    # players, risk and insights entries come from one pass over contexts
+    players, risk_data, insights = _build_context_outputs(
+        contexts, proj_map, auction_map, cd_positions, live_context, ros_by_id
+    )
+
+    # Generator: projections.json entries are built as they are written
+    proj_json = _iter_projections_json(sorted_projections, cd_positions, ros_by_id)
 
-def _build_projections_json(
-    projections: List[SeasonProjection],
-    context_map: Dict[str, PlayerContext] = None,
+    payloads = {
+        "players.json": players,
+        "projections.json": proj_json,
+        "risk.json": risk_data,
+        "insights.json": insights,
+    }
+    files = {name: out_path / name for name in payloads}
+
+    # The four files are independent; file writes release the GIL
+    with ThreadPoolExecutor(max_workers=len(payloads)) as pool:
+        list(pool.map(_write_json, files.values(), payloads.values()))
+
+    return {name: str(path) for name, path in files.items()}
+
+
+def _write_json(path: Path, data: Iterable[dict]) -> None:
+    """
+    Write JSON array to file (encoded with orjson when installed).
+
+    Compact output is encoded and written one element at a time, so data may
+    be a generator and the full encoded array is never held in memory. Set
+    CD_PRETTY_JSON=1 for indented output when debugging. The file is written
+    through atomic_write, so readers never see a partially written file and
+    concurrent exports never share a temp file.
+    """
+    pretty = os.getenv("CD_PRETTY_JSON") == "1"
+
+    def write(tmp_path: str) -> None:
+        with open(tmp_path, "wb", buffering=1 << 20) as f:
+            if pretty:
+                f.write(_encode_json(list(data), pretty=True))
+            else:
+                f.write(b"[")
+                for i, item in enumerate(data):
+                    if i:
+                        f.write(b",")
+                    f.write(_encode_json(item))
+                f.write(b"]")
+
+    atomic_write(path, write)
+
+
+def _encode_json(obj, pretty: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes: compact, or 2-space indented if pretty."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _build_context_outputs(
+    contexts: List[PlayerContext],
+    proj_map: Dict[str, SeasonProjection],
+    auction_map: Dict[str, AuctionValue],
+    cd_positions: Dict[str, str],
     live_context: Optional[Dict] = None,
-) -> List[dict]:
+    ros_by_id: Optional[Dict[str, dict]] = None,
+) -> Tuple[List[dict], List[dict], List[dict]]:
+    """
+    Build players.json, risk.json and insights.json entries in a single pass
+    over contexts. Each player's risk entry feeds its insight entry directly.
+    ros_by_id holds live rest-of-season fields per player_id (None offline).
+    """
+    injury_codes = _context_injury_codes(contexts, live_context)
+
+    # (age, position, role) has far fewer combinations than players
+    profile_cache = {}
+
+    matched_projections = [proj_map.get(ctx.player_id) for ctx in contexts]
+    composition_risks = _composition_risks(matched_projections)
+
+    # Value score: percentile rank of dollar value, all players at once
+    value_scores = _compute_value_scores(contexts, auction_map)
+
+    # Per-player numeric fields as arrays (structure-of-arrays) so the
+    # volatility and opportunity bonus arithmetic runs once over everyone
+    n = len(contexts)
+    ages = np.fromiter((c.age for c in contexts), dtype=np.int16, count=n)
+    is_starter = np.fromiter((c.role == "Starter" for c in contexts), dtype=bool, count=n)
+    consistencies = np.fromiter(
+        (p.consistency if p else 50 for p in matched_projections), dtype=np.int64, count=n
+    )
+    # Volatility = inverse of consistency
+    volatilities = (100 - consistencies).tolist()
+    # Opportunity bonus: +10 for age <= 23, +5 for starters
+    opportunity_bonuses = (np.where(ages <= 23, 10, 0) + np.where(is_starter, 5, 0)).tolist()
+
+    # One entry per context in each output; size the lists up front
+    players, risk_data, insights = [None] * n, [None] * n, [None] * n
+    for i, (ctx, proj, injury_code, composition_risk, volatility, value_score,
+            opportunity_bonus) in enumerate(zip(
+        contexts, matched_projections, injury_codes, composition_risks, volatilities,
+        value_scores, opportunity_bonuses,
+    )):
+        players[i] = _build_player_entry(ctx, cd_positions[ctx.player_id])
+
+        risk = risk_data[i] = _build_risk_entry(
+            ctx, proj, composition_risk, volatility, profile_cache,
+            ros_by_id.get(ctx.player_id) if ros_by_id is not None else None,
+            injury_code,
+        )
+
+        insights[i] = _build_insight_entry(
+            ctx, proj, auction_map.get(ctx.player_id),
+            value_score, opportunity_bonus, risk,
+        )
+
+    return players, risk_data, insights
+
+
+def _build_player_entry(ctx: PlayerContext, cd_position: str) -> dict:
+    """Build a players.json entry. cd_position is the CD 5-position enum."""
+    return {
+        "player_id": ctx.player_id,
+        "name": ctx.player_name,
+        "team": ctx.team,
+        "position": cd_position,
+        "status": ctx.status,
+    }
+
+
+def _iter_projections_json(
+    projections: List[SeasonProjection],
+    cd_positions: Dict[str, str] = None,
+    ros_by_id: Optional[Dict[str, dict]] = None,
+) -> Iterator[dict]:
     """
-    Build projections.json entries.
+    Yield projections.json entries.
     Note: three_pm → tpm, three_pa → tpa for CD contract.
-    Positions mapped to CD 5-position enum using raw_position from context.
+    Positions come from cd_positions (CD enum of each context's raw_position),
+    falling back to mapping the projection's own position.
     """
     def _get_cd_position(p):
-        if context_map and p.player_id in context_map:
-            return map_position_to_cd(context_map[p.player_id].raw_position)
+        cd_position = cd_positions.get(p.player_id) if cd_positions else None
+        if cd_position is not None:
+            return cd_position
         return map_position_to_cd(p.position)
 
-    entries = []
-    for p in projections:
-        entry = {
-            "player_id": p.player_id,
-            "name": p.player_name,
-            "team": p.team,
-            "position": _get_cd_position(p),
-            "minutes": round(p.minutes, 1),
-            "usage_rate": round(p.usage_rate, 1),
-            "points": round(p.points, 1),
-            "rebounds": round(p.rebounds, 1),
-            "assists": round(p.assists, 1),
-            "steals": round(p.steals, 1),
-            "blocks": round(p.blocks, 1),
-            "turnovers": round(p.turnovers, 1),
-            "fg_pct": round(p.fg_pct, 3),
-            "three_pt_pct": round(p.three_pt_pct, 3),
-            "ft_pct": round(p.ft_pct, 3),
-            "fgm": round(p.fgm, 1),
-            "fga": round(p.fga, 1),
-            "tpm": round(p.three_pm, 1),
-            "tpa": round(p.three_pa, 1),
-            "ftm": round(p.ftm, 1),
-            "fta": round(p.fta, 1),
-            "fantasy_points": round(p.fantasy_points, 1),
-            "ceiling": round(p.ceiling, 1),
-            "floor": round(p.floor, 1),
-            "consistency": _clamp_int(p.consistency, 0, 100),
-        }
+    # Stats as plain floats; rounded with built-in round(), not np.round,
+    # which can round half-step values the other way (0.45 -> 0.4)
+    stat_rows = np.array(
+        [[getattr(p, attr) for _, attr, _ in PROJECTION_STAT_FIELDS] for p in projections],
+        dtype=np.float64,
+    ).reshape(len(projections), len(PROJECTION_STAT_FIELDS)).tolist()
 
-        if live_context is not None:
-            entry.update(
-                compute_remaining_games_fields(
-                    player_id=p.player_id,
-                    player_name=p.player_name,
-                    team=p.team,
-                    projected_games=p.projected_games,
-                    tpm_per_game=p.three_pm,
-                    live_ctx=live_context,
-                )
-            )
+    for p, stats in zip(projections, stat_rows):
+        entry = dict(zip(_PROJECTION_KEYS, (
+            p.player_id, p.player_name, p.team, _get_cd_position(p),
+            *(round(value, decimals) for value, decimals in zip(stats, _PROJECTION_DECIMALS)),
+            _clamp_int(p.consistency, 0, 100),
+        )))
 
-        entries.append(entry)
+        if ros_by_id is not None:
+            entry.update(ros_by_id[p.player_id])
 
-    return entries
+        yield entry
 
 
-def _build_risk_data(
-    contexts: List[PlayerContext],
-    projections: List[SeasonProjection],
-    live_context: Optional[Dict] = None,
-) -> List[dict]:
+def _build_risk_entry(
+    ctx: PlayerContext,
+    proj: Optional[SeasonProjection],
+    composition_risk: float,
+    volatility: int,
+    profile_cache: Dict[tuple, tuple],
+    ros: Optional[dict],
+    injury_code: int,
+) -> dict:
     """
-    Build risk.json entries.
+    Build a risk.json entry.
 
     Backward-compatible fields:
     - injury_risk: 100 - (durability_score * 100)
@@ -175,130 +338,122 @@ def _build_risk_data(
     - composition_risk (0.0-1.0)
     - total_risk (0.0-1.0)
     - risk_level (Low/Medium/High)
-    """
-    proj_map = {p.player_id: p for p in projections}
-    injury_by_id = (live_context or {}).get("injury_by_id", {})
-    injury_by_name = (live_context or {}).get("injury_by_name", {})
-    risk_data = []
 
-    for ctx in contexts:
-        proj = proj_map.get(ctx.player_id)
-        consistency = proj.consistency if proj else 50
-
-        # Injury risk from durability
-        durability = lookup.lookup_durability(ctx.age, ctx.position, ctx.role)
-        if durability is not None:
-            durability_score = durability.get("durability_score", 0.65)
-            injury_risk = int(100 - durability_score * 100)
-        else:
-            injury_risk = 35  # moderate default
-
-        # Volatility = inverse of consistency
-        volatility = 100 - consistency
-
-        # Minutes risk from usage volatility + role
-        usage = lookup.lookup_usage(ctx.age, ctx.position, ctx.role)
-        if usage is not None:
-            vol_label = usage.get("minutes_volatility", "medium")
-            base_risk = {"low": 20, "medium": 50, "high": 80}.get(vol_label, 50)
-        else:
-            base_risk = 50
-
-        # Role modifier: Bench/Scrub inherently riskier
-        role_mod = {"Bench": 15, "Scrub": 20}.get(ctx.role, 0)
-        minutes_risk = base_risk + role_mod
-
-        # Legacy uncertainty components
-        availability_risk = _calculate_availability_risk(ctx, proj, live_context)
-        role_risk = _calculate_role_risk(
-            ctx, proj, availability_risk, injury_by_id, injury_by_name
-        )
-        composition_risk = _calculate_composition_risk(proj)
-        total_risk = (
-            0.60 * availability_risk
-            + 0.25 * role_risk
-            + 0.15 * composition_risk
+    volatility (100 - consistency) comes precomputed for all players; ros is
+    the player's live rest-of-season fields (None offline) and injury_code
+    their INJURY_STATUS_CODES code.
+    profile_cache memoizes durability/usage lookups per (age, position, role)
+    across calls.
+    """
+    profile_key = (ctx.age, ctx.position, ctx.role)
+    profiles = profile_cache.get(profile_key)
+    if profiles is None:
+        profiles = profile_cache[profile_key] = (
+            lookup.lookup_durability(*profile_key),
+            lookup.lookup_usage(*profile_key),
         )
-        risk_level = _classify_risk_level(total_risk)
-
-        risk_data.append({
-            "player_id": ctx.player_id,
-            "name": ctx.player_name,
-            "team": ctx.team,
-            "injury_risk": _clamp_int(injury_risk, 0, 100),
-            "volatility": _clamp_int(volatility, 0, 100),
-            "minutes_risk": _clamp_int(minutes_risk, 0, 100),
-            "availability_risk": round(_clamp_float(availability_risk, 0.0, 1.0), 3),
-            "role_risk": round(_clamp_float(role_risk, 0.0, 1.0), 3),
-            "composition_risk": round(_clamp_float(composition_risk, 0.0, 1.0), 3),
-            "total_risk": round(_clamp_float(total_risk, 0.0, 1.0), 3),
-            "risk_level": risk_level,
-        })
-
-    return risk_data
-
-
-def _build_insights_json(
-    contexts: List[PlayerContext],
-    projections: List[SeasonProjection],
-    auction_map: Dict[str, AuctionValue],
-    risk_map: Dict[str, dict],
-) -> List[dict]:
+    durability, usage = profiles
+
+    # Injury risk from durability
+    if durability is not None:
+        durability_score = durability.get("durability_score", 0.65)
+        injury_risk = int(100 - durability_score * 100)
+    else:
+        injury_risk = 35  # moderate default
+
+    # Minutes risk from usage volatility + role
+    if usage is not None:
+        vol_label = usage.get("minutes_volatility", "medium")
+        base_risk = MINUTES_VOLATILITY_RISK.get(vol_label, 50)
+    else:
+        base_risk = 50
+
+    # Role modifier: Bench/Scrub inherently riskier
+    role_mod = ROLE_MINUTES_RISK.get(ctx.role, 0)
+    minutes_risk = base_risk + role_mod
+
+    # Legacy uncertainty components
+    availability_risk = _calculate_availability_risk(proj, ros)
+    role_risk = _calculate_role_risk(proj, availability_risk, injury_code)
+    total_risk = _total_risk(availability_risk, role_risk, composition_risk)
+    risk_level = _classify_risk_level(total_risk)
+
+    return dict(zip(_RISK_KEYS, (
+        ctx.player_id,
+        ctx.player_name,
+        ctx.team,
+        _clamp_int(injury_risk, 0, 100),
+        _clamp_int(volatility, 0, 100),
+        _clamp_int(minutes_risk, 0, 100),
+        round(_clamp_float(availability_risk, 0.0, 1.0), 3),
+        round(_clamp_float(role_risk, 0.0, 1.0), 3),
+        round(_clamp_float(composition_risk, 0.0, 1.0), 3),
+        round(_clamp_float(total_risk, 0.0, 1.0), 3),
+        risk_level,
+    )))
+
+
+def _build_insight_entry(
+    ctx: PlayerContext,
+    proj: Optional[SeasonProjection],
+    auction: Optional[AuctionValue],
+    value_score: int,
+    opportunity_bonus: int,
+    risk: dict,
+) -> dict:
     """
-    Build insights.json entries.
+    Build an insights.json entry.
 
     value_score: percentile rank of dollar_value
     risk_score: avg of 3 risk metrics
     opportunity_index: high value + low risk composite
     notes: auto-generated one-liner
     """
-    # Compute value percentiles from auction values
-    dollar_values = sorted(
-        [v.dollar_value for v in auction_map.values()], reverse=True
-    )
-    total_players = len(dollar_values)
+    # Risk score: average of 3 risk metrics
+    ir = risk["injury_risk"]
+    vol = risk["volatility"]
+    mr = risk["minutes_risk"]
+    risk_score = int((ir + vol + mr) / 3)
 
-    proj_map = {p.player_id: p for p in projections}
-    insights = []
+    # Opportunity index: value - risk + age/role bonus
+    opp = value_score - risk_score + opportunity_bonus
+    opportunity_index = _clamp_int(int(50 + opp / 2), 0, 100)
 
-    for ctx in contexts:
-        auction = auction_map.get(ctx.player_id)
-        risk = risk_map.get(ctx.player_id, {})
-        proj = proj_map.get(ctx.player_id)
-
-        # Value score: percentile rank
-        if auction and total_players > 0:
-            rank = sum(1 for d in dollar_values if d > auction.dollar_value)
-            value_score = int(100 * (1 - rank / total_players))
-        else:
-            value_score = 50
-
-        # Risk score: average of 3 risk metrics
-        ir = risk.get("injury_risk", 35)
-        vol = risk.get("volatility", 50)
-        mr = risk.get("minutes_risk", 50)
-        risk_score = int((ir + vol + mr) / 3)
-
-        # Opportunity index: value - risk + age bonus + role bonus
-        opp = value_score - risk_score
-        if ctx.age <= 23:
-            opp += 10
-        if ctx.role == "Starter":
-            opp += 5
-        opportunity_index = _clamp_int(int(50 + opp / 2), 0, 100)
-
-        # Notes
-        notes = _generate_note(ctx, proj, auction, value_score, risk_score)
-
-        insights.append({
-            "player_id": ctx.player_id,
-            "value_score": _clamp_int(value_score, 0, 100),
-            "risk_score": _clamp_int(risk_score, 0, 100),
-            "opportunity_index": opportunity_index,
-            "notes": notes,
-        })
-
-    return insights
+    # Notes
+    notes = _generate_note(ctx, proj, auction, value_score, risk_score)
+
+    return {
+        "player_id": ctx.player_id,
+        "value_score": _clamp_int(value_score, 0, 100),
+        "risk_score": _clamp_int(risk_score, 0, 100),
+        "opportunity_index": opportunity_index,
+        "notes": notes,
+    }
+
+
+def _compute_value_scores(
+    contexts: List[PlayerContext],
+    auction_map: Dict[str, AuctionValue],
+) -> List[int]:
+    """
+    Value score per context: int(100 * (1 - rank / N)), where rank counts
+    auction values strictly above the player's. 50 if the player is unpriced.
+    """
+    total_players = len(auction_map)
+    auctions = [auction_map.get(ctx.player_id) for ctx in contexts]
+    if total_players == 0:
+        return [50] * len(contexts)
+
+    sorted_dollars = np.sort(np.fromiter(
+        (v.dollar_value for v in auction_map.values()), dtype=np.float64, count=total_players
+    ))
+    player_dollars = np.array(
+        [a.dollar_value if a else np.nan for a in auctions], dtype=np.float64
+    )
+    rank = total_players - np.searchsorted(sorted_dollars, player_dollars, side="right")
+    scores = (100 * (1 - rank / total_players)).astype(np.int64).tolist()
+
+    return [score if a else 50 for score, a in zip(scores, auctions)]
 
 
 def _generate_note(
@@ -309,32 +464,10 @@ def _generate_note(
     risk_score: int,
 ) -> str:
     """Generate a human-readable one-liner note."""
-    # Value tier
-    if value_score >= 90:
-        val_tier = "Elite"
-    elif value_score >= 70:
-        val_tier = "Strong"
-    elif value_score >= 40:
-        val_tier = "Moderate"
-    else:
-        val_tier = "Low"
-
-    # Risk tier
-    if risk_score < 30:
-        risk_tier = "low risk"
-    elif risk_score < 60:
-        risk_tier = "moderate risk"
-    else:
-        risk_tier = "high risk"
-
-    # Consistency tier
+    val_tier = NOTE_VALUE_TIERS[bisect_right(NOTE_VALUE_EDGES, value_score)]
+    risk_tier = NOTE_RISK_TIERS[bisect_right(NOTE_RISK_EDGES, risk_score)]
     consistency = proj.consistency if proj else 50
-    if consistency >= 70:
-        cons = "elite consistency"
-    elif consistency >= 50:
-        cons = "solid consistency"
-    else:
-        cons = "inconsistent"
+    cons = NOTE_CONSISTENCY_TIERS[bisect_right(NOTE_CONSISTENCY_EDGES, consistency)]
 
     dollar = auction.dollar_value if auction else 1
     return (
@@ -353,34 +486,52 @@ def _clamp_float(value: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, value))
 
 
-def _lookup_injury(
-    ctx: PlayerContext,
-    injury_by_id: Dict[str, dict],
-    injury_by_name: Dict[str, dict],
-) -> Optional[dict]:
-    by_id = injury_by_id.get(str(ctx.player_id))
-    if by_id:
-        return by_id
-    return injury_by_name.get(normalize_name(ctx.player_name))
+def _injury_status_code(injury: dict) -> int:
+    """Map an injury report's free-text status to an INJURY_STATUS_CODES code."""
+    status = str(injury.get("status", "")).lower()
+    for keyword, code in INJURY_STATUS_CODES:
+        if keyword in status:
+            return code
+    return 0
+
+
+def _injury_codes(injuries: Dict[str, dict]) -> Dict[str, int]:
+    """Status code per key. Empty reports are skipped so the name lookup still applies."""
+    return {key: _injury_status_code(injury) for key, injury in injuries.items() if injury}
+
+
+def _context_injury_codes(
+    contexts: List[PlayerContext],
+    live_context: Optional[Dict],
+) -> List[int]:
+    """
+    Injury status code per context, matched by player_id first, then by
+    normalized name. Each report's status is classified once, and a name is
+    only normalized on an id miss when there are name-keyed reports.
+    """
+    codes_by_id = _injury_codes((live_context or {}).get("injury_by_id", {}))
+    codes_by_name = _injury_codes((live_context or {}).get("injury_by_name", {}))
+    if not codes_by_id and not codes_by_name:
+        return [0] * len(contexts)
+
+    codes = []
+    for ctx in contexts:
+        code = codes_by_id.get(str(ctx.player_id))
+        if code is None:
+            code = codes_by_name.get(normalize_name(ctx.player_name), 0) if codes_by_name else 0
+        codes.append(code)
+    return codes
 
 
 def _calculate_availability_risk(
-    ctx: PlayerContext,
     proj: Optional[SeasonProjection],
-    live_context: Optional[Dict],
+    ros: Optional[dict],
 ) -> float:
+    """Share of remaining games the player is projected to miss (ros: live fields)."""
     if proj is None:
         return 0.5
 
-    if live_context is not None:
-        ros = compute_remaining_games_fields(
-            player_id=ctx.player_id,
-            player_name=ctx.player_name,
-            team=ctx.team,
-            projected_games=proj.projected_games,
-            tpm_per_game=proj.three_pm,
-            live_ctx=live_context,
-        )
+    if ros is not None:
         team_games_remaining = ros.get("team_games_remaining", 82)
         games_remaining_projected = ros.get("games_remaining_projected", proj.projected_games)
     else:
@@ -393,67 +544,75 @@ def _calculate_availability_risk(
 
 
 def _calculate_role_risk(
-    ctx: PlayerContext,
     proj: Optional[SeasonProjection],
     availability_risk: float,
-    injury_by_id: Dict[str, dict],
-    injury_by_name: Dict[str, dict],
+    injury_code: int,
 ) -> float:
-    risk_score = 0.0
     minutes = proj.minutes if proj is not None else 25.0
+    consistency = proj.consistency if proj is not None else 75
 
-    if minutes >= 32:
-        risk_score += 0.05
-    elif minutes >= 28:
-        risk_score += 0.12
-    elif minutes >= 22:
-        risk_score += 0.20
-    elif minutes >= 15:
-        risk_score += 0.28
-    else:
-        risk_score += 0.35
-
-    injury = _lookup_injury(ctx, injury_by_id, injury_by_name)
-    if injury:
-        status = str(injury.get("status", "")).lower()
-        if "out" in status:
-            risk_score += 0.25
-        elif "doubtful" in status:
-            risk_score += 0.20
-        elif "questionable" in status:
-            risk_score += 0.12
-        elif "probable" in status or "day-to-day" in status:
-            risk_score += 0.05
+    injury_bump = INJURY_CODE_BUMP.get(injury_code, 0.0)
 
-    risk_score += _clamp_float(availability_risk, 0.0, 1.0) * 0.25
+    return _role_risk_score(minutes, injury_bump, availability_risk, consistency)
 
-    consistency = proj.consistency if proj is not None else 75
+
+def _role_risk_score(
+    minutes: float,
+    injury_bump: float,
+    availability_risk: float,
+    consistency: float,
+) -> float:
+    """Role risk from flat scalars: minutes tier + injury + availability + consistency."""
+    risk_score = ROLE_MINUTES_TIER_RISK[bisect_right(ROLE_MINUTES_TIER_EDGES, minutes)]
+    risk_score += injury_bump
+    risk_score += _clamp_float(availability_risk, 0.0, 1.0) * 0.25
     risk_score += ((100 - consistency) / 100.0) * 0.15
 
     return _clamp_float(risk_score, 0.0, 1.0)
 
 
-def _calculate_composition_risk(proj: Optional[SeasonProjection]) -> float:
-    if proj is None:
-        return 0.5
+def _composition_risks(projections: List[Optional[SeasonProjection]]) -> List[float]:
+    """
+    Composition risk for every projection in one NumPy pass (0.5 for None).
 
-    points_fp = max(0.0, proj.points * 1.0)
-    rebounds_fp = max(0.0, proj.rebounds * 1.2)
-    assists_fp = max(0.0, proj.assists * 1.5)
-    steals_fp = max(0.0, proj.steals * 3.0)
-    blocks_fp = max(0.0, proj.blocks * 3.0)
-    three_pm_fp = max(0.0, proj.three_pm * 1.0)
+    Share of positive fantasy output coming from high-variance stats
+    (steals, blocks, threes) blended with reliance on a single category.
+    """
+    stats = np.array(
+        [
+            (p.points, p.rebounds, p.assists, p.steals, p.blocks, p.three_pm)
+            if p is not None else (0.0,) * 6
+            for p in projections
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 6)
+    fp = np.maximum(0.0, stats * COMPOSITION_FP_WEIGHTS)
+    points_fp, rebounds_fp, assists_fp, steals_fp, blocks_fp, three_pm_fp = fp.T
 
     total_positive_fp = points_fp + rebounds_fp + assists_fp + steals_fp + blocks_fp
-    if total_positive_fp <= 0:
-        return 0.5
-
     high_variance_fp = steals_fp + blocks_fp + (three_pm_fp * 2.0)
-    high_variance_ratio = high_variance_fp / total_positive_fp
-    dependency_ratio = max(
-        points_fp, rebounds_fp, assists_fp, steals_fp, blocks_fp
-    ) / total_positive_fp
-    return _clamp_float((high_variance_ratio * 0.6) + (dependency_ratio * 0.4), 0.0, 1.0)
+    top_category_fp = fp[:, :5].max(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        high_variance_ratio = high_variance_fp / total_positive_fp
+        dependency_ratio = top_category_fp / total_positive_fp
+        risk = np.clip((high_variance_ratio * 0.6) + (dependency_ratio * 0.4), 0.0, 1.0)
+
+    # No positive production (or no projection) → neutral 0.5
+    return np.where(total_positive_fp > 0, risk, 0.5).tolist()
+
+
+def _total_risk(
+    availability_risk: float,
+    role_risk: float,
+    composition_risk: float,
+) -> float:
+    """Weighted blend of the three uncertainty components."""
+    return (
+        0.60 * availability_risk
+        + 0.25 * role_risk
+        + 0.15 * composition_risk
+    )
 
 
 def _classify_risk_level(total_risk: float) -> str:
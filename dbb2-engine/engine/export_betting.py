@@ -4,8 +4,8 @@ Export projections in the betting engine contract format.
 Mirrors the /projections/today API response but writes to a JSON file
 so GitHub Actions can consume it without running the FastAPI server.
 
-Uses the same std_dev/confidence logic as engine/api.py but avoids
-importing from api.py to prevent circular imports.
+Shares the std_dev/confidence logic with engine/api.py via engine/props.py
+(api.py itself is not imported, to prevent circular imports).
 
 When game_day_projections are provided, exports adjusted values with
 full adjustment breakdown. Backward compatible — omitting game_day
@@ -13,64 +13,48 @@ projections produces the same output as before.
 """
 
 import json
-import math
+import os
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from engine.baseline import PlayerContext
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional speedup — stdlib json is the fallback
+    orjson = None
+
+from data_collection.utils import atomic_write
+from engine.baseline import PlayerContext, index_contexts
 from engine.projections import SeasonProjection
 from engine.game_day import GameDayProjection
+from engine.props import get_confidences, get_std_devs
+
+# (engine stat, betting engine prop name, GameDayProjection attribute)
+_PROP_STATS = (
+    ("points", "points", "points"),
+    ("rebounds", "rebounds", "rebounds"),
+    ("assists", "assists", "assists"),
+    ("three_pm", "threes", "three_pm"),
+    ("steals", "steals", "steals"),
+    ("blocks", "blocks", "blocks"),
+)
+_ENGINE_STATS = tuple(stat for stat, _, _ in _PROP_STATS)
+
+# All six stat values of a SeasonProjection / GameDayProjection in one call
+_SEASON_STAT_GETTER = attrgetter(*_ENGINE_STATS)
+_GAME_DAY_STAT_GETTER = attrgetter(*(gd_attr for _, _, gd_attr in _PROP_STATS))
 
-# Same mappings as engine/api.py
-STAT_MAP = {
-    "points": "pts",
-    "rebounds": "reb",
-    "assists": "ast",
-    "three_pm": "fg3m",
-    "steals": "stl",
-    "blocks": "blk",
-}
-
-VARIANCE_KEY_MAP = {
-    "points": "points_variance",
-    "rebounds": "rebounds_variance",
-    "assists": "assists_variance",
-    "three_pm": "three_pm_variance",
-    "steals": "steals_variance",
-    "blocks": "blocks_variance",
-}
-
-# Maps engine stat names to GameDayProjection attribute names
-_GD_STAT_ATTR = {
-    "points": "points",
-    "rebounds": "rebounds",
-    "assists": "assists",
-    "three_pm": "three_pm",
-    "steals": "steals",
-    "blocks": "blocks",
-}
-
-
-def _get_std_dev(ctx: PlayerContext, stat: str) -> float:
-    """Get std_dev for a stat from PlayerContext.stat_variance."""
-    var_key = VARIANCE_KEY_MAP.get(stat)
-    if var_key is None:
-        return 0.0
-    variance = ctx.stat_variance.get(var_key, 0.0)
-    return math.sqrt(max(variance, 0.0))
-
-
-def _get_confidence(
-    projection_value: float,
-    std_dev: float,
-    base_confidence: float,
-) -> float:
-    """Derive per-stat confidence from consistency and coefficient of variation."""
-    if projection_value <= 0 or std_dev <= 0:
-        return round(max(0.40, base_confidence * 0.8), 2)
-    cv = std_dev / projection_value
-    conf = base_confidence * (1 - min(cv, 0.5))
-    return round(max(0.40, min(0.95, conf)), 2)
+
+def _round_rows(values: np.ndarray, ndigits: int) -> List[List[float]]:
+    """
+    values.tolist() with each value passed through built-in round().
+
+    Not np.round: it scales by 10**ndigits first, so values on a half step
+    can round the other way (0.45 -> 0.4 where round() gives 0.5).
+    """
+    return [[round(v, ndigits) for v in row] for row in values.tolist()]
 
 
 def export_betting_contract(
@@ -78,6 +62,8 @@ def export_betting_contract(
     projections: List[SeasonProjection],
     game_day_projections: Optional[List[GameDayProjection]] = None,
     output_dir: str = "output",
+    ctx_map: Optional[Dict[str, PlayerContext]] = None,
+    gd_map: Optional[Dict[str, GameDayProjection]] = None,
 ) -> str:
     """
     Write output/betting_contract.json matching the betting engine's expected shape.
@@ -89,51 +75,64 @@ def export_betting_contract(
 
     Output format (normalized for odds_ingestion.py --from-file):
     { player_id: { name, team, position, is_b2b, props: { stat: { projection, std_dev, confidence } } } }
+
+    Callers exporting several projection sets from the same contexts can pass
+    prebuilt ctx_map (see index_contexts) and gd_map to skip rebuilding them.
     """
-    out_path = Path(output_dir)
-    out_path.mkdir(parents=True, exist_ok=True)
+    # Scheduled runs write into an existing directory; skip the mkdir there
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+
+    if ctx_map is None:
+        ctx_map = index_contexts(contexts)
+    if gd_map is None:
+        gd_map = {g.player_id: g for g in game_day_projections or ()}
+
+    # Players with a context, in projection order
+    paired = [(ctx_map[p.player_id], p) for p in projections if p.player_id in ctx_map]
+    n = len(paired)
+
+    # std_dev and confidence for every (player, stat) in one vectorized pass;
+    # columns follow _PROP_STATS order
+    season_vals = np.array(
+        [_SEASON_STAT_GETTER(proj) for _, proj in paired],
+        dtype=np.float64,
+    ).reshape(n, len(_ENGINE_STATS))
+    std_devs = get_std_devs([ctx for ctx, _ in paired], _ENGINE_STATS)
+    base_conf = np.fromiter((proj.consistency for _, proj in paired), dtype=np.float64, count=n) / 100.0
+    confidences = get_confidences(season_vals, std_devs, base_conf)
+
+    # Game-day adjusted values where available, season values otherwise
+    gd_rows = [gd_map.get(proj.player_id) for _, proj in paired]
+    projection_vals = season_vals.copy()
+    for i, gd in enumerate(gd_rows):
+        if gd is not None:
+            projection_vals[i] = _GAME_DAY_STAT_GETTER(gd)
 
-    ctx_map = {c.player_id: c for c in contexts}
-    gd_map = {}
-    if game_day_projections:
-        gd_map = {g.player_id: g for g in game_day_projections}
+    # Confidences come back rounded already
+    season_rows = _round_rows(season_vals, 1)
+    projection_rows = _round_rows(projection_vals, 1)
+    std_rows = _round_rows(std_devs, 2)
+    conf_rows = confidences.tolist()
 
     result = {}
 
-    for proj in projections:
-        ctx = ctx_map.get(proj.player_id)
-        if ctx is None:
-            continue
-
-        gd = gd_map.get(proj.player_id)
-        base_conf = proj.consistency / 100.0
+    for i, (ctx, proj) in enumerate(paired):
+        gd = gd_rows[i]
+        season_row = season_rows[i]
+        projection_row = projection_rows[i]
+        std_row = std_rows[i]
+        conf_row = conf_rows[i]
         props = {}
 
-        for engine_stat, short_name in STAT_MAP.items():
-            season_val = getattr(proj, engine_stat, 0.0)
-            std_dev = _get_std_dev(ctx, engine_stat)
-            confidence = _get_confidence(season_val, std_dev, base_conf)
-
-            # Map short names to betting engine prop names
-            prop_name = {
-                "pts": "points", "reb": "rebounds", "ast": "assists",
-                "fg3m": "threes", "stl": "steals", "blk": "blocks",
-            }[short_name]
-
+        for k, (_, prop_name, _) in enumerate(_PROP_STATS):
             prop_entry = {
-                "std_dev": round(std_dev, 2),
-                "confidence": confidence,
+                "std_dev": std_row[k],
+                "confidence": conf_row[k],
+                "projection": projection_row[k],
             }
-
             if gd is not None:
-                # Use game-day adjusted value as the projection
-                gd_attr = _GD_STAT_ATTR.get(engine_stat, engine_stat)
-                adjusted_val = getattr(gd, gd_attr, season_val)
-                prop_entry["projection"] = round(adjusted_val, 1)
-                prop_entry["season_projection"] = round(season_val, 1)
-            else:
-                prop_entry["projection"] = round(season_val, 1)
-
+                prop_entry["season_projection"] = season_row[k]
             props[prop_name] = prop_entry
 
         entry = {
@@ -158,8 +157,16 @@ def export_betting_contract(
 
         result[ctx.player_id] = entry
 
-    file_path = out_path / "betting_contract.json"
-    with open(file_path, "w") as f:
-        json.dump(result, f, indent=2)
+    file_path = os.path.join(output_dir, "betting_contract.json")
+    atomic_write(Path(file_path), lambda tmp_path: _dump_contract(result, tmp_path))
+    return file_path
+
 
-    return str(file_path)
+def _dump_contract(result: dict, path: str) -> None:
+    """Write the contract JSON to path (encoded with orjson when installed)."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w") as f:
+            json.dump(result, f, indent=2)
@@ -7,10 +7,17 @@ and compound-clamped to [0.50, 1.50].
 """
 
 from dataclasses import dataclass
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List
+
+import numpy as np
 
 from engine.baseline import PlayerContext
-from engine.projections import SeasonProjection, _calculate_fantasy_points
+from engine.projections import (
+    FANTASY_POINT_WEIGHTS,
+    SeasonProjection,
+    _DATACLASS_SLOTS,
+)
 from engine import lookup
 
 COMPOUND_MIN = 0.50
@@ -33,8 +40,18 @@ SCORING_STATS = [
     "ftm", "fta",
 ]
 
+# Column order of the per-game stat matrix in project_game_day_batch
+GAME_DAY_STATS = [
+    "minutes", "points", "rebounds", "assists", "steals", "blocks",
+    "turnovers", "fgm", "fga", "three_pm", "three_pa", "ftm", "fta",
+]
+_MATCHUP_COLUMNS = [GAME_DAY_STATS.index(stat) for stat in MATCHUP_STAT_MAP]
+_FANTASY_POINT_COLUMNS = [
+    (GAME_DAY_STATS.index(stat), weight) for stat, weight in FANTASY_POINT_WEIGHTS
+]
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class GameDayProjection:
     """A single-game projection with DFS context applied."""
     player_id: str = ""
@@ -94,41 +111,29 @@ def project_game_day(
     # Overall fantasy_pts_multiplier from matchup data
     matchup_overall = matchup_data.get("fantasy_pts_multiplier", 1.0)
 
+    # Schedule + city + death spot, shared by every compound below
+    scd_mult = sched_mult * city_mult * death_spot_mult
+    scd_compound = _clamp_compound(scd_mult)
+
     # Compound clamp for the overall multiplier
-    compound = max(COMPOUND_MIN, min(COMPOUND_MAX, sched_mult * city_mult * death_spot_mult * matchup_overall))
-
-    # Build adjusted stats
-    stats = {
-        "minutes_played": season_proj.minutes * max(COMPOUND_MIN, min(COMPOUND_MAX, sched_mult * city_mult * death_spot_mult)),
-        "points": season_proj.points,
-        "rebounds": season_proj.rebounds,
-        "assists": season_proj.assists,
-        "steals": season_proj.steals,
-        "blocks": season_proj.blocks,
-        "turnovers": season_proj.turnovers,
-        "fgm": season_proj.fgm,
-        "fga": season_proj.fga,
-        "three_pm": season_proj.three_pm,
-        "three_pa": season_proj.three_pa,
-        "ftm": season_proj.ftm,
-        "fta": season_proj.fta,
-    }
-
-    # Apply per-stat matchup multipliers where available
-    for stat, mult_key in MATCHUP_STAT_MAP.items():
-        stat_mult = matchup_data.get(mult_key, 1.0)
-        # Combine with schedule + city + death spot for a per-stat compound
-        per_stat_compound = max(COMPOUND_MIN, min(COMPOUND_MAX, sched_mult * city_mult * death_spot_mult * stat_mult))
-        stats[stat] = stats[stat] * per_stat_compound
+    compound = _clamp_compound(scd_mult * matchup_overall)
 
-    # Apply schedule+city to non-matchup scoring stats
-    for stat in ("turnovers", "fgm", "fga", "three_pa", "ftm", "fta"):
-        if stat not in MATCHUP_STAT_MAP:
-            sc_compound = max(COMPOUND_MIN, min(COMPOUND_MAX, sched_mult * city_mult * death_spot_mult))
-            stats[stat] = stats[stat] * sc_compound
+    # Per-game stats in GAME_DAY_STATS order: minutes and non-matchup stats
+    # scale by scd_compound, matchup stats by their own per-stat compound.
+    # A 13-element row is cheaper as a plain list than as an ndarray.
+    multipliers = [scd_compound] * len(GAME_DAY_STATS)
+    for col, mult_key in zip(_MATCHUP_COLUMNS, MATCHUP_STAT_MAP.values()):
+        stat_mult = matchup_data.get(mult_key, 1.0)
+        multipliers[col] = _clamp_compound(scd_mult * stat_mult)
+    stats = [
+        getattr(season_proj, stat) * mult
+        for stat, mult in zip(GAME_DAY_STATS, multipliers)
+    ]
 
     # Recalculate fantasy points from adjusted stats
-    fp = _calculate_fantasy_points(stats)
+    fp = 0.0
+    for col, weight in _FANTASY_POINT_COLUMNS:
+        fp += stats[col] * weight
 
     # Adjusted ceiling/floor
     ceiling = season_proj.ceiling * compound
@@ -141,19 +146,7 @@ def project_game_day(
         position=ctx.position,
         opponent=ctx.opponent_team,
         location=ctx.location,
-        minutes=max(0.0, stats["minutes_played"]),
-        points=max(0.0, stats["points"]),
-        rebounds=max(0.0, stats["rebounds"]),
-        assists=max(0.0, stats["assists"]),
-        steals=max(0.0, stats["steals"]),
-        blocks=max(0.0, stats["blocks"]),
-        turnovers=max(0.0, stats["turnovers"]),
-        fgm=max(0.0, stats["fgm"]),
-        fga=max(0.0, stats["fga"]),
-        three_pm=max(0.0, stats["three_pm"]),
-        three_pa=max(0.0, stats["three_pa"]),
-        ftm=max(0.0, stats["ftm"]),
-        fta=max(0.0, stats["fta"]),
+        **{stat: max(0.0, value) for stat, value in zip(GAME_DAY_STATS, stats)},
         fantasy_points=max(0.0, fp),
         ceiling=max(0.0, ceiling),
         floor=max(0.0, floor),
@@ -165,6 +158,115 @@ def project_game_day(
     )
 
 
+def project_game_day_batch(
+    contexts: List[PlayerContext],
+    season_projs: List[SeasonProjection],
+) -> List[GameDayProjection]:
+    """
+    project_game_day for many players at once (paired element-wise, like zip).
+
+    Multipliers are still looked up per player, but the compound clamps,
+    per-stat scaling and fantasy points run as NumPy column operations in the
+    same order as project_game_day, so results are identical.
+    """
+    pairs = list(zip(contexts, season_projs))
+    n = len(pairs)
+
+    sched = np.fromiter((_get_schedule_multiplier(c) for c, _ in pairs), dtype=np.float64, count=n)
+    city = np.fromiter((_get_city_multiplier(c) for c, _ in pairs), dtype=np.float64, count=n)
+    death_spot = np.fromiter((_get_death_spot_multiplier(c) for c, _ in pairs), dtype=np.float64, count=n)
+    matchups = [_get_matchup_multipliers(c) for c, _ in pairs]
+    matchup_overall = np.fromiter(
+        (m.get("fantasy_pts_multiplier", 1.0) for m in matchups), dtype=np.float64, count=n
+    )
+    stat_mults = np.array(
+        [[m.get(key, 1.0) for key in MATCHUP_STAT_MAP.values()] for m in matchups],
+        dtype=np.float64,
+    ).reshape(n, len(MATCHUP_STAT_MAP))
+
+    # Schedule + city + death spot, and the compounds built on it
+    scd_mult = sched * city * death_spot
+    scd_compound = np.clip(scd_mult, COMPOUND_MIN, COMPOUND_MAX)
+    compound = scd_mult * matchup_overall
+    np.clip(compound, COMPOUND_MIN, COMPOUND_MAX, out=compound)
+
+    # Minutes and non-matchup stats scale by scd_compound; matchup stats by
+    # their own per-stat compound
+    multipliers = np.repeat(scd_compound[:, np.newaxis], len(GAME_DAY_STATS), axis=1)
+    stat_mults *= scd_mult[:, np.newaxis]
+    multipliers[:, _MATCHUP_COLUMNS] = np.clip(stat_mults, COMPOUND_MIN, COMPOUND_MAX, out=stat_mults)
+    stats = np.array(
+        [[getattr(p, stat) for stat in GAME_DAY_STATS] for _, p in pairs],
+        dtype=np.float64,
+    ).reshape(n, len(GAME_DAY_STATS)) * multipliers
+
+    fp = _fantasy_points_matrix(stats)
+
+    ceilings = np.fromiter((p.ceiling for _, p in pairs), dtype=np.float64, count=n) * compound
+    floors = np.fromiter((p.floor for _, p in pairs), dtype=np.float64, count=n) * compound
+
+    rows = zip(
+        pairs,
+        np.maximum(stats, 0.0).tolist(),
+        np.maximum(fp, 0.0).tolist(),
+        np.maximum(ceilings, 0.0).tolist(),
+        np.maximum(floors, 0.0).tolist(),
+        sched.tolist(),
+        city.tolist(),
+        death_spot.tolist(),
+        matchup_overall.tolist(),
+        compound.tolist(),
+    )
+    return [
+        GameDayProjection(
+            player_id=ctx.player_id,
+            player_name=ctx.player_name,
+            team=ctx.team,
+            position=ctx.position,
+            opponent=ctx.opponent_team,
+            location=ctx.location,
+            **dict(zip(GAME_DAY_STATS, stat_row)),
+            fantasy_points=fp_val,
+            ceiling=ceiling,
+            floor=floor,
+            schedule_multiplier=sched_val,
+            city_multiplier=city_val,
+            death_spot_multiplier=death_spot_val,
+            matchup_multiplier=matchup_val,
+            compound_multiplier=compound_val,
+        )
+        for (ctx, _), stat_row, fp_val, ceiling, floor, sched_val, city_val,
+            death_spot_val, matchup_val, compound_val in rows
+    ]
+
+
+def _clamp_compound(value: float) -> float:
+    """
+    Clamp a compound multiplier to [COMPOUND_MIN, COMPOUND_MAX].
+
+    Plain comparisons rather than max(min(...)): no builtin calls,
+    and NaN passes through as it does with np.clip in the batch path.
+    """
+    if value < COMPOUND_MIN:
+        return COMPOUND_MIN
+    if value > COMPOUND_MAX:
+        return COMPOUND_MAX
+    return value
+
+
+def _fantasy_points_matrix(stats: np.ndarray) -> np.ndarray:
+    """
+    _calculate_fantasy_points for every row of a GAME_DAY_STATS matrix.
+
+    Terms are added in the same order as the scalar version, so each row
+    matches it exactly.
+    """
+    fp = np.zeros(stats.shape[0], dtype=np.float64)
+    for col, weight in _FANTASY_POINT_COLUMNS:
+        fp += stats[:, col] * weight
+    return fp
+
+
 def _get_schedule_multiplier(ctx: PlayerContext) -> float:
     """
     B2B → scoring dropoff. Rest ≥ 3 days → scoring boost. Otherwise 1.0.
@@ -230,17 +332,9 @@ def _get_death_spot_multiplier(ctx: PlayerContext) -> float:
     """
     if not ctx.is_death_spot:
         return 1.0
-
-    effect = lookup.lookup_death_spot_effect(ctx.age_bracket, ctx.position, ctx.role)
-    if effect is None:
-        return 1.0
-
-    field = _DEATH_SPOT_TYPE_TO_FIELD.get(ctx.death_spot_type)
-    if field is None:
-        return 1.0
-
-    val = effect.get(field)
-    return val if val is not None else 1.0
+    return _cached_death_spot_multiplier(
+        ctx.age_bracket, ctx.position, ctx.role, ctx.death_spot_type
+    )
 
 
 def _get_matchup_multipliers(ctx: PlayerContext) -> Dict[str, float]:
@@ -258,3 +352,30 @@ def _get_matchup_multipliers(ctx: PlayerContext) -> Dict[str, float]:
     if result is not None:
         return result
     return lookup.NEUTRAL_MATCHUP
+
+
+# --------------------------------------------------------------------------
+# Memoized death-spot multiplier
+#
+# engine.lookup already memoizes the bracket-keyed tables; this caches the
+# final multiplier per death_spot_type on top, so the field mapping and None
+# handling run once per key.
+# --------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def _cached_death_spot_multiplier(
+    age_bracket: str,
+    pos: str,
+    role: str,
+    death_spot_type: str,
+) -> float:
+    effect = lookup.lookup_death_spot_effect(age_bracket, pos, role)
+    if effect is None:
+        return 1.0
+
+    field = _DEATH_SPOT_TYPE_TO_FIELD.get(death_spot_type)
+    if field is None:
+        return 1.0
+
+    val = effect.get(field)
+    return val if val is not None else 1.0
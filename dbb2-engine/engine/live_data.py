@@ -2,6 +2,8 @@
 Live-data helpers used to enrich projection export fields.
 """
 
+import re
+from functools import lru_cache
 from math import floor
 from typing import Dict, List, Tuple
 
@@ -10,27 +12,58 @@ from data_collection.fetch_real_players import fetch_team_games_played
 from engine.season import format_nba_season, get_current_nba_season_start_year
 
 
+def _keyword_re(*keywords: str) -> re.Pattern:
+    """One compiled alternation: matches iff any keyword is a substring."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Injury details / injury_type keyword tiers for calculate_injury_modifier
+_SEASON_ENDING_RE = _keyword_re(
+    "acl",
+    "out for season",
+    "season-ending",
+    "torn acl",
+    "achilles",
+    "season-ending surgery",
+    "out for the season",
+    "rest of the season",
+)
+_EXTENDED_ABSENCE_RE = _keyword_re(
+    "indefinitely", "no timetable", "extended absence", "multiple weeks", "out several weeks"
+)
+_WEEKS_RE = _keyword_re("week", "weeks", "re-evaluated", "reevaluated", "2 weeks", "3 weeks", "4 weeks")
+_RULED_OUT_RE = _keyword_re("will not play", "ruled out", "out for", "sidelined for")
+_GAME_DAY_RE = _keyword_re(
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday", "tonight", "today"
+)
+
+
+_NAME_SUFFIX_RE = re.compile(r" (?:Jr\.|Sr\.|III)")
+
+
+@lru_cache(maxsize=8192)
 def normalize_name(name: str) -> str:
-    return (
-        (name or "")
-        .replace(" Jr.", "")
-        .replace(" Sr.", "")
-        .replace(" III", "")
-        .strip()
-        .lower()
-    )
+    return _NAME_SUFFIX_RE.sub("", name or "").strip().lower()
 
 
 def build_injury_lookup(injuries: List[Dict]) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+    """
+    Index injury reports by player id and normalized name.
+
+    Each stored record is a shallow copy carrying its precomputed
+    "_modifier" (see _injury_availability_modifier), so per-player lookups
+    skip the keyword scans.
+    """
     by_id: Dict[str, Dict] = {}
     by_name: Dict[str, Dict] = {}
     for injury in injuries:
+        record = {**injury, "_modifier": _injury_availability_modifier(injury)}
         pid = str(injury.get("player_id", "")).strip()
         if pid:
-            by_id[pid] = injury
+            by_id[pid] = record
         name_key = normalize_name(injury.get("name", ""))
         if name_key:
-            by_name[name_key] = injury
+            by_name[name_key] = record
     return by_id, by_name
 
 
@@ -40,34 +73,34 @@ def calculate_injury_modifier(
     injury_by_id: Dict[str, Dict],
     injury_by_name: Dict[str, Dict],
 ) -> float:
-    injury = injury_by_id.get(str(player_id)) or injury_by_name.get(normalize_name(player_name))
+    # Only normalize the name when the id misses and there are name keys
+    injury = injury_by_id.get(str(player_id))
+    if not injury and injury_by_name:
+        injury = injury_by_name.get(normalize_name(player_name))
     if not injury:
         return 1.0
 
+    # Records from build_injury_lookup carry their modifier already
+    modifier = injury.get("_modifier")
+    if modifier is None:
+        modifier = _injury_availability_modifier(injury)
+    return modifier
+
+
+def _injury_availability_modifier(injury: Dict) -> float:
+    """Share of remaining games an injury report leaves the player available for."""
     status = str(injury.get("status", "")).lower()
     injury_type = str(injury.get("injury_type", "")).lower()
     details = str(injury.get("details", "")).lower()
 
-    season_ending_keywords = (
-        "acl",
-        "out for season",
-        "season-ending",
-        "torn acl",
-        "achilles",
-        "season-ending surgery",
-        "out for the season",
-        "rest of the season",
-    )
-    if any(k in injury_type or k in details for k in season_ending_keywords):
+    if _SEASON_ENDING_RE.search(injury_type) or _SEASON_ENDING_RE.search(details):
         return 0.0
 
-    if any(k in details for k in ("indefinitely", "no timetable", "extended absence", "multiple weeks", "out several weeks")):
+    if _EXTENDED_ABSENCE_RE.search(details):
         return 0.50
-    if any(k in details for k in ("week", "weeks", "re-evaluated", "reevaluated", "2 weeks", "3 weeks", "4 weeks")):
+    if _WEEKS_RE.search(details):
         return 0.75
-    if any(k in details for k in ("will not play", "ruled out", "out for", "sidelined for")) and any(
-        d in details for d in ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday", "tonight", "today")
-    ):
+    if _RULED_OUT_RE.search(details) and _GAME_DAY_RE.search(details):
         return 0.85
     if "day-to-day" in status or "questionable" in status:
         return 0.95
@@ -5,8 +5,13 @@ All 12 static data dictionaries are loaded at module level (one-time cost).
 Lookup functions try the exact key first, then progressively broader keys.
 No lookup can crash the pipeline — every function returns either a valid
 dict or None (callers use neutral defaults).
+
+Bracket-keyed, matchup and position lookups are memoized: their whole key
+space is small and the tables are static. Returned dicts are shared with
+the static tables (and across calls) and must be treated as read-only.
 """
 
+from functools import lru_cache
 from typing import Optional, Dict, Tuple
 
 # --------------------------------------------------------------------------
@@ -43,9 +48,21 @@ _ERA_MAP = {
 
 ROLE_FALLBACK = ["Starter", "Rotation", "Bench", "Scrub"]
 
+# ROLE_FALLBACK minus each role, for the "try other roles" steps; roles
+# outside ROLE_FALLBACK try every role
+_OTHER_ROLES = {
+    role: tuple(alt_role for alt_role in ROLE_FALLBACK if alt_role != role)
+    for role in ROLE_FALLBACK
+}
+_ALL_ROLES = tuple(ROLE_FALLBACK)
+
 # Bracket fallback order
 BRACKET_FALLBACK = ["Prime", "Young", "Veteran"]
 
+# Age offsets probed by _fallback_age_keyed: same role first, then any role
+_NEAR_AGE_OFFSETS = (-1, 1, -2, 2)
+_WIDE_AGE_OFFSETS = (-5, -4, -3, 3, 4, 5)
+
 
 # --------------------------------------------------------------------------
 # Generic fallback helpers
@@ -72,24 +89,22 @@ def _fallback_age_keyed(
         return data[key]
 
     # 2. Adjacent ages, same pos/role
-    for offset in (-1, 1, -2, 2):
+    for offset in _NEAR_AGE_OFFSETS:
         neighbor = (age + offset, pos, role)
         if neighbor in data:
             return data[neighbor]
 
     # 3. Same age/pos, different role
-    for alt_role in ROLE_FALLBACK:
-        if alt_role != role:
-            alt_key = (age, pos, alt_role)
-            if alt_key in data:
-                return data[alt_key]
+    for alt_role in _OTHER_ROLES.get(role, _ALL_ROLES):
+        alt_key = (age, pos, alt_role)
+        if alt_key in data:
+            return data[alt_key]
 
     # 4. Wider age search ±5, any role
-    for age_off in range(-5, 6):
-        if age_off in (0, -1, 1, -2, 2):
-            continue  # already tried
-        for alt_role in ROLE_FALLBACK:
-            wide_key = (age + age_off, pos, alt_role)
+    for age_off in _WIDE_AGE_OFFSETS:
+        wide_age = age + age_off
+        for alt_role in _ALL_ROLES:
+            wide_key = (wide_age, pos, alt_role)
             if wide_key in data:
                 return data[wide_key]
 
@@ -116,17 +131,17 @@ def _fallback_bracket_keyed(
         return data[key]
 
     # 2. Same bracket/pos, different role
-    for alt_role in ROLE_FALLBACK:
-        if alt_role != role:
-            alt_key = (age_bracket, pos, alt_role)
-            if alt_key in data:
-                return data[alt_key]
+    for alt_role in _OTHER_ROLES.get(role, _ALL_ROLES):
+        alt_key = (age_bracket, pos, alt_role)
+        if alt_key in data:
+            return data[alt_key]
 
     # 3. Try other brackets, same pos
+    roles = (role,) + _OTHER_ROLES.get(role, _ALL_ROLES)
     for bracket in BRACKET_FALLBACK:
         if bracket == age_bracket:
             continue
-        for alt_role in [role] + ROLE_FALLBACK:
+        for alt_role in roles:
             fb_key = (bracket, pos, alt_role)
             if fb_key in data:
                 return data[fb_key]
@@ -134,6 +149,49 @@ def _fallback_bracket_keyed(
     return None
 
 
+# --------------------------------------------------------------------------
+# Resolved age-keyed tables
+#
+# The age-keyed tables are static, so the fallback chain for every
+# (age, pos, role) a player can realistically have is resolved once at
+# import; lookups in that range are a single dict probe. Keys outside it
+# walk the chain at call time.
+# --------------------------------------------------------------------------
+
+RESOLVED_AGES = range(18, 46)
+
+_UNRESOLVED = object()
+
+
+def _resolve_age_keyed(data: dict, fallback: Optional[dict] = None) -> Dict[Tuple[int, str, str], Optional[dict]]:
+    """
+    Precompute _fallback_age_keyed over RESOLVED_AGES × positions × ROLE_FALLBACK,
+    optionally retrying `fallback` on a miss.
+    """
+    positions = {pos for _, pos, _ in data}
+    if fallback is not None:
+        positions |= {pos for _, pos, _ in fallback}
+
+    resolved = {}
+    for age in RESOLVED_AGES:
+        for pos in positions:
+            for role in ROLE_FALLBACK:
+                result = _fallback_age_keyed(data, age, pos, role)
+                if result is None and fallback is not None:
+                    result = _fallback_age_keyed(fallback, age, pos, role)
+                resolved[(age, pos, role)] = result
+    return resolved
+
+
+_RESOLVED_AGE_PROFILES = {
+    era: _resolve_age_keyed(data, None if data is AGE_PROFILES_OVERALL else AGE_PROFILES_OVERALL)
+    for era, data in _ERA_MAP.items()
+}
+_RESOLVED_CEILING = _resolve_age_keyed(CEILING_PROFILES)
+_RESOLVED_DURABILITY = _resolve_age_keyed(DURABILITY_PROFILES)
+_RESOLVED_USAGE = _resolve_age_keyed(USAGE_PROFILES)
+
+
 # --------------------------------------------------------------------------
 # Typed lookup functions
 # --------------------------------------------------------------------------
@@ -145,11 +203,17 @@ def lookup_age_profile(
     era: str = "overall",
 ) -> Optional[dict]:
     """Look up age profile with fallback chain. Falls through eras if needed."""
+    resolved = _RESOLVED_AGE_PROFILES.get(era, _RESOLVED_AGE_PROFILES["overall"])
+    result = resolved.get((age, pos, role), _UNRESOLVED)
+    if result is not _UNRESOLVED:
+        return result
+
     data = _ERA_MAP.get(era, AGE_PROFILES_OVERALL)
     result = _fallback_age_keyed(data, age, pos, role)
 
-    # If non-overall era missed, try overall as final fallback
-    if result is None and era != "overall":
+    # If another era table missed, try overall as final fallback
+    # (unknown eras already searched overall above)
+    if result is None and data is not AGE_PROFILES_OVERALL:
         result = _fallback_age_keyed(AGE_PROFILES_OVERALL, age, pos, role)
 
     return result
@@ -161,6 +225,9 @@ def lookup_ceiling_profile(
     role: str,
 ) -> Optional[dict]:
     """Look up ceiling profile with age-keyed fallback."""
+    result = _RESOLVED_CEILING.get((age, pos, role), _UNRESOLVED)
+    if result is not _UNRESOLVED:
+        return result
     return _fallback_age_keyed(CEILING_PROFILES, age, pos, role)
 
 
@@ -170,6 +237,9 @@ def lookup_durability(
     role: str,
 ) -> Optional[dict]:
     """Look up durability profile with age-keyed fallback."""
+    result = _RESOLVED_DURABILITY.get((age, pos, role), _UNRESOLVED)
+    if result is not _UNRESOLVED:
+        return result
     return _fallback_age_keyed(DURABILITY_PROFILES, age, pos, role)
 
 
@@ -179,9 +249,13 @@ def lookup_usage(
     role: str,
 ) -> Optional[dict]:
     """Look up usage profile with age-keyed fallback."""
+    result = _RESOLVED_USAGE.get((age, pos, role), _UNRESOLVED)
+    if result is not _UNRESOLVED:
+        return result
     return _fallback_age_keyed(USAGE_PROFILES, age, pos, role)
 
 
+@lru_cache(maxsize=None)
 def lookup_schedule_effect(
     age_bracket: str,
     pos: str,
@@ -191,6 +265,7 @@ def lookup_schedule_effect(
     return _fallback_bracket_keyed(SCHEDULE_EFFECTS, age_bracket, pos, role)
 
 
+@lru_cache(maxsize=None)
 def lookup_city_effect(
     age_bracket: str,
     pos: str,
@@ -200,6 +275,7 @@ def lookup_city_effect(
     return _fallback_bracket_keyed(CITY_EFFECTS, age_bracket, pos, role)
 
 
+@lru_cache(maxsize=None)
 def lookup_death_spot_effect(
     age_bracket: str,
     pos: str,
@@ -209,6 +285,7 @@ def lookup_death_spot_effect(
     return _fallback_bracket_keyed(DEATH_SPOT_EFFECTS, age_bracket, pos, role)
 
 
+@lru_cache(maxsize=None)
 def lookup_matchup(
     age_bracket: str,
     pos: str,
@@ -241,12 +318,11 @@ def lookup_matchup(
             return MATCHUP_ADJUSTMENTS[fb_key]
 
     # 4. Try other roles with Average defense
-    for alt_role in ROLE_FALLBACK:
-        if alt_role != role:
-            for loc in (location, "HOME", "ROAD"):
-                fb_key = (age_bracket, pos, alt_role, "Average", loc)
-                if fb_key in MATCHUP_ADJUSTMENTS:
-                    return MATCHUP_ADJUSTMENTS[fb_key]
+    for alt_role in _OTHER_ROLES.get(role, _ALL_ROLES):
+        for loc in (location, "HOME", "ROAD"):
+            fb_key = (age_bracket, pos, alt_role, "Average", loc)
+            if fb_key in MATCHUP_ADJUSTMENTS:
+                return MATCHUP_ADJUSTMENTS[fb_key]
 
     return None
 
@@ -271,6 +347,7 @@ NEUTRAL_MATCHUP = {
 # String-keyed lookups (always succeed)
 # --------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
 def lookup_zscore_baseline(pos: str) -> dict:
     """Position-specific z-score baseline, fallback to 'ALL'."""
     if pos in ZSCORE_BASELINES:
@@ -278,6 +355,7 @@ def lookup_zscore_baseline(pos: str) -> dict:
     return ZSCORE_BASELINES["ALL"]
 
 
+@lru_cache(maxsize=None)
 def lookup_position_scarcity(pos: str) -> dict:
     """Position scarcity data. Returns neutral if unknown position."""
     if pos in POSITION_SCARCITY:
@@ -5,7 +5,7 @@ The engine internally uses G/F/C for profile lookups (via normalize_position).
 The CD app schema (players_schema.json) requires PG/SG/SF/PF/C.
 """
 
-CD_POSITIONS = {"PG", "SG", "SF", "PF", "C"}
+CD_POSITIONS = frozenset({"PG", "SG", "SF", "PF", "C"})
 
 RAW_TO_CD = {
     "G":   "PG",
@@ -17,6 +17,9 @@ RAW_TO_CD = {
     "C-F": "PF",
 }
 
+# Listed in the unknown-position error
+_EXPECTED_RAW_POSITIONS = sorted(RAW_TO_CD)
+
 
 def map_position_to_cd(raw_position: str) -> str:
     """
@@ -32,6 +35,6 @@ def map_position_to_cd(raw_position: str) -> str:
     if cd_pos is None:
         raise ValueError(
             f"Unknown position '{raw_position}'. "
-            f"Expected one of: {sorted(RAW_TO_CD.keys())}"
+            f"Expected one of: {_EXPECTED_RAW_POSITIONS}"
         )
     return cd_pos
@@ -8,9 +8,13 @@ Target: 12-team league, $200 budget, 13-man rosters.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, Tuple
 
-from engine.projections import SeasonProjection
+import numpy as np
+
+from engine.projections import SeasonProjection, _DATACLASS_SLOTS
 from engine import lookup
 
 
@@ -25,8 +29,21 @@ MAX_PRICE = 70
 # Stats used for z-score + SGP valuation
 SGP_STATS = ["points", "rebounds", "assists", "steals", "blocks", "three_pm"]
 
+# One SeasonProjection row in SGP_STATS order
+_SGP_STAT_GETTER = attrgetter(*SGP_STATS)
+
+# (means, stddevs) per ZSCORE_BASELINES position in SGP_STATS order;
+# unknown positions fall back to "ALL" like lookup_zscore_baseline
+_BASELINE_VECTORS = {
+    pos: (
+        tuple(baseline.get(f"{stat}_mean", 0.0) for stat in SGP_STATS),
+        tuple(baseline.get(f"{stat}_stddev", 1.0) for stat in SGP_STATS),
+    )
+    for pos, baseline in lookup.ZSCORE_BASELINES.items()
+}
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AuctionValue:
     """Auction value for a single player."""
     player_id: str = ""
@@ -50,32 +67,46 @@ def price_auction(
     3. Apply position scarcity multiplier
     4. Map to dollar values, budget-constrained
     """
-    sgp = lookup.get_sgp_weights()
-    category_weights = sgp.get("category_weights", {})
-    position_bonuses = sgp.get("position_bonuses", {})
-
-    values = []
-    for proj in projections:
-        # Z-scores
-        zscores = _compute_category_zscores(proj)
-        raw_z = sum(zscores.values())
-
-        # SGP weighting with position bonuses
-        sgp_val = _apply_sgp_weights(zscores, proj.position, category_weights, position_bonuses)
-
-        # Position scarcity
-        scarcity_data = lookup.lookup_position_scarcity(proj.position)
-        scarcity_mult = scarcity_data.get("scarcity_multiplier", 1.0)
-        scarcity_adjusted = sgp_val * scarcity_mult
-
-        values.append(AuctionValue(
+    if not projections:
+        return []
+
+    # (players × SGP_STATS) matrices; every step below mirrors the scalar
+    # _compute_category_zscores / _apply_sgp_weights arithmetic, column by
+    # column in SGP_STATS order, so values match them exactly
+    n = len(projections)
+    stats = np.array([_SGP_STAT_GETTER(proj) for proj in projections], dtype=np.float64)
+    means, stddevs, cat_weights, bonuses, scarcity_mults = _position_arrays(
+        [proj.position for proj in projections]
+    )
+
+    # Z-scores (0.0 where the baseline stddev is not positive)
+    has_spread = stddevs > 0
+    zscores = np.where(has_spread, (stats - means) / np.where(has_spread, stddevs, 1.0), 0.0)
+
+    # SGP weighting with position bonuses
+    weighted = zscores * cat_weights * bonuses
+    raw_z = np.zeros(n)
+    sgp_vals = np.zeros(n)
+    for col in range(len(SGP_STATS)):
+        raw_z += zscores[:, col]
+        sgp_vals += weighted[:, col]
+
+    # Position scarcity
+    scarcity_adjusted = sgp_vals * scarcity_mults
+
+    values = [
+        AuctionValue(
             player_id=proj.player_id,
             player_name=proj.player_name,
             position=proj.position,
-            raw_z_score=raw_z,
+            raw_z_score=raw,
             sgp_value=sgp_val,
-            scarcity_adjusted=scarcity_adjusted,
-        ))
+            scarcity_adjusted=adjusted,
+        )
+        for proj, raw, sgp_val, adjusted in zip(
+            projections, raw_z.tolist(), sgp_vals.tolist(), scarcity_adjusted.tolist()
+        )
+    ]
 
     # Map to dollars
     _map_to_dollars(values)
@@ -83,40 +114,63 @@ def price_auction(
     return values
 
 
+def _position_arrays(
+    positions: List[str],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-player z-score baselines, SGP weights and scarcity multipliers.
+
+    Rows are built once per distinct position and broadcast to players.
+    Returns (means, stddevs, category_weights, position_bonuses) as
+    (players × SGP_STATS) matrices plus a scarcity_multiplier vector.
+    """
+    distinct = list(dict.fromkeys(positions))
+    means, stddevs, cat_weights, bonuses, scarcity = [], [], [], [], []
+    for pos in distinct:
+        pos_means, pos_stddevs = _baseline_vectors(pos)
+        means.append(pos_means)
+        stddevs.append(pos_stddevs)
+        pos_cat_weights, pos_bonuses = _sgp_weight_vectors(pos)
+        cat_weights.append(pos_cat_weights)
+        bonuses.append(pos_bonuses)
+        scarcity.append(lookup.lookup_position_scarcity(pos).get("scarcity_multiplier", 1.0))
+
+    row_of = {pos: i for i, pos in enumerate(distinct)}
+    rows = np.fromiter((row_of[pos] for pos in positions), dtype=np.intp, count=len(positions))
+    return (
+        np.array(means, dtype=np.float64)[rows],
+        np.array(stddevs, dtype=np.float64)[rows],
+        np.array(cat_weights, dtype=np.float64)[rows],
+        np.array(bonuses, dtype=np.float64)[rows],
+        np.array(scarcity, dtype=np.float64)[rows],
+    )
+
+
 def _compute_category_zscores(proj: SeasonProjection) -> Dict[str, float]:
     """
     Z-score per category: (player_stat - position_mean) / position_stddev.
     Uses position-specific baselines from ZSCORE_BASELINES.
     """
-    baseline = lookup.lookup_zscore_baseline(proj.position)
+    means, stddevs = _baseline_vectors(proj.position)
     zscores = {}
-
-    stat_attr_map = {
-        "points": "points",
-        "rebounds": "rebounds",
-        "assists": "assists",
-        "steals": "steals",
-        "blocks": "blocks",
-        "three_pm": "three_pm",
-    }
-
-    for stat in SGP_STATS:
-        attr_name = stat_attr_map[stat]
-        player_val = getattr(proj, attr_name, 0.0)
-        mean_key = f"{stat}_mean"
-        stddev_key = f"{stat}_stddev"
-
-        mean_val = baseline.get(mean_key, 0.0)
-        stddev_val = baseline.get(stddev_key, 1.0)
-
+    for stat, value, mean_val, stddev_val in zip(
+        SGP_STATS, _SGP_STAT_GETTER(proj), means, stddevs
+    ):
         if stddev_val > 0:
-            zscores[stat] = (player_val - mean_val) / stddev_val
+            zscores[stat] = (value - mean_val) / stddev_val
         else:
             zscores[stat] = 0.0
-
     return zscores
 
 
+def _baseline_vectors(position: str) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """(means, stddevs) of the position's z-score baseline in SGP_STATS order."""
+    vectors = _BASELINE_VECTORS.get(position)
+    if vectors is None:
+        return _BASELINE_VECTORS["ALL"]
+    return vectors
+
+
 def _apply_sgp_weights(
     zscores: Dict[str, float],
     position: str,
@@ -136,6 +190,23 @@ def _apply_sgp_weights(
     return total
 
 
+@lru_cache(maxsize=None)
+def _sgp_weight_vectors(position: str) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """
+    (category_weights, position_bonuses) for a position in SGP_STATS order.
+
+    Kept as two vectors rather than their product so weighting stays
+    (z * category_weight) * bonus, exactly as in _apply_sgp_weights.
+    """
+    sgp = lookup.get_sgp_weights()
+    category_weights = sgp.get("category_weights", {})
+    position_bonuses = sgp.get("position_bonuses", {})
+    return (
+        tuple(category_weights.get(stat, 1.0) for stat in SGP_STATS),
+        tuple(position_bonuses.get((stat, position), 1.0) for stat in SGP_STATS),
+    )
+
+
 def _map_to_dollars(values: List[AuctionValue]) -> None:
     """
     Map scarcity-adjusted values to $1-$70 dollar scale.
@@ -146,85 +217,81 @@ def _map_to_dollars(values: List[AuctionValue]) -> None:
     3. Everyone else gets $1
     4. Clamp to [MIN_PRICE, MAX_PRICE]
     """
-    # Sort descending by scarcity-adjusted value
-    ranked = sorted(values, key=lambda v: v.scarcity_adjusted, reverse=True)
+    if not values:
+        return
+
+    scores = np.fromiter((v.scarcity_adjusted for v in values), dtype=np.float64, count=len(values))
+
+    # Sort descending by scarcity-adjusted value (stable, like sorted(reverse=True))
+    order = np.argsort(-scores, kind="stable")
 
     # Select draftable pool
-    draftable = ranked[:DRAFTABLE_PLAYERS]
-    undraftable = ranked[DRAFTABLE_PLAYERS:]
+    draft_idx = order[:DRAFTABLE_PLAYERS]
+    draftable = [values[i] for i in draft_idx.tolist()]
+    undraftable = [values[i] for i in order[DRAFTABLE_PLAYERS:].tolist()]
 
-    if not draftable:
-        return
+    # Shift values so minimum is 0 (handle negative z-scores); the pool is
+    # sorted descending, so its minimum is the last entry
+    draft_scores = scores[draft_idx]
+    shifted = draft_scores - draft_scores[-1]
+    total_shifted = shifted.sum()
 
-    # Shift values so minimum is 0 (handle negative z-scores)
-    min_val = min(v.scarcity_adjusted for v in draftable)
-    shifted = [v.scarcity_adjusted - min_val for v in draftable]
-    total_shifted = sum(shifted)
+    # Undraftable players get $1
+    for v in undraftable:
+        v.dollar_value = MIN_PRICE
 
     if total_shifted <= 0:
         # All players equal — distribute evenly
         even_price = TOTAL_BUDGET // DRAFTABLE_PLAYERS
         for v in draftable:
             v.dollar_value = max(MIN_PRICE, min(MAX_PRICE, even_price))
-        for v in undraftable:
-            v.dollar_value = MIN_PRICE
         return
 
     # Reserve $1 per roster spot, distribute remainder proportionally
     reserved = DRAFTABLE_PLAYERS * MIN_PRICE
     distributable = TOTAL_BUDGET - reserved
 
-    # Raw dollar values (proportional share of distributable pool)
-    raw_dollars = []
-    for val in shifted:
-        share = (val / total_shifted) * distributable
-        raw_dollars.append(share)
-
-    # Assign dollars: $1 base + proportional share
-    for i, v in enumerate(draftable):
-        dollar = MIN_PRICE + raw_dollars[i]
-        v.dollar_value = max(MIN_PRICE, min(MAX_PRICE, round(dollar)))
-
-    # Undraftable players get $1
-    for v in undraftable:
-        v.dollar_value = MIN_PRICE
+    # $1 base + proportional share of the distributable pool
+    draft_dollars = np.clip(
+        np.round(MIN_PRICE + (shifted / total_shifted) * distributable),
+        MIN_PRICE,
+        MAX_PRICE,
+    ).astype(int)
 
     # Adjust to hit budget target: iteratively tweak top values
-    _adjust_budget(draftable, undraftable)
+    _adjust_budget(draft_dollars, len(undraftable))
 
+    for v, dollar in zip(draftable, draft_dollars.tolist()):
+        v.dollar_value = dollar
 
-def _adjust_budget(
-    draftable: List[AuctionValue],
-    undraftable: List[AuctionValue],
-) -> None:
-    """Fine-tune dollar values to hit exactly TOTAL_BUDGET."""
-    all_players = draftable + undraftable
-    total = sum(v.dollar_value for v in all_players)
-    diff = TOTAL_BUDGET - total
 
-    if diff == 0:
-        return
+def _adjust_budget(draft_dollars: np.ndarray, undraftable_count: int) -> None:
+    """
+    Fine-tune dollar values to hit exactly TOTAL_BUDGET.
 
-    # Sort draftable by value (highest first) for adjustment
-    sorted_draft = sorted(draftable, key=lambda v: v.scarcity_adjusted, reverse=True)
+    draft_dollars holds the draftable pool's prices, already in ranked
+    (highest value first) order, and is adjusted in place. Undraftable
+    players are all at MIN_PRICE.
 
-    if diff > 0:
+    Dollars are added one per player from the top of the pool, or removed
+    one per player from the bottom, in repeated passes over the players
+    still below MAX_PRICE / above MIN_PRICE. Stops early if no player can
+    move.
+    """
+    diff = TOTAL_BUDGET - int(draft_dollars.sum()) - undraftable_count * MIN_PRICE
+
+    while diff > 0:
         # Need to add dollars — add to top players
-        i = 0
-        while diff > 0 and i < len(sorted_draft):
-            if sorted_draft[i].dollar_value < MAX_PRICE:
-                sorted_draft[i].dollar_value += 1
-                diff -= 1
-            i += 1
-            if i >= len(sorted_draft):
-                i = 0
-    elif diff < 0:
+        eligible = np.flatnonzero(draft_dollars < MAX_PRICE)[:diff]
+        if not len(eligible):
+            break
+        draft_dollars[eligible] += 1
+        diff -= len(eligible)
+
+    while diff < 0:
         # Need to remove dollars — remove from bottom draftable
-        i = len(sorted_draft) - 1
-        while diff < 0 and i >= 0:
-            if sorted_draft[i].dollar_value > MIN_PRICE:
-                sorted_draft[i].dollar_value -= 1
-                diff += 1
-            i -= 1
-            if i < 0:
-                i = len(sorted_draft) - 1
+        eligible = np.flatnonzero(draft_dollars > MIN_PRICE)[::-1][:-diff]
+        if not len(eligible):
+            break
+        draft_dollars[eligible] -= 1
+        diff += len(eligible)
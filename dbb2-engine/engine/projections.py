@@ -10,8 +10,13 @@ Adjustment chain:
 """
 
 import math
+import sys
 from dataclasses import dataclass
-from typing import Dict, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from engine.baseline import PlayerContext
 from engine import lookup
@@ -37,9 +42,36 @@ AGE_ADJUSTED_STATS = [
     "blocks", "turnovers", "fgm", "fga", "three_pm", "three_pa",
     "ftm", "fta",
 ]
+_MINUTES_INDEX = AGE_ADJUSTED_STATS.index("minutes_played")
+
+# One baseline_stats row in AGE_ADJUSTED_STATS order
+_BASELINE_STAT_GETTER = itemgetter(*AGE_ADJUSTED_STATS)
+
+# Profile-term row for players without an age profile (masked out anyway)
+_NO_PROFILE_TERMS = (None,) * len(AGE_ADJUSTED_STATS)
+
+# SeasonProjection field for each AGE_ADJUSTED_STATS entry
+_PROJECTION_STAT_FIELDS = [
+    "minutes" if stat == "minutes_played" else stat for stat in AGE_ADJUSTED_STATS
+]
 
+# Fantasy scoring weights, in _calculate_fantasy_points summation order
+FANTASY_POINT_WEIGHTS = (
+    ("points", 1.0),
+    ("rebounds", 1.2),
+    ("assists", 1.5),
+    ("steals", 3.0),
+    ("blocks", 3.0),
+    ("turnovers", -1.0),
+)
 
-@dataclass
+# Projection records are built per player and read back field by field:
+# use __slots__ where supported (dataclass slots need Python 3.10+; 3.9
+# falls back to a regular dataclass)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class SeasonProjection:
     """Output of the season-long projection pipeline for one player."""
     player_id: str = ""
@@ -91,13 +123,10 @@ def project_season(ctx: PlayerContext) -> SeasonProjection:
     6. Derive consistency from stat variance
     7. Calculate fantasy points and percentages
     """
-    stats = dict(ctx.baseline_stats)
-
-    # 1. Age adjustment
-    stats = _apply_age_adjustment(stats, ctx.age, ctx.position, ctx.role)
-
-    # 2. Usage normalization
-    stats = _apply_usage_normalization(stats, ctx.age, ctx.position, ctx.role)
+    # 1-2. Age adjustment and usage normalization; the dict the later
+    # helpers read is built once, after both
+    stat_vec = _adjusted_stat_vector(ctx)
+    stats = dict(zip(AGE_ADJUSTED_STATS, stat_vec))
 
     # 3. Projected games
     projected_games = _project_games_played(
@@ -128,20 +157,8 @@ def project_season(ctx: PlayerContext) -> SeasonProjection:
         player_name=ctx.player_name,
         team=ctx.team,
         position=ctx.position,
-        minutes=max(0.0, stats.get("minutes_played", 0.0)),
         usage_rate=usage_rate,
-        points=max(0.0, stats.get("points", 0.0)),
-        rebounds=max(0.0, stats.get("rebounds", 0.0)),
-        assists=max(0.0, stats.get("assists", 0.0)),
-        steals=max(0.0, stats.get("steals", 0.0)),
-        blocks=max(0.0, stats.get("blocks", 0.0)),
-        turnovers=max(0.0, stats.get("turnovers", 0.0)),
-        fgm=max(0.0, stats.get("fgm", 0.0)),
-        fga=max(0.0, stats.get("fga", 0.0)),
-        three_pm=max(0.0, stats.get("three_pm", 0.0)),
-        three_pa=max(0.0, stats.get("three_pa", 0.0)),
-        ftm=max(0.0, stats.get("ftm", 0.0)),
-        fta=max(0.0, stats.get("fta", 0.0)),
+        **{field: max(0.0, val) for field, val in zip(_PROJECTION_STAT_FIELDS, stat_vec)},
         fg_pct=fg_pct,
         three_pt_pct=three_pt_pct,
         ft_pct=ft_pct,
@@ -153,6 +170,177 @@ def project_season(ctx: PlayerContext) -> SeasonProjection:
     )
 
 
+def project_season_batch(contexts: List[PlayerContext]) -> List[SeasonProjection]:
+    """
+    project_season for many players at once.
+
+    Games played and profile lookups stay per player (all cached); the
+    age blend, minutes nudge, fantasy points, ceiling/floor, consistency,
+    percentages and the final clamps run as NumPy passes over the
+    (players × AGE_ADJUSTED_STATS) matrix, using the scalar helpers'
+    arithmetic, so results are identical to project_season.
+    """
+    n = len(contexts)
+    stats = _adjusted_stat_matrix(contexts)
+    fp_var = np.fromiter(
+        (ctx.stat_variance.get("fantasy_points_variance", 0.0) for ctx in contexts),
+        dtype=np.float64, count=n,
+    )
+    ceiling_pts = [_ceiling_points(ctx.age, ctx.position, ctx.role) for ctx in contexts]
+    has_ceiling = np.fromiter((pts is not None for pts in ceiling_pts), dtype=bool, count=n)
+    ceiling_pts = np.fromiter(
+        (0.0 if pts is None else pts for pts in ceiling_pts), dtype=np.float64, count=n
+    )
+    profile_cv = np.fromiter(
+        (_profile_cv(ctx.age, ctx.position, ctx.role) for ctx in contexts),
+        dtype=np.float64, count=n,
+    )
+
+    fp, ceiling, floor, consistency = _season_summary(
+        stats, fp_var, ceiling_pts, has_ceiling, profile_cv
+    )
+    fg_pct, three_pt_pct, ft_pct = _percentage_columns(stats)
+
+    rows = zip(
+        contexts,
+        np.maximum(stats, 0.0).tolist(),
+        fg_pct.tolist(),
+        three_pt_pct.tolist(),
+        ft_pct.tolist(),
+        np.maximum(fp, 0.0).tolist(),
+        np.maximum(ceiling, 0.0).tolist(),
+        np.maximum(floor, 0.0).tolist(),
+        consistency.tolist(),
+    )
+    return [
+        SeasonProjection(
+            player_id=ctx.player_id,
+            player_name=ctx.player_name,
+            team=ctx.team,
+            position=ctx.position,
+            usage_rate=_get_usage_rate(ctx.age, ctx.position, ctx.role),
+            **dict(zip(_PROJECTION_STAT_FIELDS, stat_row)),
+            fg_pct=fg,
+            three_pt_pct=three_pt,
+            ft_pct=ft,
+            fantasy_points=fp_val,
+            projected_games=_project_games_played(
+                ctx.age, ctx.position, ctx.role, ctx.games_by_season
+            ),
+            ceiling=ceiling_val,
+            floor=floor_val,
+            consistency=consistency_val,
+        )
+        for ctx, stat_row, fg, three_pt, ft, fp_val, ceiling_val, floor_val,
+            consistency_val in rows
+    ]
+
+
+def _season_summary(
+    stats: np.ndarray,
+    fp_var: np.ndarray,
+    ceiling_pts: np.ndarray,
+    has_ceiling: np.ndarray,
+    profile_cv: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Column-wise _calculate_fantasy_points, _compute_ceiling_floor and
+    _compute_consistency over a (players × AGE_ADJUSTED_STATS) matrix.
+
+    Returns (fantasy_points, ceiling, floor, consistency); floor is clamped
+    at 0 like the scalar helper, ceiling and fantasy points are not.
+    """
+    fp = np.zeros(stats.shape[0])
+    for stat, weight in FANTASY_POINT_WEIGHTS:
+        fp += stats[:, AGE_ADJUSTED_STATS.index(stat)] * weight
+
+    has_var = fp_var > 0
+    fp_sd = np.sqrt(np.where(has_var, fp_var, 0.0))
+
+    # Ceiling from profile, floor from variance
+    ceiling = np.where(has_ceiling, ceiling_pts, fp * 1.3)
+    floor = fp - 1.5 * np.where(has_var, fp_sd, fp * 0.3)
+    ceiling = np.where(ceiling <= floor, floor + 5.0, ceiling)
+
+    # Consistency: player CV relative to profile CV, 1.0 → 50
+    with np.errstate(divide="ignore", invalid="ignore"):
+        player_cv = np.where(has_var, fp_sd / fp, 0.3)
+        ratio = np.where(profile_cv > 0, player_cv / profile_cv, 1.0)
+        score = np.clip(np.trunc(100 - ratio * 50), 0, 100)
+    consistency = np.where(fp <= 0, 50, score).astype(int)
+
+    return fp, ceiling, np.maximum(floor, 0.0), consistency
+
+
+def _percentage_columns(stats: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Column-wise _calculate_percentages; 0.0 where attempts are not positive."""
+    def pct(made: str, attempted: str) -> np.ndarray:
+        made_col = stats[:, AGE_ADJUSTED_STATS.index(made)]
+        att_col = stats[:, AGE_ADJUSTED_STATS.index(attempted)]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(att_col > 0, made_col / att_col, 0.0)
+
+    return pct("fgm", "fga"), pct("three_pm", "three_pa"), pct("ftm", "fta")
+
+
+def _adjusted_stat_vector(ctx: PlayerContext) -> List[float]:
+    """Baseline stats in AGE_ADJUSTED_STATS order, age-blended and minutes-normalized."""
+    baseline = ctx.baseline_stats
+    stat_vec = [baseline.get(stat, 0.0) for stat in AGE_ADJUSTED_STATS]
+
+    profile_vec = _age_profile_vector(ctx.age, ctx.position, ctx.role)
+    if profile_vec is not None:
+        stat_vec = _blend_with_profile(stat_vec, profile_vec)
+
+    stat_vec[_MINUTES_INDEX] = _normalize_minutes(
+        stat_vec[_MINUTES_INDEX], ctx.age, ctx.position, ctx.role
+    )
+    return stat_vec
+
+
+def _adjusted_stat_matrix(contexts: List[PlayerContext]) -> np.ndarray:
+    """_adjusted_stat_vector for every context, as one (players × stats) matrix."""
+    n = len(contexts)
+    width = len(AGE_ADJUSTED_STATS)
+    rows = []
+    for ctx in contexts:
+        try:
+            rows.append(_BASELINE_STAT_GETTER(ctx.baseline_stats))
+        except KeyError:
+            # Hand-built contexts may carry only some (or none) of the stats
+            rows.append([ctx.baseline_stats.get(stat, 0.0) for stat in AGE_ADJUSTED_STATS])
+    baseline = np.array(rows, dtype=np.float64).reshape(n, width)
+
+    # Age blend: missing profile terms (None -> NaN) blend with the baseline;
+    # players without a profile keep it unchanged
+    profile_vecs = [_age_profile_vector(ctx.age, ctx.position, ctx.role) for ctx in contexts]
+    has_profile = np.fromiter((vec is not None for vec in profile_vecs), dtype=bool, count=n)
+    profile_terms = np.array(
+        [_NO_PROFILE_TERMS if vec is None else vec for vec in profile_vecs],
+        dtype=np.float64,
+    ).reshape(n, width)
+    missing = np.isnan(profile_terms)
+    blended = PLAYER_WEIGHT * baseline + np.where(
+        missing, PROFILE_WEIGHT * baseline, profile_terms
+    )
+    stats = np.where(has_profile[:, np.newaxis], blended, baseline)
+
+    # Minutes nudge (unbounded without a usage profile)
+    bounds = [_minutes_bounds(ctx.age, ctx.position, ctx.role) for ctx in contexts]
+    p10 = np.fromiter(
+        (-np.inf if b is None else b[0] for b in bounds), dtype=np.float64, count=n
+    )
+    p90 = np.fromiter(
+        (np.inf if b is None else b[1] for b in bounds), dtype=np.float64, count=n
+    )
+    minutes = stats[:, _MINUTES_INDEX]
+    stats[:, _MINUTES_INDEX] = np.where(
+        minutes > p90, (minutes + p90) / 2.0,
+        np.where(minutes < p10, (minutes + p10) / 2.0, minutes),
+    )
+    return stats
+
+
 def _apply_age_adjustment(
     baseline: Dict[str, float],
     age: int,
@@ -163,20 +351,50 @@ def _apply_age_adjustment(
     Blend player baseline with age profile average.
     70% player baseline + 30% age profile.
     """
-    profile = lookup.lookup_age_profile(age, pos, role)
-    if profile is None:
+    profile_vec = _age_profile_vector(age, pos, role)
+    if profile_vec is None:
         return baseline
 
     result = dict(baseline)
-    for stat in AGE_ADJUSTED_STATS:
-        player_val = baseline.get(stat, 0.0)
-        profile_key = f"avg_{stat}"
-        profile_val = profile.get(profile_key, player_val)
+    result.update(zip(
+        AGE_ADJUSTED_STATS,
+        _blend_with_profile([baseline.get(stat, 0.0) for stat in AGE_ADJUSTED_STATS], profile_vec),
+    ))
+    return result
 
-        blended = PLAYER_WEIGHT * player_val + PROFILE_WEIGHT * profile_val
-        result[stat] = blended
 
-    return result
+@lru_cache(maxsize=None)
+def _age_profile_vector(age: int, pos: str, role: str) -> Optional[Tuple[Optional[float], ...]]:
+    """
+    The age profile's share of the blend (PROFILE_WEIGHT * avg_<stat>) in
+    AGE_ADJUSTED_STATS order (None where the profile lacks a stat or has
+    NaN), or None without a profile.
+    """
+    profile = lookup.lookup_age_profile(age, pos, role)
+    if profile is None:
+        return None
+    return tuple(
+        None if avg is None or math.isnan(avg) else PROFILE_WEIGHT * avg
+        for avg in (profile.get(f"avg_{stat}") for stat in AGE_ADJUSTED_STATS)
+    )
+
+
+def _blend_with_profile(
+    stat_vec: List[float],
+    profile_vec: Tuple[Optional[float], ...],
+) -> List[float]:
+    """70/30 blend; stats the profile lacks blend with themselves."""
+    try:
+        # Complete profile (the common case): no per-stat fallback
+        return [PLAYER_WEIGHT * player_val + profile_term
+                for player_val, profile_term in zip(stat_vec, profile_vec)]
+    except TypeError:
+        pass  # A None term: the profile lacks some stats
+    return [
+        PLAYER_WEIGHT * player_val
+        + (PROFILE_WEIGHT * player_val if profile_term is None else profile_term)
+        for player_val, profile_term in zip(stat_vec, profile_vec)
+    ]
 
 
 def _apply_usage_normalization(
@@ -189,24 +407,34 @@ def _apply_usage_normalization(
     Sanity-check minutes against usage profile percentiles.
     If outside [10th, 90th], nudge toward median.
     """
-    usage = lookup.lookup_usage(age, pos, role)
-    if usage is None:
-        return stats
-
     result = dict(stats)
-    minutes = result.get("minutes_played", 0.0)
-    p10 = usage.get("minutes_10th", 0.0)
-    p50 = usage.get("minutes_50th", minutes)
-    p90 = usage.get("minutes_90th", 48.0)
+    result["minutes_played"] = _normalize_minutes(result.get("minutes_played", 0.0), age, pos, role)
+    return result
 
+
+def _normalize_minutes(minutes: float, age: int, pos: str, role: str) -> float:
+    """Minutes nudged halfway back inside the usage profile's [10th, 90th]."""
+    bounds = _minutes_bounds(age, pos, role)
+    if bounds is None:
+        return minutes
+
+    p10, p90 = bounds
     if minutes > p90:
         # Nudge down: midpoint between current and 90th
-        result["minutes_played"] = (minutes + p90) / 2.0
-    elif minutes < p10:
+        return (minutes + p90) / 2.0
+    if minutes < p10:
         # Nudge up: midpoint between current and 10th
-        result["minutes_played"] = (minutes + p10) / 2.0
+        return (minutes + p10) / 2.0
+    return minutes
 
-    return result
+
+@lru_cache(maxsize=None)
+def _minutes_bounds(age: int, pos: str, role: str) -> Optional[Tuple[float, float]]:
+    """(10th, 90th) percentile minutes of the usage profile, or None without one."""
+    usage = lookup.lookup_usage(age, pos, role)
+    if usage is None:
+        return None
+    return usage.get("minutes_10th", 0.0), usage.get("minutes_90th", 48.0)
 
 
 def _project_games_played(
@@ -247,11 +475,8 @@ def _compute_ceiling_floor(
     """
     Ceiling from ceiling profiles, floor from variance.
     """
-    ceiling_profile = lookup.lookup_ceiling_profile(age, pos, role)
-
-    if ceiling_profile is not None:
-        ceiling = ceiling_profile.get("avg_ceiling_game_pts", fantasy_points * 1.3)
-    else:
+    ceiling = _ceiling_points(age, pos, role)
+    if ceiling is None:
         ceiling = fantasy_points * 1.3
 
     # Floor: baseline fantasy_points - 1.5 * stddev
@@ -285,13 +510,7 @@ def _compute_consistency(
     player_cv = math.sqrt(fp_var) / fantasy_points if fp_var > 0 else 0.3
 
     # Profile's CV for comparison
-    profile = lookup.lookup_age_profile(age, pos, role)
-    if profile is not None:
-        profile_avg = profile.get("avg_points", 10.0)
-        profile_var = profile.get("variance_points", 25.0)
-        profile_cv = math.sqrt(profile_var) / profile_avg if profile_avg > 0 else 0.5
-    else:
-        profile_cv = 0.5
+    profile_cv = _profile_cv(age, pos, role)
 
     # Ratio: lower player_cv relative to profile = higher consistency
     if profile_cv > 0:
@@ -305,6 +524,26 @@ def _compute_consistency(
     return max(0, min(100, score))
 
 
+@lru_cache(maxsize=None)
+def _ceiling_points(age: int, pos: str, role: str) -> Optional[float]:
+    """Ceiling profile's avg_ceiling_game_pts, or None if unavailable."""
+    ceiling_profile = lookup.lookup_ceiling_profile(age, pos, role)
+    if ceiling_profile is None:
+        return None
+    return ceiling_profile.get("avg_ceiling_game_pts")
+
+
+@lru_cache(maxsize=None)
+def _profile_cv(age: int, pos: str, role: str) -> float:
+    """Age profile's points coefficient of variation (0.5 without a profile)."""
+    profile = lookup.lookup_age_profile(age, pos, role)
+    if profile is None:
+        return 0.5
+    profile_avg = profile.get("avg_points", 10.0)
+    profile_var = profile.get("variance_points", 25.0)
+    return math.sqrt(profile_var) / profile_avg if profile_avg > 0 else 0.5
+
+
 def _calculate_percentages(stats: Dict[str, float]) -> tuple:
     """Derive fg_pct, three_pt_pct, ft_pct from made/attempted."""
     fga = stats.get("fga", 0.0)
@@ -0,0 +1,117 @@
+"""
+Per-stat betting prop helpers shared by engine/api.py and engine/export_betting.py.
+
+std_dev comes from PlayerContext.stat_variance; confidence combines the
+player's global consistency with the stat's coefficient of variation.
+"""
+
+import math
+from operator import itemgetter
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from engine.baseline import PlayerContext
+
+# Map engine stat names to betting engine short names
+STAT_MAP = {
+    "points": "pts",
+    "rebounds": "reb",
+    "assists": "ast",
+    "three_pm": "fg3m",
+    "steals": "stl",
+    "blocks": "blk",
+}
+
+# Variance key format in PlayerContext.stat_variance
+VARIANCE_KEY_MAP = {
+    "points": "points_variance",
+    "rebounds": "rebounds_variance",
+    "assists": "assists_variance",
+    "three_pm": "three_pm_variance",
+    "steals": "steals_variance",
+    "blocks": "blocks_variance",
+}
+
+
+def get_std_dev(ctx: PlayerContext, stat: str) -> float:
+    """Get std_dev for a stat from PlayerContext.stat_variance."""
+    var_key = VARIANCE_KEY_MAP.get(stat)
+    if var_key is None:
+        return 0.0
+    variance = ctx.stat_variance.get(var_key, 0.0)
+    return math.sqrt(max(variance, 0.0))
+
+
+def get_confidence(
+    projection_value: float,
+    std_dev: float,
+    base_confidence: float,
+) -> float:
+    """
+    Derive per-stat confidence from consistency and coefficient of variation.
+
+    base_confidence = consistency / 100 (global player consistency)
+    Adjusted down by CV: higher variance relative to mean = lower confidence.
+    Clamped to [0.40, 0.95].
+    """
+    if projection_value <= 0 or std_dev <= 0:
+        return round(max(0.40, base_confidence * 0.8), 2)
+
+    cv = std_dev / projection_value
+    conf = base_confidence * (1 - min(cv, 0.5))
+    return round(max(0.40, min(0.95, conf)), 2)
+
+
+def get_std_devs(
+    contexts: List[PlayerContext],
+    stats: Sequence[str] = tuple(STAT_MAP),
+) -> np.ndarray:
+    """
+    Vectorized get_std_dev: (len(contexts), len(stats)) matrix of std_devs,
+    one column per engine stat in `stats` (default: STAT_MAP order).
+    """
+    variance_keys = [VARIANCE_KEY_MAP[stat] for stat in stats]
+    get_variances = _tuple_getter(variance_keys)
+    rows = []
+    for ctx in contexts:
+        try:
+            rows.append(get_variances(ctx.stat_variance))
+        except KeyError:
+            # Hand-built contexts may carry only some (or none) of the keys
+            rows.append(tuple(ctx.stat_variance.get(key, 0.0) for key in variance_keys))
+    variances = np.array(rows, dtype=np.float64).reshape(len(contexts), len(variance_keys))
+    return np.sqrt(np.maximum(variances, 0.0))
+
+
+def get_confidences(
+    projection_values: np.ndarray,
+    std_devs: np.ndarray,
+    base_confidence: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized get_confidence over (players, stats) matrices.
+
+    base_confidence holds one value per player (row).
+    """
+    base = base_confidence[:, np.newaxis]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cv = std_devs / projection_values
+    conf = np.maximum(0.40, np.minimum(0.95, base * (1 - np.minimum(cv, 0.5))))
+    fallback = np.maximum(0.40, base * 0.8)
+    no_spread = (projection_values <= 0) | (std_devs <= 0)
+    conf = np.where(no_spread, fallback, conf)
+    # Built-in round(), as in get_confidence: np.round scales by 100 first
+    # and can land a half-cent (e.g. 0.405) on the other side
+    rounded = [[round(c, 2) for c in row] for row in conf.tolist()]
+    return np.array(rounded, dtype=np.float64).reshape(conf.shape)
+
+
+def _tuple_getter(keys: Sequence[str]) -> Callable[[Dict[str, float]], Tuple[float, ...]]:
+    """itemgetter over keys that always returns a tuple (itemgetter returns a bare value for one key)."""
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda mapping: (mapping[key],)
+    if not keys:
+        return lambda mapping: ()
+    return itemgetter(*keys)
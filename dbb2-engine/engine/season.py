@@ -5,6 +5,11 @@ Helpers for resolving the active NBA season.
 from datetime import date
 from typing import Optional
 
+# Start years covered by the prebuilt season strings (first BAA season on);
+# years outside the range are formatted on demand
+_FIRST_SEASON = 1946
+_LAST_SEASON = 2099
+
 
 def get_current_nba_season_start_year(today: Optional[date] = None) -> int:
     """
@@ -16,9 +21,22 @@ def get_current_nba_season_start_year(today: Optional[date] = None) -> int:
     """
     if today is None:
         today = date.today()
-    return today.year if today.month >= 10 else today.year - 1
+    return today.year - (today.month < 10)
 
 
 def format_nba_season(start_year: int) -> str:
     """Format start year as NBA season string, e.g. 2025 -> '2025-26'."""
+    season = _SEASON_STRINGS.get(start_year)
+    if season is None:
+        season = _format_season(start_year)
+    return season
+
+
+def _format_season(start_year: int) -> str:
+    """Build the season string for a start year."""
     return f"{start_year}-{str((start_year + 1) % 100).zfill(2)}"
+
+
+_SEASON_STRINGS = {
+    year: _format_season(year) for year in range(_FIRST_SEASON, _LAST_SEASON + 1)
+}
@@ -7,8 +7,24 @@ Two validation passes:
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional speedup — stdlib json is the fallback
+    orjson = None
+
+try:
+    import jsonschema_rs
+except ImportError:  # Optional compiled backend — jsonschema is the fallback
+    jsonschema_rs = None
 
 from engine.position_map import CD_POSITIONS
 
@@ -28,15 +44,30 @@ FILE_TO_SCHEMA = {
     "insights.json": "insights_schema.json",
 }
 
+# (output filename, schema filename) pairs, in FILE_TO_SCHEMA order
+_SCHEMA_ITEMS = tuple(FILE_TO_SCHEMA.items())
+
+# Schema checker: data -> lazy (error path parts, message) pairs
+SchemaChecker = Callable[[object], Iterable[Tuple[list, str]]]
+
+# Default cap on schema errors reported per output file
+MAX_ERRORS_PER_FILE = 25
+
+# Stand-in for a missing file (a JSON file may legitimately hold null)
+_MISSING = object()
+
 
 def validate_output_dir(
     output_dir: str,
     schema_dir: str = None,
+    max_errors_per_file: Optional[int] = MAX_ERRORS_PER_FILE,
 ) -> Tuple[bool, List[str]]:
     """
     Validate all 4 JSON files against CD schemas.
 
     Returns (all_valid, list_of_error_strings).
+    At most max_errors_per_file schema errors are listed per file (None
+    lists all); a truncated file ends with a "further errors omitted" line.
     Requires jsonschema package — returns error if not installed.
     """
     try:
@@ -46,33 +77,108 @@ def validate_output_dir(
 
     schema_path = Path(schema_dir) if schema_dir else DEFAULT_SCHEMA_DIR
     out_path = Path(output_dir)
+    file_paths = _output_paths(out_path)
+    schema_paths = {filename: schema_path / schema_file for filename, schema_file in _SCHEMA_ITEMS}
+
     errors = []
+    for filename in FILE_TO_SCHEMA:
+        errors.extend(_validate_file(
+            jsonschema, file_paths[filename], schema_paths[filename], max_errors_per_file
+        ))
 
-    for filename, schema_file in FILE_TO_SCHEMA.items():
-        json_path = out_path / filename
-        s_path = schema_path / schema_file
+    valid = len(errors) == 0
+    return valid, errors
 
-        if not json_path.exists():
-            errors.append(f"{filename}: file not found at {json_path}")
-            continue
 
-        if not s_path.exists():
-            errors.append(f"{schema_file}: schema not found at {s_path}")
-            continue
+def _output_paths(out_path: Path) -> Dict[str, Path]:
+    """Output filename → path under out_path, in FILE_TO_SCHEMA order."""
+    return {filename: out_path / filename for filename, _ in _SCHEMA_ITEMS}
 
-        with open(json_path) as f:
-            data = json.load(f)
 
-        with open(s_path) as f:
-            schema = json.load(f)
+def _validate_file(
+    jsonschema,
+    json_path: Path,
+    s_path: Path,
+    max_errors: Optional[int] = MAX_ERRORS_PER_FILE,
+) -> List[str]:
+    """Schema errors for one output file, at most max_errors of them."""
+    filename = json_path.name
+    schema_file = s_path.name
 
-        validator = jsonschema.Draft7Validator(schema)
-        for error in validator.iter_errors(data):
-            path = " → ".join(str(p) for p in error.absolute_path) or "root"
-            errors.append(f"{filename} [{path}]: {error.message}")
+    # Open instead of exists() + open(); a missing schema surfaces as
+    # FileNotFoundError from _get_validator
+    try:
+        f = open(json_path, "rb")
+    except FileNotFoundError:
+        return [f"{filename}: file not found at {json_path}"]
+
+    with f:
+        try:
+            check = _get_validator(jsonschema, s_path)
+        except FileNotFoundError:
+            return [f"{schema_file}: schema not found at {s_path}"]
+        except (jsonschema.SchemaError, ValueError) as e:
+            return [f"{schema_file}: invalid schema: {getattr(e, 'message', e)}"]
+
+        data = _parse_json(f.read())
+
+    # The checker is lazy: stop one past the cap instead of walking every
+    # sub-error of a badly broken file
+    limit = None if max_errors is None else max_errors + 1
+    errors = []
+    for error_path, message in islice(check(data), limit):
+        path = " → ".join(str(p) for p in error_path) or "root"
+        errors.append(f"{filename} [{path}]: {message}")
+    if max_errors is not None and len(errors) > max_errors:
+        errors[max_errors:] = [f"{filename}: further errors omitted after the first {max_errors}"]
+    return errors
+
+
+def _load_json(path: Path):
+    """Parse a JSON file (with orjson when installed)."""
+    return _parse_json(path.read_bytes())
+
+
+def _load_json_if_present(path: Path):
+    """_load_json, or _MISSING if the file does not exist."""
+    try:
+        return _load_json(path)
+    except FileNotFoundError:
+        return _MISSING
+
+
+def _parse_json(raw: bytes):
+    """Parse JSON bytes (with orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
-    valid = len(errors) == 0
-    return valid, errors
+
+def _get_validator(jsonschema, s_path: Path) -> SchemaChecker:
+    """
+    Compiled schema checker for a schema file.
+
+    Uses jsonschema-rs when installed, jsonschema's Draft7Validator otherwise.
+    Raises FileNotFoundError if the schema file is missing, and
+    jsonschema.SchemaError (or ValueError from jsonschema-rs) if the schema
+    itself is invalid.
+    """
+    return _compile_schema(jsonschema, _load_json(s_path))
+
+
+def _compile_schema(jsonschema, schema: dict) -> SchemaChecker:
+    """Build a checker yielding every error as (path parts, message)."""
+    if jsonschema_rs is not None:
+        validator = jsonschema_rs.Draft7Validator(schema)
+        return lambda data: (
+            (error.instance_path, error.message) for error in validator.iter_errors(data)
+        )
+
+    jsonschema.Draft7Validator.check_schema(schema)
+    validator = jsonschema.Draft7Validator(schema)
+    return lambda data: (
+        (error.absolute_path, error.message) for error in validator.iter_errors(data)
+    )
 
 
 def validate_cross_file_consistency(output_dir: str) -> Tuple[bool, List[str]]:
@@ -80,66 +186,196 @@ def validate_cross_file_consistency(output_dir: str) -> Tuple[bool, List[str]]:
     Check consistency across the 4 output files.
 
     Checks:
-    - All 4 files exist and are non-empty arrays
+    - All 4 files exist and are non-empty arrays (otherwise only these
+      file-level errors are reported)
     - Same set of player_ids across all files
     - All positions are CD 5-position enum values
     - projections.json sorted by fantasy_points descending
     - Risk/insight integer values in 0-100
     - No negative stat projections
+
+    Each array is walked once for player_ids and per-item checks; the
+    numeric range and sort checks then run as NumPy column sweeps.
     """
-    out_path = Path(output_dir)
+    file_paths = _output_paths(Path(output_dir))
     errors = []
 
-    # Load all 4 files
+    # Load all 4 files concurrently (file reads release the GIL)
+    with ThreadPoolExecutor(max_workers=len(FILE_TO_SCHEMA)) as pool:
+        loaded = list(pool.map(
+            lambda filename: _load_json_if_present(file_paths[filename]), FILE_TO_SCHEMA
+        ))
     data = {}
-    for filename in FILE_TO_SCHEMA:
-        json_path = out_path / filename
-        if not json_path.exists():
+    for filename, content in zip(FILE_TO_SCHEMA, loaded):
+        if content is _MISSING:
             errors.append(f"{filename}: file not found")
-            continue
-        with open(json_path) as f:
-            data[filename] = json.load(f)
+        else:
+            data[filename] = content
 
-    if len(data) < 4:
+    # A missing file is fatal: the other checks compare all four
+    if errors:
         return False, errors
 
-    # Non-empty arrays
     for filename, arr in data.items():
         if not isinstance(arr, list) or len(arr) == 0:
             errors.append(f"{filename}: expected non-empty array, got {type(arr).__name__} len={len(arr) if isinstance(arr, list) else 'N/A'}")
 
-    # Same player_ids across all files
+    # So is a file that isn't a non-empty array; report the shape errors alone
+    if errors:
+        return False, errors
+
+    # One pass per file: player_ids, per-item checks
     id_sets = {}
     for filename, arr in data.items():
-        if isinstance(arr, list):
-            id_sets[filename] = {item.get("player_id") for item in arr if isinstance(item, dict)}
-
-    if len(id_sets) >= 2:
-        ref_name = "players.json"
-        ref_ids = id_sets.get(ref_name, set())
-        for filename, ids in id_sets.items():
-            if filename == ref_name:
-                continue
-            missing = ref_ids - ids
-            extra = ids - ref_ids
-            if missing:
-                errors.append(f"{filename}: missing {len(missing)} player_ids from {ref_name}")
-            if extra:
-                errors.append(f"{filename}: has {len(extra)} extra player_ids not in {ref_name}")
-
-    # Positions are CD enum
-    for filename in ("players.json", "projections.json"):
-        arr = data.get(filename, [])
+        check_item = _ITEM_CHECKS.get(filename)
+        ids = set()
         for i, item in enumerate(arr):
-            pos = item.get("position")
-            if pos and pos not in CD_POSITIONS:
-                errors.append(f"{filename}[{i}]: invalid position '{pos}', expected one of {sorted(CD_POSITIONS)}")
+            if isinstance(item, dict):
+                ids.add(item.get("player_id"))
+            if check_item is not None:
+                check_item(i, item, errors)
+        id_sets[filename] = ids
+
+    # Numeric column checks, vectorized when the columns are clean numbers
+    _check_projection_columns(data["projections.json"], errors)
+    for filename, fields in _INT_FIELDS.items():
+        _check_int_columns(filename, data[filename], fields, errors)
+    _check_risk_fraction_columns(data["risk.json"], errors)
+
+    # Same player_ids across all files
+    ref_name = "players.json"
+    ref_ids = id_sets[ref_name]
+    for filename, ids in id_sets.items():
+        if filename == ref_name or ids == ref_ids:
+            continue  # Consistent files (the usual case) need no diff
+        missing = ref_ids - ids
+        extra = ids - ref_ids
+        if missing:
+            errors.append(f"{filename}: missing {len(missing)} player_ids from {ref_name}")
+        if extra:
+            errors.append(f"{filename}: has {len(extra)} extra player_ids not in {ref_name}")
+
+    valid = len(errors) == 0
+    return valid, errors
+
+
+# Integer 0-100 fields per file
+_INT_FIELDS = {
+    "risk.json": ("injury_risk", "volatility", "minutes_risk"),
+    "insights.json": ("value_score", "risk_score", "opportunity_index"),
+}
+
+# CD positions as listed in error messages
+_CD_POSITIONS_SORTED = sorted(CD_POSITIONS)
+
+# Optional extended risk fields, 0.0-1.0
+_RISK_FRACTION_FIELDS = ("availability_risk", "role_risk", "composition_risk", "total_risk")
 
-    # projections.json sorted by fantasy_points descending
-    proj = data.get("projections.json", [])
+# Projection stats that must not be negative
+_STAT_FIELDS = (
+    "minutes", "points", "rebounds", "assists", "steals", "blocks",
+    "fgm", "fga", "tpm", "tpa", "ftm", "fta", "fantasy_points",
+)
+_FANTASY_POINTS_COLUMN = _STAT_FIELDS.index("fantasy_points")
+
+
+def _check_position(filename: str, i: int, item: dict, errors: List[str]) -> None:
+    pos = item.get("position")
+    if pos and pos not in CD_POSITIONS:
+        errors.append(f"{filename}[{i}]: invalid position '{pos}', expected one of {_CD_POSITIONS_SORTED}")
+
+
+def _check_risk_item(i: int, item: dict, errors: List[str]) -> None:
+    if "risk_level" in item and item["risk_level"] not in ("Low", "Medium", "High"):
+        errors.append(f"risk.json[{i}].risk_level: invalid value '{item['risk_level']}'")
+
+
+# Per-item checks run in the id-collecting pass, by file
+_ITEM_CHECKS: Dict[str, Callable[[int, dict, List[str]], None]] = {
+    "players.json": lambda i, item, errors: _check_position("players.json", i, item, errors),
+    "projections.json": lambda i, item, errors: _check_position("projections.json", i, item, errors),
+    "risk.json": _check_risk_item,
+}
+
+
+@lru_cache(maxsize=None)
+def _fields_getter(fields: Tuple[str, ...]) -> Callable[[dict], tuple]:
+    """itemgetter over fields (every caller passes several, so it returns a tuple)."""
+    return itemgetter(*fields)
+
+
+def _field_values(item: dict, fields: Tuple[str, ...]) -> tuple:
+    """Values of fields in item, None where a field is missing."""
+    try:
+        return _fields_getter(fields)(item)
+    except KeyError:
+        return tuple(item.get(field) for field in fields)
+
+
+def _numeric_columns(arr: list, fields: Tuple[str, ...], kinds: str) -> Optional[np.ndarray]:
+    """
+    (items × fields) matrix of the fields, or None unless every item is a
+    dict carrying every field with values of the given NumPy dtype kinds.
+
+    None sends the caller to its per-item loop, which reports exactly what
+    is wrong with the odd items.
+    """
+    get_fields = _fields_getter(fields)
+    try:
+        rows = [get_fields(item) for item in arr]
+    except (KeyError, TypeError):
+        return None
+    try:
+        values = np.array(rows)
+    except ValueError:
+        return None  # A list-valued field makes the rows ragged
+    if values.dtype.kind not in kinds:
+        return None
+    return values.reshape(len(arr), len(fields))
+
+
+def _check_projection_columns(proj: list, errors: List[str]) -> None:
+    """projections.json sorted by fantasy_points descending, no negative stats."""
+    stats = _numeric_columns(proj, _STAT_FIELDS, "biuf")
+
+    fp = stats[:, _FANTASY_POINTS_COLUMN] if stats is not None else _fantasy_points(proj)
+    if fp is None:
+        _check_sorted_items(proj, errors)
+    elif len(fp) > 1:
+        rising = fp[1:] > fp[:-1]
+        if rising.any():
+            i = int(np.argmax(rising)) + 1
+            errors.append(
+                f"projections.json: not sorted descending at index {i} "
+                f"({proj[i - 1].get('fantasy_points', 0)} < {proj[i].get('fantasy_points', 0)})"
+            )
+
+    if stats is None:
+        _check_stat_items(proj, errors)
+        return
+    for i, col in zip(*np.nonzero(stats < 0)):
+        field = _STAT_FIELDS[col]
+        errors.append(f"projections.json[{i}].{field}: negative value {proj[i][field]}")
+
+
+def _fantasy_points(proj: list) -> Optional[np.ndarray]:
+    """fantasy_points column (0 where missing), or None unless all plain numbers."""
+    try:
+        values = np.array([item.get("fantasy_points", 0) for item in proj])
+    except (AttributeError, ValueError):
+        return None
+    if values.dtype.kind not in "biuf":
+        return None
+    return values
+
+
+def _check_sorted_items(proj: list, errors: List[str]) -> None:
+    """Per-item fallback for the sort check."""
     for i in range(1, len(proj)):
         prev_fp = proj[i - 1].get("fantasy_points", 0)
         curr_fp = proj[i].get("fantasy_points", 0)
+        if not (isinstance(prev_fp, (int, float)) and isinstance(curr_fp, (int, float))):
+            continue  # Non-numbers are reported by _check_stat_items
         if curr_fp > prev_fp:
             errors.append(
                 f"projections.json: not sorted descending at index {i} "
@@ -147,45 +383,71 @@ def validate_cross_file_consistency(output_dir: str) -> Tuple[bool, List[str]]:
             )
             break  # one error is enough
 
-    # Risk/insight values 0-100
-    int_fields = {
-        "risk.json": ["injury_risk", "volatility", "minutes_risk"],
-        "insights.json": ["value_score", "risk_score", "opportunity_index"],
-    }
-    for filename, fields in int_fields.items():
-        arr = data.get(filename, [])
-        for i, item in enumerate(arr):
-            for field in fields:
-                val = item.get(field)
-                if val is not None:
-                    if not isinstance(val, int):
-                        errors.append(f"{filename}[{i}].{field}: expected int, got {type(val).__name__}")
-                    elif val < 0 or val > 100:
-                        errors.append(f"{filename}[{i}].{field}: {val} out of range 0-100")
-
-    # Optional extended risk fields
-    risk = data.get("risk.json", [])
+
+def _check_stat_items(proj: list, errors: List[str]) -> None:
+    """Per-item fallback for the negative-stat check."""
+    for i, item in enumerate(proj):
+        for field, val in zip(_STAT_FIELDS, _field_values(item, _STAT_FIELDS)):
+            if val is None:
+                continue
+            if not isinstance(val, (int, float)):
+                errors.append(f"projections.json[{i}].{field}: expected number, got {type(val).__name__}")
+            elif val < 0:
+                errors.append(f"projections.json[{i}].{field}: negative value {val}")
+
+
+def _check_int_columns(
+    filename: str,
+    arr: list,
+    fields: Tuple[str, ...],
+    errors: List[str],
+) -> None:
+    """Integer fields within 0-100."""
+    values = _numeric_columns(arr, fields, "biu")
+    if values is None:
+        _check_int_items(filename, arr, fields, errors)
+        return
+
+    for i, col in zip(*np.nonzero((values < 0) | (values > 100))):
+        field = fields[col]
+        errors.append(f"{filename}[{i}].{field}: {arr[i][field]} out of range 0-100")
+
+
+def _check_risk_fraction_columns(risk: list, errors: List[str]) -> None:
+    """Optional extended risk fields within 0.0-1.0."""
+    values = _numeric_columns(risk, _RISK_FRACTION_FIELDS, "biuf")
+    if values is None:
+        _check_risk_fraction_items(risk, errors)
+        return
+
+    for i, col in zip(*np.nonzero((values < 0.0) | (values > 1.0))):
+        field = _RISK_FRACTION_FIELDS[col]
+        errors.append(f"risk.json[{i}].{field}: {risk[i][field]} out of range 0.0-1.0")
+
+
+def _check_risk_fraction_items(risk: list, errors: List[str]) -> None:
+    """Per-item fallback for _check_risk_fraction_columns."""
     for i, item in enumerate(risk):
-        for field in ("availability_risk", "role_risk", "composition_risk", "total_risk"):
+        for field in _RISK_FRACTION_FIELDS:
             if field in item:
                 val = item[field]
                 if not isinstance(val, (int, float)):
                     errors.append(f"risk.json[{i}].{field}: expected number, got {type(val).__name__}")
                 elif val < 0.0 or val > 1.0:
                     errors.append(f"risk.json[{i}].{field}: {val} out of range 0.0-1.0")
-        if "risk_level" in item and item["risk_level"] not in ("Low", "Medium", "High"):
-            errors.append(f"risk.json[{i}].risk_level: invalid value '{item['risk_level']}'")
-
-    # No negative stat projections
-    stat_fields = [
-        "minutes", "points", "rebounds", "assists", "steals", "blocks",
-        "fgm", "fga", "tpm", "tpa", "ftm", "fta", "fantasy_points",
-    ]
-    for i, item in enumerate(proj):
-        for field in stat_fields:
-            val = item.get(field)
-            if val is not None and val < 0:
-                errors.append(f"projections.json[{i}].{field}: negative value {val}")
 
-    valid = len(errors) == 0
-    return valid, errors
+
+def _check_int_items(
+    filename: str,
+    arr: list,
+    fields: Tuple[str, ...],
+    errors: List[str],
+) -> None:
+    """Per-item fallback for _check_int_columns."""
+    for i, item in enumerate(arr):
+        for field, val in zip(fields, _field_values(item, fields)):
+            if val is not None:
+                if not isinstance(val, int):
+                    errors.append(f"{filename}[{i}].{field}: expected int, got {type(val).__name__}")
+                elif val < 0 or val > 100:
+                    errors.append(f"{filename}[{i}].{field}: {val} out of range 0-100")
@@ -7,6 +7,7 @@ Usage:
     python run_engine.py --output-dir /tmp   # Custom output directory
     python run_engine.py --validate          # Validate output against CD schemas
     python run_engine.py --seasons 5         # Override season count (default: 3)
+    python run_engine.py --workers 0         # Build player contexts on every CPU
 """
 
 import argparse
@@ -30,6 +31,12 @@ def main():
         default=3,
         help="Number of recent seasons to load (default: 3)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes for building player contexts (default: 1; 0 = one per CPU)",
+    )
     parser.add_argument(
         "--validate",
         action="store_true",
@@ -54,7 +61,9 @@ def main():
 
     # 1. Project
     print(f"=== DBB2 Engine — {args.seasons} season(s) ===\n")
-    contexts, projections, auction_values = project_all_season(args.seasons)
+    contexts, projections, auction_values = project_all_season(
+        args.seasons, max_workers=args.workers or None,
+    )
 
     # 2. Export CD JSON
     print()
@@ -39,6 +39,39 @@ def all_csv_paths(raw_data_dir):
     return paths
 
 
+@pytest.fixture(scope="session")
+def season_age_columns(all_csv_paths):
+    """(column index, age column) per season CSV, from one read of each file."""
+    result = {}
+    for path in all_csv_paths:
+        header = []
+        # usecols sees every header name (possibly more than once, hence
+        # the dedupe below); keep only age for the data pass
+        df = pd.read_csv(
+            path,
+            usecols=lambda column: header.append(column) or column == "age",
+            dtype={"age": "float32"},
+        )
+        result[path] = (pd.Index(dict.fromkeys(header)), df.get("age"))
+    return result
+
+
+@pytest.fixture(scope="session")
+def season_headers(season_age_columns):
+    """Column index of each season CSV."""
+    return {path: header for path, (header, _) in season_age_columns.items()}
+
+
+@pytest.fixture(scope="session")
+def season_age_null_rates(season_age_columns):
+    """Fraction of rows with a null age, per season CSV that has one."""
+    return {
+        path: age.isna().mean()
+        for path, (_, age) in season_age_columns.items()
+        if age is not None
+    }
+
+
 @pytest.fixture(scope="session")
 def age_profiles_overall():
     """Load the overall age profiles dict."""
@@ -11,6 +11,11 @@ import pytest
 
 from data_collection.utils import STAT_COLUMNS, rebucket_role
 
+# Per-stat profile field names, in STAT_COLUMNS order
+AVG_FIELDS = tuple(f"avg_{stat}" for stat in STAT_COLUMNS)
+STDDEV_FIELDS = tuple(f"stddev_{stat}" for stat in STAT_COLUMNS)
+VARIANCE_FIELDS = tuple(f"variance_{stat}" for stat in STAT_COLUMNS)
+
 
 # ---------------------------------------------------------------------------
 # Unit Tests — no generated data needed
@@ -252,57 +257,66 @@ class TestEdgeCases:
         )
 
 
+@pytest.fixture(scope="module")
+def age_profile_arrays(age_profiles_overall):
+    """
+    Overall profile buckets as (keys, {"avg", "stddev", "variance"}) with one
+    (buckets × STAT_COLUMNS) float matrix per field family.
+    """
+    keys = list(age_profiles_overall)
+    entries = list(age_profiles_overall.values())
+    arrays = {
+        name: np.array([[entry[field] for field in fields] for entry in entries], dtype=np.float64)
+        for name, fields in (("avg", AVG_FIELDS), ("stddev", STDDEV_FIELDS),
+                             ("variance", VARIANCE_FIELDS))
+    }
+    return keys, arrays
+
+
+def _first_offender(keys, fields, values, bad):
+    """Assertion message naming the first failing bucket/field."""
+    row, col = np.argwhere(bad)[0]
+    return f"{keys[row]}: {fields[col]} = {values[row, col]}"
+
+
 class TestDataIntegrity:
     """Verify mathematical consistency and non-negativity."""
 
-    def test_all_averages_non_negative(self, age_profiles_overall):
-        for key, entry in age_profiles_overall.items():
-            for stat in STAT_COLUMNS:
-                avg_val = entry[f"avg_{stat}"]
-                assert avg_val >= 0, f"{key}: avg_{stat} = {avg_val}"
+    def test_all_averages_non_negative(self, age_profile_arrays):
+        keys, arrays = age_profile_arrays
+        avg = arrays["avg"]
+        assert (avg >= 0).all(), _first_offender(keys, AVG_FIELDS, avg, ~(avg >= 0))
 
-    def test_all_stddev_non_negative(self, age_profiles_overall):
-        for key, entry in age_profiles_overall.items():
-            for stat in STAT_COLUMNS:
-                stddev_val = entry[f"stddev_{stat}"]
-                assert stddev_val >= 0, f"{key}: stddev_{stat} = {stddev_val}"
+    def test_all_stddev_non_negative(self, age_profile_arrays):
+        keys, arrays = age_profile_arrays
+        stddev = arrays["stddev"]
+        assert (stddev >= 0).all(), _first_offender(keys, STDDEV_FIELDS, stddev, ~(stddev >= 0))
 
-    def test_variance_approx_stddev_squared(self, age_profiles_overall):
+    def test_variance_approx_stddev_squared(self, age_profile_arrays):
         """variance should approximately equal stddev^2."""
-        for key, entry in age_profiles_overall.items():
-            for stat in STAT_COLUMNS:
-                stddev = entry[f"stddev_{stat}"]
-                variance = entry[f"variance_{stat}"]
-                expected = stddev ** 2
-                assert abs(variance - expected) < 0.1, (
-                    f"{key}: variance_{stat}={variance}, stddev^2={expected}"
-                )
-
-    def test_min_sample_enforced(self, age_profiles_overall):
-        for key, entry in age_profiles_overall.items():
-            assert entry["sample_size"] >= 50, (
-                f"{key}: sample_size = {entry['sample_size']}"
-            )
-
-    def test_min_sample_enforced_modern(self, age_profiles_modern):
-        for key, entry in age_profiles_modern.items():
-            assert entry["sample_size"] >= 50
-
-    def test_min_sample_enforced_pre_modern(self, age_profiles_pre_modern):
-        for key, entry in age_profiles_pre_modern.items():
-            assert entry["sample_size"] >= 50
+        keys, arrays = age_profile_arrays
+        variance = arrays["variance"]
+        close = np.abs(variance - arrays["stddev"] ** 2) < 0.1
+        assert close.all(), _first_offender(keys, VARIANCE_FIELDS, variance, ~close)
+
+    @pytest.mark.parametrize("profiles_fixture", [
+        "age_profiles_overall", "age_profiles_modern", "age_profiles_pre_modern",
+    ])
+    def test_min_sample_enforced(self, request, profiles_fixture):
+        profiles = request.getfixturevalue(profiles_fixture)
+        keys = list(profiles)
+        sizes = np.array([entry["sample_size"] for entry in profiles.values()])
+        small = sizes < 50
+        assert not small.any(), (
+            f"{keys[np.argmax(small)]}: sample_size = {sizes[np.argmax(small)]}"
+        )
 
     def test_all_expected_fields_present(self, age_profiles_overall):
         """Every bucket should have all 39 stat fields + sample_size."""
-        expected_fields = set()
-        for stat in STAT_COLUMNS:
-            expected_fields.add(f"avg_{stat}")
-            expected_fields.add(f"stddev_{stat}")
-            expected_fields.add(f"variance_{stat}")
-        expected_fields.add("sample_size")
+        expected_fields = {*AVG_FIELDS, *STDDEV_FIELDS, *VARIANCE_FIELDS, "sample_size"}
 
         for key, entry in age_profiles_overall.items():
-            missing = expected_fields - set(entry.keys())
+            missing = expected_fields - entry.keys()
             assert not missing, f"{key} missing fields: {missing}"
 
     def test_tuple_key_types(self, age_profiles_overall):
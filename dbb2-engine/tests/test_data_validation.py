@@ -6,7 +6,6 @@ reasonable value ranges, and acceptable null coverage.
 """
 
 import pytest
-import pandas as pd
 from pathlib import Path
 
 from data_collection.utils import (
@@ -32,11 +31,10 @@ class TestCSVSchema:
         assert stems[0].startswith("games_1995"), f"First file: {stems[0]}"
         assert stems[-1].startswith("games_2024"), f"Last file: {stems[-1]}"
 
-    def test_all_csvs_have_required_columns(self, all_csv_paths):
+    def test_all_csvs_have_required_columns(self, season_headers):
         required = set(CSV_COLUMNS)
-        for path in all_csv_paths:
-            df = pd.read_csv(path, nrows=1)
-            missing = required - set(df.columns)
+        for path, columns in season_headers.items():
+            missing = required - set(columns)
             assert not missing, (
                 f"{path.name} missing columns: {missing}"
             )
@@ -139,11 +137,9 @@ class TestUtilities:
 class TestNullCoverage:
     """Check null rates across all seasons for critical fields."""
 
-    def test_age_null_rate_across_all_seasons(self, all_csv_paths):
+    def test_age_null_rate_across_all_seasons(self, season_age_null_rates):
         """Age nulls should be minimal — older seasons may have more."""
-        for path in all_csv_paths:
-            df = pd.read_csv(path, usecols=["age"])
-            null_rate = df["age"].isna().mean()
+        for path, null_rate in season_age_null_rates.items():
             assert null_rate < 0.30, (
                 f"{path.name}: age null rate {null_rate:.1%} exceeds 30%"
             )
@@ -7,17 +7,21 @@ Integration test hits the real pipeline via TestClient.
 
 import math
 
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
 from engine.api import (
     app,
-    _get_std_dev,
-    _get_confidence,
     _build_player_response,
     _safe_cosine_similarity,
-    STAT_MAP,
-    VARIANCE_KEY_MAP,
+    _index_pipeline,
+    _load_pipeline_artifacts,
+    _round_projection_columns,
+    PIPELINE_SEASONS,
+)
+from engine.props import (
+    STAT_MAP, VARIANCE_KEY_MAP, get_confidence, get_confidences, get_std_dev, get_std_devs,
 )
 from engine.baseline import PlayerContext
 from engine.projections import SeasonProjection
@@ -88,27 +92,27 @@ class TestStdDev:
     def test_known_variance(self):
         """sqrt(25.0) = 5.0 for points."""
         ctx = _make_context()
-        assert _get_std_dev(ctx, "points") == pytest.approx(5.0)
+        assert get_std_dev(ctx, "points") == pytest.approx(5.0)
 
     def test_all_six_stats(self):
         """All 6 betting props should return positive std_dev."""
         ctx = _make_context()
         for stat in STAT_MAP:
-            sd = _get_std_dev(ctx, stat)
+            sd = get_std_dev(ctx, stat)
             assert sd > 0, f"{stat} std_dev should be > 0"
 
     def test_missing_variance_returns_zero(self):
         ctx = _make_context(stat_variance={})
-        assert _get_std_dev(ctx, "points") == 0.0
+        assert get_std_dev(ctx, "points") == 0.0
 
     def test_unknown_stat_returns_zero(self):
         ctx = _make_context()
-        assert _get_std_dev(ctx, "nonexistent") == 0.0
+        assert get_std_dev(ctx, "nonexistent") == 0.0
 
     def test_negative_variance_safe(self):
         """Negative variance (shouldn't happen) returns 0, not crash."""
         ctx = _make_context(stat_variance={"points_variance": -1.0})
-        assert _get_std_dev(ctx, "points") == 0.0
+        assert get_std_dev(ctx, "points") == 0.0
 
 
 class TestConfidence:
@@ -116,37 +120,82 @@ class TestConfidence:
 
     def test_high_consistency_low_cv(self):
         """High consistency + low CV -> high confidence."""
-        conf = _get_confidence(projection_value=20.0, std_dev=2.0, base_confidence=0.80)
+        conf = get_confidence(projection_value=20.0, std_dev=2.0, base_confidence=0.80)
         # CV = 2/20 = 0.10, conf = 0.80 * (1 - 0.10) = 0.72
         assert conf == pytest.approx(0.72, abs=0.01)
 
     def test_low_consistency_high_cv(self):
         """Low consistency + high CV -> clamped to 0.40."""
-        conf = _get_confidence(projection_value=1.0, std_dev=2.0, base_confidence=0.40)
+        conf = get_confidence(projection_value=1.0, std_dev=2.0, base_confidence=0.40)
         # CV = 2.0, capped at 0.5, conf = 0.40 * (1 - 0.5) = 0.20 -> clamped to 0.40
         assert conf == 0.40
 
     def test_zero_projection(self):
         """Zero projection falls back to 80% of base, clamped."""
-        conf = _get_confidence(projection_value=0.0, std_dev=1.0, base_confidence=0.70)
+        conf = get_confidence(projection_value=0.0, std_dev=1.0, base_confidence=0.70)
         assert conf == pytest.approx(0.56, abs=0.01)
 
     def test_zero_std_dev(self):
         """Zero std_dev falls back to 80% of base, clamped."""
-        conf = _get_confidence(projection_value=20.0, std_dev=0.0, base_confidence=0.70)
+        conf = get_confidence(projection_value=20.0, std_dev=0.0, base_confidence=0.70)
         assert conf == pytest.approx(0.56, abs=0.01)
 
     def test_clamp_max_095(self):
         """Confidence should never exceed 0.95."""
-        conf = _get_confidence(projection_value=30.0, std_dev=0.1, base_confidence=0.99)
+        conf = get_confidence(projection_value=30.0, std_dev=0.1, base_confidence=0.99)
         assert conf <= 0.95
 
     def test_clamp_min_040(self):
         """Confidence should never go below 0.40."""
-        conf = _get_confidence(projection_value=0.5, std_dev=5.0, base_confidence=0.30)
+        conf = get_confidence(projection_value=0.5, std_dev=5.0, base_confidence=0.30)
         assert conf >= 0.40
 
 
+class TestVectorizedProps:
+    """get_std_devs / get_confidences match the scalar helpers."""
+
+    def test_matches_scalar(self):
+        contexts = [
+            _make_context(),
+            _make_context(stat_variance={}),
+            _make_context(stat_variance={"points_variance": -1.0, "blocks_variance": 0.7}),
+        ]
+        values = np.array([
+            [20.0, 8.0, 5.0, 2.0, 1.2, 0.8],
+            [0.0, 3.0, 1.0, 0.0, 0.5, 0.1],
+            [0.5, 1.0, 30.0, 2.5, 0.0, 0.6],
+        ])
+        base = np.array([0.80, 0.70, 0.30])
+
+        std_devs = get_std_devs(contexts)
+        confidences = get_confidences(values, std_devs, base)
+
+        for i, ctx in enumerate(contexts):
+            for j, stat in enumerate(STAT_MAP):
+                sd = get_std_dev(ctx, stat)
+                assert std_devs[i, j] == sd
+                assert confidences[i, j] == get_confidence(values[i, j], sd, base[i])
+
+    def test_half_cent_rounds_like_scalar(self):
+        """cv >= 0.5 halves a 0.81 base to 0.405; both paths must agree."""
+        values = np.array([[10.0, 4.0]])
+        std_devs = np.array([[6.0, 2.0]])
+        confidences = get_confidences(values, std_devs, np.array([0.81]))
+        assert confidences.tolist() == [[
+            get_confidence(10.0, 6.0, 0.81),
+            get_confidence(4.0, 2.0, 0.81),
+        ]]
+
+    def test_empty(self):
+        assert get_std_devs([]).shape == (0, len(STAT_MAP))
+
+    def test_stat_subsets(self):
+        ctx = _make_context(stat_variance={"points_variance": 16.0, "blocks_variance": 0.25})
+        assert get_std_devs([ctx], ("points",)).tolist() == [[4.0]]
+        assert get_std_devs([ctx], ("blocks", "steals")).tolist() == [[0.5, 0.0]]
+        assert get_std_devs([ctx], ()).shape == (1, 0)
+
+
 class TestPlayerResponse:
     """Response shape for the betting engine contract."""
 
@@ -264,7 +313,7 @@ def _mock_pipeline():
     )
     av1 = AuctionValue(player_id="P1", player_name="Alpha Guard", position="G", dollar_value=34)
     av2 = AuctionValue(player_id="P2", player_name="Beta Big", position="C", dollar_value=28)
-    return [ctx1, ctx2], [proj1, proj2], [av1, av2]
+    return _index_pipeline([ctx1, ctx2], [proj1, proj2], [av1, av2])
 
 
 class TestApiEndpoints:
@@ -302,6 +351,41 @@ class TestApiEndpoints:
         assert body["players"][0]["player_id"] in {"P1", "P2"}
         assert "fantasy_points" in body["players"][0]
 
+    def test_internal_baseline_rounded_stats(self, monkeypatch):
+        monkeypatch.setattr("engine.api._load_pipeline", _mock_pipeline)
+        monkeypatch.setenv("INTERNAL_API_KEY", "secret")
+        client = TestClient(app)
+        res = client.get("/api/internal/baseline-projections", headers={"x-api-key": "secret"})
+        row = next(p for p in res.json()["players"] if p["player_id"] == "P1")
+        assert row["points"] == 24.0
+        assert row["three_pointers"] == 2.0
+        assert row["fg_pct"] == 0.469
+        assert row["minutes"] == 32.0
+
+    def test_internal_rounding_matches_builtin(self):
+        proj = _make_projection(player_id="P1", rebounds=0.45)
+        row = _round_projection_columns([proj])["P1"]
+        assert row["rebounds"] == round(0.45, 1) == 0.5
+
+    def test_startup_warms_pipeline(self, monkeypatch):
+        calls = []
+
+        def counting_pipeline():
+            calls.append(1)
+            return _mock_pipeline()
+
+        monkeypatch.setattr("engine.api._load_pipeline", counting_pipeline)
+        with TestClient(app):
+            assert len(calls) == 1
+
+    def test_startup_survives_warmup_failure(self, monkeypatch):
+        def failing_pipeline():
+            raise FileNotFoundError("no CSVs")
+
+        monkeypatch.setattr("engine.api._load_pipeline", failing_pipeline)
+        with TestClient(app) as client:
+            assert client.get("/health").status_code == 200
+
     def test_lineup_optimize(self, monkeypatch):
         monkeypatch.setattr("engine.api._load_pipeline", _mock_pipeline)
         client = TestClient(app)
@@ -373,3 +457,59 @@ class TestApiEndpoints:
         assert "summary" in body
         assert body["summary"]["delta_fantasy_points"] != 0
         assert body["summary"]["verdict"] in {"accept", "decline"}
+
+
+class TestPipelineDiskCache:
+    def test_artifacts_written_then_reused(self, monkeypatch, tmp_path):
+        cache_path = tmp_path / "pipeline-v1-test.pkl"
+        calls = []
+
+        def fake_project_all_season(seasons_to_load=3):
+            calls.append(seasons_to_load)
+            return tuple(_mock_pipeline()[:3])
+
+        monkeypatch.setattr("engine.api._pipeline_cache_path", lambda: cache_path)
+        monkeypatch.setattr("engine.api.project_all_season", fake_project_all_season)
+
+        first = _load_pipeline_artifacts()
+        assert cache_path.exists()
+        second = _load_pipeline_artifacts()
+
+        assert calls == [PIPELINE_SEASONS]
+        assert second == first
+
+    def test_corrupt_cache_rebuilds(self, monkeypatch, tmp_path):
+        cache_path = tmp_path / "pipeline-v1-test.pkl"
+        cache_path.write_bytes(b"not a pickle")
+        monkeypatch.setattr("engine.api._pipeline_cache_path", lambda: cache_path)
+        monkeypatch.setattr(
+            "engine.api.project_all_season",
+            lambda seasons_to_load=3: tuple(_mock_pipeline()[:3]),
+        )
+
+        contexts, projections, auction_values = _load_pipeline_artifacts()
+        assert [c.player_id for c in contexts] == ["P1", "P2"]
+
+    def test_unimportable_cache_rebuilds(self, monkeypatch, tmp_path):
+        cache_path = tmp_path / "pipeline-v1-test.pkl"
+        cache_path.write_bytes(b"cno_such_module_for_pipeline_cache\nthing\n.")
+        monkeypatch.setattr("engine.api._pipeline_cache_path", lambda: cache_path)
+        monkeypatch.setattr(
+            "engine.api.project_all_season",
+            lambda seasons_to_load=3: tuple(_mock_pipeline()[:3]),
+        )
+
+        contexts, _, _ = _load_pipeline_artifacts()
+        assert [c.player_id for c in contexts] == ["P1", "P2"]
+        assert [p.name for p in tmp_path.iterdir()] == ["pipeline-v1-test.pkl"]
+
+    def test_source_change_changes_key(self, monkeypatch, tmp_path):
+        from engine import api
+        (tmp_path / "engine").mkdir()
+        source = tmp_path / "engine" / "projections.py"
+        source.write_text("PLAYER_WEIGHT = 0.7\n")
+        monkeypatch.setattr(api, "PIPELINE_SOURCE_DIRS", (tmp_path / "engine",))
+
+        before = api._source_digest()
+        source.write_text("PLAYER_WEIGHT = 0.6\n")
+        assert api._source_digest() != before
@@ -2,12 +2,20 @@
 Tests for engine/baseline.py — player context builder.
 """
 
+import os
+import pickle
+import sys
+from pathlib import Path
+
 import pytest
 import pandas as pd
 
-from data_collection.utils import STAT_COLUMNS
+from data_collection.utils import STAT_COLUMNS, atomic_write, load_seasons_range_cached
 from engine.baseline import (
     PlayerContext,
+    CONTEXT_CHUNKSIZE,
+    build_player_contexts_from_csv,
+    index_contexts,
     _compute_weighted_baseline,
     _compute_stat_variance,
     SEASON_WEIGHTS_3,
@@ -148,3 +156,123 @@ class TestPlayerContext:
         assert ctx.is_b2b is False
         assert ctx.rest_days == 1
         assert ctx.location == "HOME"
+
+    def test_index_contexts(self):
+        contexts = [
+            PlayerContext(
+                player_id=pid, player_name="Test", team="TST",
+                position="G", raw_position="G", age=25,
+                role="Starter", age_bracket="Young",
+            )
+            for pid in ("1", "2")
+        ]
+        index = index_contexts(contexts)
+        assert list(index) == ["1", "2"]
+        assert index["2"] is contexts[1]
+
+    def test_unpickle_interns_lookup_keys(self):
+        ctx = PlayerContext(
+            player_id="1", player_name="Test", team="TST",
+            position="G", raw_position="G", age=25,
+            role="".join(["Start", "er"]), age_bracket="".join(["Pri", "me"]),
+            baseline_stats={"points": 20.0},
+        )
+        restored = pickle.loads(pickle.dumps(ctx))
+        assert restored == ctx
+        assert restored.role is sys.intern("Starter")
+        assert restored.age_bracket is sys.intern("Prime")
+
+
+class TestSeasonsCache:
+    """Verify the Parquet cache in front of CSV season loading."""
+
+    @staticmethod
+    def _write_csv(data_dir, year, points):
+        df = _make_player_df([(year, 12, points, 30.0)])
+        df = df.drop(columns=["season_start_year", "position_group", "fantasy_points"])
+        path = data_dir / f"games_{year}_{str(year + 1)[-2:]}.csv"
+        df.to_csv(path, index=False)
+        return path
+
+    def test_cache_written_and_reused(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        data_dir, cache_dir = tmp_path / "raw", tmp_path / "cache"
+        data_dir.mkdir()
+        self._write_csv(data_dir, 2023, 18.0)
+        self._write_csv(data_dir, 2024, 20.0)
+
+        first = load_seasons_range_cached(2023, 2024, str(data_dir), str(cache_dir))
+        cached = list(cache_dir.glob("seasons_2023_2024_*.parquet"))
+        assert len(cached) == 1
+
+        second = load_seasons_range_cached(2023, 2024, str(data_dir), str(cache_dir))
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_cache_invalidated_on_csv_change(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        data_dir, cache_dir = tmp_path / "raw", tmp_path / "cache"
+        data_dir.mkdir()
+        path = self._write_csv(data_dir, 2024, 20.0)
+        load_seasons_range_cached(2024, 2024, str(data_dir), str(cache_dir))
+
+        self._write_csv(data_dir, 2024, 30.0)
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        df = load_seasons_range_cached(2024, 2024, str(data_dir), str(cache_dir))
+
+        assert df["points"].mean() > 25
+        assert len(list(cache_dir.glob("seasons_2024_2024_*.parquet"))) == 1
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path):
+        def fail(tmp):
+            with open(tmp, "w") as f:
+                f.write("partial")
+            raise OSError("disk full")
+
+        with pytest.raises(OSError):
+            atomic_write(tmp_path / "out.parquet", fail)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_written_file_mode_follows_umask(self, tmp_path):
+        plain, atomic = tmp_path / "plain.json", tmp_path / "atomic.json"
+        plain.write_text("{}")
+        atomic_write(atomic, lambda tmp: Path(tmp).write_text("{}"))
+        assert atomic.stat().st_mode == plain.stat().st_mode
+
+    def test_concurrent_writers_use_separate_temp_files(self, tmp_path):
+        target = tmp_path / "out.parquet"
+        temp_paths = []
+
+        def outer(tmp):
+            temp_paths.append(tmp)
+            atomic_write(target, lambda inner: temp_paths.append(inner))
+
+        atomic_write(target, outer)
+        assert len(set(temp_paths)) == 2
+        assert [p.name for p in tmp_path.iterdir()] == ["out.parquet"]
+
+
+class TestBuildContexts:
+    """Verify build_player_contexts_from_csv on synthetic game logs."""
+
+    @staticmethod
+    def _fake_league(n_players):
+        frames = []
+        for i in range(n_players):
+            df = _make_player_df([(2024, 12, 10.0 + i % 15, 30.0)])
+            df["player_id"] = f"P{i:03d}"
+            df["player_name"] = f"Player {i:03d}"
+            frames.append(df.drop(columns=["fantasy_points"]))
+        return pd.concat(frames, ignore_index=True)
+
+    def test_parallel_matches_serial(self, monkeypatch):
+        league = self._fake_league(CONTEXT_CHUNKSIZE + 6)
+        monkeypatch.setattr(
+            "engine.baseline.load_seasons_range_cached",
+            lambda start, end: league.copy(),
+        )
+        serial = build_player_contexts_from_csv(max_workers=1)
+        parallel = build_player_contexts_from_csv(max_workers=2)
+
+        assert len(serial) == CONTEXT_CHUNKSIZE + 6
+        assert serial == parallel
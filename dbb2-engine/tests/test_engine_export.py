@@ -3,6 +3,7 @@ Tests for engine/export.py — JSON output formatter.
 """
 
 import json
+import sys
 import tempfile
 from pathlib import Path
 
@@ -11,7 +12,12 @@ import pytest
 from engine.baseline import PlayerContext
 from engine.projections import SeasonProjection
 from engine.pricing import AuctionValue
-from engine.export import export_all
+from engine.export import (
+    export_all, _write_json, _compute_value_scores, _injury_codes, _context_injury_codes,
+    _role_risk_score, _generate_note,
+)
+from engine.export_betting import export_betting_contract
+from data_collection.utils import atomic_write
 
 
 def _make_contexts(n=5):
@@ -168,6 +174,58 @@ class TestProjectionsJson:
                         f"{pct_field} = {entry[pct_field]}"
                     )
 
+    def test_rounding_and_key_order(self):
+        projections = _make_projections(2)
+        projections[0].points = 21.04999
+        projections[0].rebounds = 0.45
+        projections[0].fg_pct = 0.46789
+        with tempfile.TemporaryDirectory() as tmpdir:
+            export_all(
+                _make_contexts(2), projections,
+                _make_auction_values(2), tmpdir,
+            )
+            data = json.loads((Path(tmpdir) / "projections.json").read_text())
+            entry = next(e for e in data if e["player_id"] == "P0")
+            assert entry["points"] == 21.0
+            assert entry["rebounds"] == round(0.45, 1) == 0.5
+            assert entry["fg_pct"] == 0.468
+            keys = list(entry)
+            assert keys[:5] == ["player_id", "name", "team", "position", "minutes"]
+            assert keys[-1] == "consistency"
+
+
+class TestBettingContract:
+    """betting_contract.json output validation."""
+
+    def test_half_step_values_round_like_builtin(self):
+        contexts = _make_contexts(1)
+        contexts[0].stat_variance = {"points_variance": 0.015 ** 2}
+        projections = _make_projections(1)
+        projections[0].points = 0.45
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = export_betting_contract(contexts, projections, output_dir=tmpdir)
+            points = json.loads(Path(path).read_text())["P0"]["props"]["points"]
+        assert points["projection"] == round(0.45, 1) == 0.5
+        assert points["std_dev"] == round(0.015, 2) == 0.01
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_written_atomically(self, monkeypatch, tmp_path, use_orjson):
+        # engine.export_betting is shadowed by the package-level function
+        betting_module = sys.modules[export_betting_contract.__module__]
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(betting_module, "orjson", None)
+        replaced = []
+        monkeypatch.setattr(
+            betting_module, "atomic_write",
+            lambda path, write: replaced.append(path) or atomic_write(path, write),
+        )
+        path = export_betting_contract(_make_contexts(2), _make_projections(2), output_dir=str(tmp_path))
+        assert replaced == [Path(path)]
+        assert set(json.loads(Path(path).read_text())) == {"P0", "P1"}
+        assert [p.name for p in tmp_path.iterdir()] == ["betting_contract.json"]
+
 
 class TestRiskJson:
     """risk.json output validation."""
@@ -235,6 +293,90 @@ class TestInsightsJson:
                 assert len(entry["notes"]) > 0
 
 
+class TestValueScores:
+    """Percentile ranking used for insights.json value_score."""
+
+    def test_ties_and_unpriced(self):
+        contexts = _make_contexts(4)
+        auctions = _make_auction_values(3)
+        auctions[0].dollar_value = auctions[1].dollar_value = 20
+        auctions[2].dollar_value = 40
+        auction_map = {a.player_id: a for a in auctions}
+
+        # P2 tops the pool; P0/P1 tie with one player above; P3 is unpriced
+        assert _compute_value_scores(contexts, auction_map) == [66, 66, 100, 50]
+
+    def test_empty_auction_map(self):
+        assert _compute_value_scores(_make_contexts(2), {}) == [50, 50]
+
+
+class TestInjuryCodes:
+    """Injury status classification for role_risk."""
+
+    def test_status_codes(self):
+        codes = _injury_codes({
+            "1": {"status": "Out"},
+            "2": {"status": "Doubtful"},
+            "3": {"status": "GTD - Questionable"},
+            "4": {"status": "Day-To-Day"},
+            "5": {"status": "Active"},
+            "6": {},
+        })
+        assert codes == {"1": 1, "2": 2, "3": 3, "4": 4, "5": 0}
+
+    def test_id_before_name(self):
+        contexts = _make_contexts(3)
+        live_context = {
+            "injury_by_id": {"P0": {"status": "Questionable"}},
+            "injury_by_name": {"player 0": {"status": "Out"}, "player 1": {"status": "Out"}},
+        }
+        assert _context_injury_codes(contexts, live_context) == [3, 1, 0]
+        assert _context_injury_codes(contexts, None) == [0, 0, 0]
+
+    def test_out_raises_role_risk(self):
+        def p0_role_risk(injury_by_id):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                export_all(
+                    _make_contexts(), _make_projections(),
+                    _make_auction_values(), tmpdir,
+                    live_context={"injury_by_id": injury_by_id, "injury_by_name": {}},
+                )
+                data = json.loads((Path(tmpdir) / "risk.json").read_text())
+                return next(e["role_risk"] for e in data if e["player_id"] == "P0")
+
+        healthy = p0_role_risk({})
+        # +0.25 status bump on top of the availability hit from missed games
+        assert p0_role_risk({"P0": {"status": "Out"}}) >= healthy + 0.25
+
+
+class TestRoleRiskTiers:
+    """Minutes tier boundaries are inclusive on the lower edge."""
+
+    @pytest.mark.parametrize("minutes,expected", [
+        (10.0, 0.35), (15.0, 0.28), (21.9, 0.28), (22.0, 0.20),
+        (28.0, 0.12), (31.9, 0.12), (32.0, 0.05), (38.0, 0.05),
+    ])
+    def test_tier_edges(self, minutes, expected):
+        assert _role_risk_score(minutes, 0.0, 0.0, 100) == pytest.approx(expected)
+
+
+class TestGenerateNote:
+    """Note tiers switch at their lower edge."""
+
+    def test_tier_edges(self):
+        ctx = _make_contexts(1)[0]
+        proj = _make_projections(1)[0]
+        proj.consistency = 70
+        auction = _make_auction_values(1)[0]
+        note = _generate_note(ctx, proj, auction, 90, 30)
+        assert note == "Elite value ($5), moderate risk. Young G Starter with elite consistency."
+
+    def test_defaults_without_projection_or_auction(self):
+        ctx = _make_contexts(1)[0]
+        note = _generate_note(ctx, None, None, 39, 60)
+        assert note == "Low value ($1), high risk. Young G Starter with solid consistency."
+
+
 class TestFileCount:
     """Should produce exactly 4 JSON files."""
 
@@ -249,3 +391,67 @@ class TestFileCount:
                           "risk.json", "insights.json"):
                 assert name in files
                 assert Path(files[name]).exists()
+
+
+class TestWriteJson:
+    """_write_json output is identical JSON with or without orjson."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_roundtrip(self, monkeypatch, tmp_path, use_orjson):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("engine.export.orjson", None)
+        data = [{"player_id": "P1", "name": "Nikola Jokić", "points": 26.4, "consistency": 71}]
+        path = tmp_path / "out.json"
+        _write_json(path, data)
+        assert json.loads(path.read_text(encoding="utf-8")) == data
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_compact_by_default(self, monkeypatch, tmp_path, use_orjson):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("engine.export.orjson", None)
+        monkeypatch.delenv("CD_PRETTY_JSON", raising=False)
+        path = tmp_path / "out.json"
+        _write_json(path, [{"a": 1}, {"b": 2}])
+        assert path.read_text() == '[{"a":1},{"b":2}]'
+
+        monkeypatch.setenv("CD_PRETTY_JSON", "1")
+        _write_json(path, [{"a": 1}])
+        assert path.read_text() == '[\n  {\n    "a": 1\n  }\n]'
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_streams_generator(self, monkeypatch, tmp_path, use_orjson):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("engine.export.orjson", None)
+        monkeypatch.delenv("CD_PRETTY_JSON", raising=False)
+        path = tmp_path / "out.json"
+        _write_json(path, ({"i": i} for i in range(3)))
+        assert path.read_text() == '[{"i":0},{"i":1},{"i":2}]'
+        _write_json(path, iter(()))
+        assert path.read_text() == "[]"
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        path = tmp_path / "out.json"
+        _write_json(path, [{"a": 1}])
+
+        def broken():
+            yield {"a": 2}
+            raise RuntimeError("encoder failed")
+
+        with pytest.raises(RuntimeError):
+            _write_json(path, broken())
+        assert json.loads(path.read_text()) == [{"a": 1}]
+        assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+    def test_failed_encode_keeps_previous_file(self, tmp_path):
+        path = tmp_path / "out.json"
+        _write_json(path, [{"a": 1}])
+        with pytest.raises(TypeError):
+            _write_json(path, [{"a": object()}])
+        assert json.loads(path.read_text()) == [{"a": 1}]
+        assert list(tmp_path.iterdir()) == [path]
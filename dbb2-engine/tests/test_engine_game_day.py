@@ -2,17 +2,24 @@
 Tests for engine/game_day.py — DFS game-day adjustments.
 """
 
+import sys
+
+import numpy as np
 import pytest
 
 from engine.game_day import (
+    GAME_DAY_STATS,
     project_game_day,
+    project_game_day_batch,
+    _clamp_compound,
+    _fantasy_points_matrix,
     _get_schedule_multiplier,
     _get_city_multiplier,
     _get_matchup_multipliers,
     COMPOUND_MIN,
     COMPOUND_MAX,
 )
-from engine.projections import SeasonProjection
+from engine.projections import SeasonProjection, _calculate_fantasy_points
 from engine.baseline import PlayerContext
 
 
@@ -177,6 +184,11 @@ class TestCompoundClamp:
         gd = project_game_day(ctx, proj)
         assert 0.9 <= gd.compound_multiplier <= 1.1
 
+    def test_clamp_matches_np_clip(self):
+        values = [-1.0, 0.0, 0.49, 0.5, 0.97, 1.5, 1.51, 9.0]
+        clipped = np.clip(values, COMPOUND_MIN, COMPOUND_MAX).tolist()
+        assert [_clamp_compound(v) for v in values] == clipped
+
 
 class TestGameDayOutput:
     """Full game-day projection output."""
@@ -195,3 +207,41 @@ class TestGameDayOutput:
         gd = project_game_day(ctx, proj)
         assert gd.player_id == "XYZ"
         assert gd.player_name == "John Doe"
+
+
+class TestGameDayBatch:
+    """project_game_day_batch matches the per-player path exactly."""
+
+    def test_matches_scalar(self):
+        contexts = [
+            _make_context(),
+            _make_context(player_id="B2B", is_b2b=True, is_post_hot_spot=True),
+            _make_context(player_id="REST", rest_days=4, opponent_defense_tier="Elite",
+                          location="ROAD", role="Bench", position="C"),
+            _make_context(player_id="ALT", is_post_altitude=True, is_b2b=True,
+                          is_death_spot=True, death_spot_type="altitude_b2b",
+                          opponent_defense_tier="Poor", age_bracket="Veteran"),
+        ]
+        projs = [_make_season_proj(player_id=c.player_id) for c in contexts]
+
+        batch = project_game_day_batch(contexts, projs)
+        assert batch == [project_game_day(c, p) for c, p in zip(contexts, projs)]
+
+    def test_empty(self):
+        assert project_game_day_batch([], []) == []
+
+    def test_fantasy_points_matrix_matches_scalar(self):
+        rows = [
+            [30.0, 20.0, 10.0, 5.0, 1.0, 1.0, 2.0, 8.0, 16.0, 2.0, 5.0, 4.0, 5.0],
+            [12.3, 7.7, 3.1, 1.9, 0.6, 0.4, 1.3, 2.9, 6.1, 0.8, 2.2, 1.1, 1.4],
+            [0.0] * len(GAME_DAY_STATS),
+        ]
+        fp = _fantasy_points_matrix(np.array(rows))
+        for row, value in zip(rows, fp.tolist()):
+            assert value == _calculate_fantasy_points(dict(zip(GAME_DAY_STATS, row)))
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_projection_has_no_instance_dict(self):
+        proj = project_game_day(_make_context(), _make_season_proj())
+        assert not hasattr(proj, "__dict__")
+        assert getattr(proj, "three_pm", None) is not None
@@ -1,4 +1,5 @@
 from engine.live_data import (
+    build_injury_lookup,
     calculate_injury_modifier,
     compute_remaining_games_fields,
     normalize_name,
@@ -9,6 +10,13 @@ def test_normalize_name():
     assert normalize_name("LeBron James Jr.") == "lebron james"
 
 
+def test_normalize_name_suffixes():
+    assert normalize_name("Robert Williams III") == "robert williams"
+    assert normalize_name("Larry Nance Sr. ") == "larry nance"
+    assert normalize_name("Jr. Smith") == "jr. smith"
+    assert normalize_name(None) == ""
+
+
 def test_season_ending_modifier():
     injuries_by_id = {
         "1": {"status": "Out", "injury_type": "ACL", "details": "out for season"}
@@ -34,3 +42,39 @@ def test_compute_remaining_games_fields():
     assert fields["team_games_remaining"] == 32
     assert fields["games_remaining_projected"] >= 0
     assert fields["three_pointers_made_projected"] >= 0
+
+
+def test_injury_modifier_tiers():
+    cases = [
+        ({"status": "Out", "injury_type": "Torn Achilles", "details": ""}, 0.0),
+        ({"status": "Out", "injury_type": "Hamstring", "details": "Out indefinitely"}, 0.50),
+        ({"status": "Out", "injury_type": "Calf", "details": "Re-evaluated in two weeks"}, 0.75),
+        ({"status": "Out", "injury_type": "Illness", "details": "Ruled out for Friday's game"}, 0.85),
+        ({"status": "Day-To-Day", "injury_type": "Wrist", "details": ""}, 0.95),
+        ({"status": "Active", "injury_type": "Rest", "details": "Expected to play"}, 0.98),
+        ({"status": "Out", "injury_type": "Left Knee", "details": ""}, 0.0),
+        ({"status": "Out", "injury_type": "Illness", "details": ""}, 0.80),
+    ]
+    for injury, expected in cases:
+        assert calculate_injury_modifier("1", "Player", {"1": injury}, {}) == expected, injury
+
+
+def test_injury_modifier_id_before_name():
+    by_id = {"1": {"status": "Day-To-Day"}}
+    by_name = {"player": {"status": "Out", "injury_type": "ACL"}}
+    assert calculate_injury_modifier("1", "Player", by_id, by_name) == 0.95
+    assert calculate_injury_modifier("2", "Player", by_id, by_name) == 0.0
+    assert calculate_injury_modifier("2", "Other", by_id, by_name) == 1.0
+    assert calculate_injury_modifier("2", "Player", by_id, {}) == 1.0
+
+
+def test_build_injury_lookup_precomputes_modifier():
+    raw = {"player_id": 7, "name": "Jaren Jackson Jr.", "status": "Out",
+           "injury_type": "ACL", "details": ""}
+    by_id, by_name = build_injury_lookup([raw])
+    assert "_modifier" not in raw
+    assert by_id["7"] is by_name["jaren jackson"]
+    assert by_id["7"]["_modifier"] == 0.0
+    assert by_id["7"]["status"] == "Out"
+    assert calculate_injury_modifier("7", "", by_id, by_name) == 0.0
+    assert calculate_injury_modifier("8", "Jaren Jackson Jr.", by_id, by_name) == 0.0
@@ -101,6 +101,47 @@ class TestAgeProfileLookup:
         assert result is not None or True
 
 
+class TestResolvedAgeTables:
+    """Precomputed age-keyed tables agree with the fallback chain."""
+
+    @pytest.mark.parametrize("era", ["overall", "modern", "pre_modern"])
+    def test_age_profiles_match_chain(self, era):
+        from engine.lookup import (
+            AGE_PROFILES_OVERALL, RESOLVED_AGES, ROLE_FALLBACK,
+            _ERA_MAP, _fallback_age_keyed, lookup_age_profile,
+        )
+        for age in RESOLVED_AGES:
+            for pos in ("G", "F", "C"):
+                for role in ROLE_FALLBACK:
+                    expected = _fallback_age_keyed(_ERA_MAP[era], age, pos, role)
+                    if expected is None:
+                        expected = _fallback_age_keyed(AGE_PROFILES_OVERALL, age, pos, role)
+                    assert lookup_age_profile(age, pos, role, era) is expected
+
+    def test_profile_tables_match_chain(self):
+        from engine.lookup import (
+            CEILING_PROFILES, DURABILITY_PROFILES, USAGE_PROFILES,
+            RESOLVED_AGES, ROLE_FALLBACK, _fallback_age_keyed,
+            lookup_ceiling_profile, lookup_durability, lookup_usage,
+        )
+        tables = [
+            (lookup_ceiling_profile, CEILING_PROFILES),
+            (lookup_durability, DURABILITY_PROFILES),
+            (lookup_usage, USAGE_PROFILES),
+        ]
+        for lookup_fn, data in tables:
+            for age in RESOLVED_AGES:
+                for pos in ("G", "F", "C"):
+                    for role in ROLE_FALLBACK:
+                        assert lookup_fn(age, pos, role) is _fallback_age_keyed(data, age, pos, role)
+
+    def test_outside_range_walks_chain(self):
+        from engine.lookup import AGE_PROFILES_OVERALL, _fallback_age_keyed, lookup_age_profile
+        for age, role in ((47, "Starter"), (25, "Unknown")):
+            expected = _fallback_age_keyed(AGE_PROFILES_OVERALL, age, "G", role)
+            assert lookup_age_profile(age, "G", role) is expected
+
+
 class TestCeilingProfileLookup:
     """Ceiling profile lookups."""
 
@@ -200,3 +241,16 @@ class TestPositionScarcityLookup:
         from engine.lookup import lookup_position_scarcity
         result = lookup_position_scarcity("X")
         assert result["scarcity_multiplier"] == 1.0
+
+
+class TestMemoizedLookups:
+    """Bracket, matchup and position lookups are cached at the boundary."""
+
+    def test_repeat_calls_hit_cache(self):
+        from engine.lookup import lookup_matchup, lookup_position_scarcity
+        key = ("Prime", "G", "Starter", "Elite", "HOME")
+        first = lookup_matchup(*key)
+        hits = lookup_matchup.cache_info().hits
+        assert lookup_matchup(*key) is first
+        assert lookup_matchup.cache_info().hits == hits + 1
+        assert lookup_position_scarcity("X") is lookup_position_scarcity("X")
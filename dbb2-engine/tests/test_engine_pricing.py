@@ -2,6 +2,8 @@
 Tests for engine/pricing.py — auction pricing.
 """
 
+import sys
+
 import pytest
 
 from engine.pricing import (
@@ -73,6 +75,15 @@ class TestZScores:
         positive_count = sum(1 for z in zscores.values() if z > 0)
         assert positive_count >= 4
 
+    def test_unknown_position_uses_all_baseline(self):
+        from engine.lookup import lookup_zscore_baseline
+        proj = _make_proj(position="X")
+        baseline = lookup_zscore_baseline("X")
+        zscores = _compute_category_zscores(proj)
+        assert zscores["points"] == (
+            (proj.points - baseline["points_mean"]) / baseline["points_stddev"]
+        )
+
 
 class TestSGPWeighting:
     """SGP weight application."""
@@ -104,6 +115,40 @@ class TestSGPWeighting:
         assert val_c > val_g
 
 
+class TestVectorizedPricing:
+    """price_auction's matrix pass matches the per-player helpers."""
+
+    def test_matches_scalar_helpers(self):
+        from engine.lookup import get_sgp_weights, lookup_position_scarcity
+        sgp = get_sgp_weights()
+        positions = ["G", "F", "C", "G-F"]
+        projections = [
+            _make_proj(player_id=f"P{i}", position=positions[i % 4],
+                       points=6.0 + i * 0.17, blocks=0.01 * i,
+                       three_pm=0.0 if i % 4 == 2 else 1.5)
+            for i in range(200)
+        ]
+        values = price_auction(projections)
+        for proj, value in zip(projections, values):
+            zscores = _compute_category_zscores(proj)
+            sgp_val = _apply_sgp_weights(
+                zscores, proj.position, sgp["category_weights"], sgp["position_bonuses"]
+            )
+            scarcity = lookup_position_scarcity(proj.position).get("scarcity_multiplier", 1.0)
+            assert value.player_id == proj.player_id
+            assert value.raw_z_score == sum(zscores.values())
+            assert value.sgp_value == sgp_val
+            assert value.scarcity_adjusted == sgp_val * scarcity
+
+    def test_empty(self):
+        assert price_auction([]) == []
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_value_has_no_instance_dict(self):
+        values = price_auction([_make_proj(player_id=f"P{i}") for i in range(200)])
+        assert not hasattr(values[0], "__dict__")
+
+
 class TestDollarMapping:
     """Dollar value mapping."""
 
@@ -154,3 +199,9 @@ class TestBudgetConstraint:
         values = price_auction(projections)
         total = sum(v.dollar_value for v in values)
         assert total == TOTAL_BUDGET
+
+    def test_small_pool_stops_at_max_price(self):
+        """A pool too small to absorb the budget caps everyone at MAX_PRICE."""
+        projections = [_make_proj(player_id=f"P{i}", points=10.0 + i) for i in range(5)]
+        values = price_auction(projections)
+        assert [v.dollar_value for v in values] == [MAX_PRICE] * 5
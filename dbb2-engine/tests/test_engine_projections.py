@@ -2,11 +2,16 @@
 Tests for engine/projections.py — season-long projection pipeline.
 """
 
+import pickle
+import sys
+
 import pytest
 
 from engine.projections import (
     project_season,
+    project_season_batch,
     _apply_age_adjustment,
+    _blend_with_profile,
     _calculate_fantasy_points,
     _calculate_percentages,
     _project_games_played,
@@ -88,6 +93,13 @@ class TestAgeAdjustment:
         result = _apply_age_adjustment(baseline, 99, "X", "Unknown")
         assert result["points"] == 20.0
 
+    def test_partial_profile_blends_missing_stats_with_baseline(self):
+        blended = _blend_with_profile([20.0, 4.0], (PROFILE_WEIGHT * 10.0, None))
+        assert blended == [
+            PLAYER_WEIGHT * 20.0 + PROFILE_WEIGHT * 10.0,
+            PLAYER_WEIGHT * 4.0 + PROFILE_WEIGHT * 4.0,
+        ]
+
 
 class TestDurabilityProjection:
     """Games played projection."""
@@ -221,3 +233,41 @@ class TestFullProjection:
                       "three_pm", "three_pa", "ftm", "fta",
                       "fantasy_points", "ceiling", "floor"):
             assert getattr(proj, attr) >= 0.0, f"{attr} is negative"
+
+
+class TestSeasonBatch:
+    """project_season_batch matches the per-player path exactly."""
+
+    def test_matches_scalar(self):
+        contexts = [
+            _make_context(),
+            _make_context(player_id="VET", age=36, position="C", role="Bench"),
+            _make_context(player_id="NOVAR", stat_variance={}, games_by_season={}),
+            _make_context(player_id="MISS", age=99, position="X", role="Unknown"),
+            _make_context(player_id="ZERO", baseline_stats={}),
+        ]
+        assert project_season_batch(contexts) == [project_season(c) for c in contexts]
+
+    def test_empty(self):
+        assert project_season_batch([]) == []
+
+    def test_partial_profile_matches_scalar(self, monkeypatch):
+        import engine.projections as projections
+        complete = projections._age_profile_vector(25, "G", "Starter")
+        partial = (None,) + complete[1:5] + (None,) + complete[6:]
+        monkeypatch.setattr(
+            projections, "_age_profile_vector",
+            lambda age, pos, role: partial if role == "Starter" else None,
+        )
+        contexts = [
+            _make_context(),
+            _make_context(player_id="BENCH", role="Bench"),
+            _make_context(player_id="ZERO", baseline_stats={"points": 8.0}),
+        ]
+        assert project_season_batch(contexts) == [project_season(c) for c in contexts]
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_projection_has_no_instance_dict(self):
+        proj = project_season(_make_context())
+        assert not hasattr(proj, "__dict__")
+        assert pickle.loads(pickle.dumps(proj, protocol=pickle.HIGHEST_PROTOCOL)) == proj
@@ -11,5 +11,18 @@ def test_get_current_nba_season_start_year_november():
     assert get_current_nba_season_start_year(date(2026, 11, 1)) == 2026
 
 
+def test_get_current_nba_season_start_year_rollover():
+    assert get_current_nba_season_start_year(date(2026, 9, 30)) == 2025
+    assert get_current_nba_season_start_year(date(2026, 10, 1)) == 2026
+    assert type(get_current_nba_season_start_year(date(2026, 1, 1))) is int
+
+
 def test_format_nba_season():
     assert format_nba_season(2025) == "2025-26"
+
+
+def test_format_nba_season_century_and_out_of_range():
+    assert format_nba_season(1999) == "1999-00"
+    assert format_nba_season(2009) == "2009-10"
+    assert format_nba_season(1900) == "1900-01"
+    assert format_nba_season(2150) == "2150-51"
@@ -1,11 +1,14 @@
 """Tests for engine/validate.py — schema + cross-file consistency checks."""
 
 import json
-import os
 import pytest
 from pathlib import Path
 
-from engine.validate import validate_output_dir, validate_cross_file_consistency
+from engine.validate import (
+    FILE_TO_SCHEMA,
+    validate_output_dir,
+    validate_cross_file_consistency,
+)
 from engine.position_map import CD_POSITIONS
 
 
@@ -123,6 +126,51 @@ class TestSchemaValidation:
         _assert_schema_valid("insights.json", "insights_schema.json")
 
 
+@pytest.mark.skipif(not has_jsonschema, reason="Requires jsonschema package")
+class TestSchemaErrors:
+    """Invalid schemas and per-file error reporting."""
+
+    def test_invalid_schema_reported(self, tmp_path):
+        _write_minimal_output(tmp_path / "out")
+        schema_dir = tmp_path / "schemas"
+        for schema_file in FILE_TO_SCHEMA.values():
+            _write(schema_dir / schema_file, {"type": "array"})
+        _write(schema_dir / "risk_schema.json", {"type": 12})
+        valid, errors = validate_output_dir(str(tmp_path / "out"), str(schema_dir))
+        assert not valid
+        assert len(errors) == 1 and "risk_schema.json: invalid schema" in errors[0]
+
+    @pytest.mark.parametrize("backend", ["jsonschema", "jsonschema_rs"])
+    def test_every_error_reported_with_path(self, tmp_path, monkeypatch, backend):
+        import engine.validate as validate
+        if backend == "jsonschema":
+            monkeypatch.setattr(validate, "jsonschema_rs", None)
+        elif validate.jsonschema_rs is None:
+            pytest.skip("jsonschema-rs not installed")
+
+        schema = {"type": "array", "items": {"type": "object", "required": ["player_id"]}}
+        check = validate._compile_schema(jsonschema, schema)
+        errors = list(check([{"player_id": "p1"}, {}, {"name": "x"}]))
+        assert [list(path) for path, _ in errors] == [[1], [2]]
+        assert all("player_id" in message for _, message in errors)
+
+    def test_errors_capped_per_file(self, tmp_path):
+        schema_dir = tmp_path / "schemas"
+        for schema_file in FILE_TO_SCHEMA.values():
+            _write(schema_dir / schema_file, {"type": "array"})
+        _write(schema_dir / "players_schema.json", {"type": "array", "items": {"type": "string"}})
+        _write_minimal_output(tmp_path / "out")
+        _write(tmp_path / "out" / "players.json", [{}] * 5)
+
+        valid, errors = validate_output_dir(str(tmp_path / "out"), str(schema_dir), max_errors_per_file=2)
+        assert not valid
+        assert len(errors) == 3
+        assert errors[-1] == "players.json: further errors omitted after the first 2"
+
+        _, errors = validate_output_dir(str(tmp_path / "out"), str(schema_dir), max_errors_per_file=None)
+        assert len(errors) == 5
+
+
 class TestValidationWithBadData:
     """Test that validation catches problems with synthetic bad data."""
 
@@ -186,6 +234,63 @@ class TestValidationWithBadData:
         assert not valid
         assert any("out of range" in e for e in errors)
 
+    def test_empty_file_skips_content_checks(self, tmp_path):
+        _write_minimal_output(tmp_path, position="XYZ")
+        _write(tmp_path / "players.json", [])
+        valid, errors = validate_cross_file_consistency(str(tmp_path))
+        assert (valid, errors) == (False, ["players.json: expected non-empty array, got list len=0"])
+
+    def test_list_valued_fields_caught(self, tmp_path):
+        _write_minimal_output(tmp_path)
+        _write(tmp_path / "risk.json", [
+            {"player_id": "p1", "injury_risk": [1], "volatility": 40, "minutes_risk": 50},
+        ])
+        _write(tmp_path / "projections.json", [_make_proj("p1", "Test", 10.0, points=[1, 2])])
+        valid, errors = validate_cross_file_consistency(str(tmp_path))
+        assert not valid
+        assert "risk.json[0].injury_risk: expected int, got list" in errors
+        assert "projections.json[0].points: expected number, got list" in errors
+
+    def test_risk_fraction_checks(self, tmp_path):
+        _write_minimal_output(tmp_path)
+        base = {"player_id": "p1", "injury_risk": 30, "volatility": 40, "minutes_risk": 50}
+        _write(tmp_path / "risk.json", [{**base, "role_risk": 0.5, "total_risk": 1.5}])
+        assert validate_cross_file_consistency(str(tmp_path))[1] == [
+            "risk.json[0].total_risk: 1.5 out of range 0.0-1.0",
+        ]
+        _write(tmp_path / "risk.json", [{**base, "role_risk": "high", "total_risk": -0.5}])
+        assert validate_cross_file_consistency(str(tmp_path))[1] == [
+            "risk.json[0].role_risk: expected number, got str",
+            "risk.json[0].total_risk: -0.5 out of range 0.0-1.0",
+        ]
+        fractions = {"availability_risk": 0.5, "role_risk": [0.5], "composition_risk": 0.5, "total_risk": 0.5}
+        _write(tmp_path / "risk.json", [{**base, **fractions}])
+        assert validate_cross_file_consistency(str(tmp_path))[1] == [
+            "risk.json[0].role_risk: expected number, got list",
+        ]
+
+    def test_float_risk_value_caught(self, tmp_path):
+        _write_minimal_output(tmp_path)
+        risk = [{"player_id": "p1", "injury_risk": 30.0, "volatility": 40, "minutes_risk": 150}]
+        _write(tmp_path / "risk.json", risk)
+        valid, errors = validate_cross_file_consistency(str(tmp_path))
+        assert errors == [
+            "risk.json[0].injury_risk: expected int, got float",
+            "risk.json[0].minutes_risk: 150 out of range 0-100",
+        ]
+
+
+class TestLoadJson:
+    """orjson and stdlib json parse output files identically."""
+
+    def test_backends_agree(self, tmp_path, monkeypatch):
+        import engine.validate as validate
+        _write_minimal_output(tmp_path)
+        path = tmp_path / "projections.json"
+        loaded = validate._load_json(path)
+        monkeypatch.setattr(validate, "orjson", None)
+        assert validate._load_json(path) == loaded == _load(path)
+
 
 # --- Helpers ---
 